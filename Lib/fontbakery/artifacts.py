@@ -0,0 +1,109 @@
+"""
+Large payloads (SVG renderings, images, long tables) attached to check
+messages by reference.
+
+A check adds a blob to the run's `artifact_store` and puts the reference
+it gets back into its message instead of the blob itself. Blobs are named
+after the hash of their contents and written only once, so identical
+payloads (e.g. the same failure on every font of a family) take the space
+of one, and results only carry short references around.
+
+Reporters then replace the references with whatever suits their format:
+links to the files when the blobs were stored in a directory given by the
+user (the `artifacts_dir` configuration option, or `--artifacts-dir` on the
+command line), or the blobs themselves when they went to a temporary
+directory that won't outlive the run.
+"""
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+from functools import cached_property
+
+from fontbakery.utils import write_atomically
+
+REFERENCE = re.compile(r"\[\[artifact:(?P<name>[0-9a-f]{64}\.[a-z0-9]+)\]\]")
+IMAGE_EXTENSIONS = ("svg", "png", "jpg", "gif")
+
+
+class ArtifactStore:
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._names = set()
+        self._lock = threading.Lock()
+        self._cleaned_up = False
+
+    @property
+    def is_temporary(self):
+        return self.directory is None
+
+    @cached_property
+    def path(self):
+        if self._cleaned_up:
+            raise ValueError("The artifacts of this run have been cleaned up.")
+        if self.directory is None:
+            return tempfile.mkdtemp(prefix="fontbakery-artifacts-")
+        os.makedirs(self.directory, exist_ok=True)
+        return self.directory
+
+    def add(self, data, extension):
+        """Store a blob (bytes or str), and return the reference to put in a
+        message in its place."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        name = f"{hashlib.sha256(data).hexdigest()}.{extension}"
+        with self._lock:
+            if name not in self._names:
+                path = self.file(name)
+                if not os.path.exists(path):
+                    write_atomically(path, data)
+                self._names.add(name)
+        return f"[[artifact:{name}]]"
+
+    def file(self, name):
+        return os.path.join(self.path, name)
+
+    def read(self, name):
+        with open(self.file(name), "rb") as f:
+            return f.read()
+
+    def read_text(self, name):
+        return self.read(name).decode("utf-8")
+
+    def replace(self, text, render):
+        """Replace the references in a text by `render(name)`."""
+        if not text or "[[artifact:" not in text:
+            return text
+        return REFERENCE.sub(lambda match: render(match.group("name")), text)
+
+    def embed(self, text):
+        """Replace the references in a text by the blobs themselves."""
+        return self.replace(text, self.read_text)
+
+    def cleanup(self):
+        """Remove the temporary directory, if one was used. The store can't
+        be used any more afterwards."""
+        if not self.is_temporary:
+            return
+        self._cleaned_up = True
+        if "path" in self.__dict__:
+            shutil.rmtree(self.path, ignore_errors=True)
+            del self.__dict__["path"]
+            self._names.clear()
+
+
+def artifact_store_of(runner):
+    """The artifact store of a CheckRunner's run, if any check used one."""
+    context = getattr(runner, "context", None)
+    return getattr(context, "__dict__", {}).get("artifact_store")
+
+
+def references(text):
+    """The names of the artifacts referenced in a text."""
+    return [match.group("name") for match in REFERENCE.finditer(text or "")]
+
+
+def is_image(name):
+    return name.rsplit(".", 1)[-1] in IMAGE_EXTENSIONS
@@ -13,7 +13,7 @@ Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 """
 import inspect
 
-from functools import update_wrapper, cached_property
+from functools import update_wrapper, cached_property, wraps
 from typing import Callable
 
 
@@ -142,6 +142,7 @@ class FontBakeryCheck(FontbakeryCallable):
         experimental=False,  # Experimental checks won't affect the process exit code
         severity=None,  # numeric value from 1=min to 10=max, denoting check severity
         configs=None,  # items from config[self.id] to inject into the check's namespace
+        cache_key=None,  # names of the arguments the check's outcome depends on
         misc_metadata=None,  # Miscelaneous free-form metadata fields
         # Some of them may be promoted to 1st-class metadata fields
         # if they start being used by the check-runner.
@@ -188,6 +189,13 @@ class FontBakeryCheck(FontbakeryCallable):
         ``example.com/mytest``, setting ``configs = [ "hello" ]`` will create
         a variable called ``hello` and fill it with the value of
         ``config["example.com/mytest"]["hello"]``.
+
+        cache_key: a list of argument or condition names. Checks which take
+        e.g. a ``font`` argument but whose outcome only depends on some of
+        its properties (such as the family name) can list those here. The
+        check is then run only once for every distinct combination of their
+        values, and that result is reported for each of the fonts. An empty
+        list means that the outcome is the same for the whole run.
         """
         super().__init__(checkfunc)
         self.id = id
@@ -197,6 +205,7 @@ class FontBakeryCheck(FontbakeryCallable):
             checkfunc, description, documentation
         )
         self.configs = configs
+        self.cache_key = None if cache_key is None else tuple(cache_key)
         self.proposal = proposal
         self.experimental = experimental
         self.severity = severity
@@ -208,19 +217,71 @@ class FontBakeryCheck(FontbakeryCallable):
     #  return self.id
 
 
-def condition(cls):
+# Named scopes of conditions, and the property which identifies each of them.
+CONDITION_SCOPES = {
+    # Everything read from the files next to the font (METADATA.pb,
+    # DESCRIPTION.en_us.html, license files, etc.)
+    "directory": "family_directory",
+}
+
+
+def condition(cls, heavy=False, cache_key=None, scope=None):
+    """Register the decorated function as a cached property of `cls`.
+
+    heavy: the computed value holds a lot of memory (parsed fonts, outlines,
+    etc.) and can be dropped by the CheckRunner once every check that runs
+    on the object has finished. It is transparently recomputed if anything
+    asks for it again afterwards.
+
+    cache_key: the name of another property of `cls` which fully determines
+    the value of this one (e.g. the path of the file it is read from). The
+    value is then computed once per run for each distinct key, and shared
+    between all the objects which have the same key.
+
+    scope: the name of one of the CONDITION_SCOPES, as a shorthand for
+    its cache_key. For instance, scope="directory" computes the value once
+    for all the fonts in the same directory.
+    """
     if not inspect.isclass(cls):
         raise TypeError(f"Condition {cls.__name__} must be added to a class")
+    if scope is not None:
+        if cache_key is not None:
+            raise TypeError("A condition takes either a cache_key or a scope")
+        if scope not in CONDITION_SCOPES:
+            raise ValueError(
+                f"Unknown condition scope '{scope}',"
+                f" expected one of: {', '.join(CONDITION_SCOPES)}"
+            )
+        cache_key = CONDITION_SCOPES[scope]
 
     def decorator(*args, **kwds):
         func = args[0]
+        if cache_key is not None:
+            func = _shared_condition(func, cache_key)
         prop = cached_property(func)
         prop.__set_name__(cls, func.__name__)
         setattr(cls, func.__name__, prop)
+        if heavy:
+            if "heavy_properties" not in cls.__dict__:
+                cls.heavy_properties = set(getattr(cls, "heavy_properties", ()))
+            cls.heavy_properties.add(func.__name__)
 
     return decorator
 
 
+def _shared_condition(func, cache_key):
+    @wraps(func)
+    def shared(self):
+        shared_results = getattr(getattr(self, "context", None), "shared_results", None)
+        key_value = getattr(self, cache_key)
+        if shared_results is None or key_value is None:
+            return func(self)
+        key = ("condition", func.__name__, key_value)
+        return shared_results.get(key, lambda: func(self))
+
+    return shared
+
+
 def check(*args, **kwds):
     """Check wrapper, a factory for FontBakeryCheck
 
@@ -0,0 +1,534 @@
+"""
+Streaming analysis of CFF and CFF2 charstrings.
+
+The charstring bytecode is read straight from the table data, without
+building fontTools CharString objects. Every subroutine is parsed once,
+and the facts we are interested in (nesting depth, deprecated operators)
+are summarized once per subroutine and then shared by all of its callers.
+"""
+import struct
+from collections import deque
+
+from fontTools.cffLib import (
+    cffExpertSubsetStrings,
+    cffIExpertStrings,
+    cffISOAdobeStrings,
+    cffStandardStrings,
+)
+from fontTools.ttLib.sfnt import SFNTReader
+
+# Per "The Type 2 Charstring Format, Technical Note #5177",
+# the "Subr nesting, stack limit" is 10.
+MAX_CALL_DEPTH = 10
+
+# Top DICT / Font DICT / Private DICT operators
+CHARSET = 15
+CHARSTRINGS = 17
+PRIVATE = 18
+SUBRS = 19
+VSINDEX = 22
+VSTORE = 24
+ROS = (12, 30)
+FDARRAY = (12, 36)
+FDSELECT = (12, 37)
+TOP_DICT_STRINGS = [
+    ("Notice", 1),
+    ("Copyright", (12, 0)),
+    ("FontName", (12, 38)),
+    ("FullName", 2),
+    ("FamilyName", 3),
+]
+
+# Charstring operators
+STEM_OPERATORS = {1, 3, 18, 23}  # hstem, vstem, hstemhm, vstemhm
+CALLSUBR = 10
+CALLGSUBR = 29
+RETURN = 11
+ENDCHAR = 14
+CS_VSINDEX = 15
+BLEND = 16
+HINTMASK_OPERATORS = {19, 20}  # hintmask, cntrmask
+DOTSECTION = (12, 0)
+
+
+class CFFAnalysis:
+    def __init__(self):
+        self.glyphs_dotsection = []
+        self.glyphs_endchar_seac = []
+        self.glyphs_exceed_max = []
+        self.glyphs_recursion_errors = []
+        self.string_not_ascii = []
+        self.malformed = None  # Why the charstrings could not be analyzed
+
+
+class MalformedCFF(Exception):
+    pass
+
+
+def subr_bias(count):
+    if count < 1240:
+        return 107
+    elif count < 33900:
+        return 1131
+    else:
+        return 32768
+
+
+def read_index(data, offset, count_size=2):
+    """Returns the (start, end) spans of the items of the INDEX at `offset`,
+    and the offset right after the INDEX."""
+    count = int.from_bytes(data[offset : offset + count_size], "big")
+    offset += count_size
+    if count == 0:
+        return [], offset
+    off_size = data[offset]
+    offset += 1
+    offsets = [
+        int.from_bytes(data[pos : pos + off_size], "big")
+        for pos in range(offset, offset + (count + 1) * off_size, off_size)
+    ]
+    base = offset + (count + 1) * off_size - 1
+    spans = [(base + offsets[i], base + offsets[i + 1]) for i in range(count)]
+    return spans, base + offsets[-1]
+
+
+def parse_dict(data, start, end):
+    """A DICT as a mapping of operators to their list of operands.
+    Real numbers are not decoded, as we never need them."""
+    result = {}
+    operands = []
+    i = start
+    while i < end:
+        b0 = data[i]
+        if b0 <= 27:
+            if b0 == 12:
+                operator = (12, data[i + 1])
+                i += 2
+            else:
+                operator = b0
+                i += 1
+            result[operator] = operands
+            operands = []
+        elif b0 == 28:
+            operands.append(struct.unpack_from(">h", data, i + 1)[0])
+            i += 3
+        elif b0 == 29:
+            operands.append(struct.unpack_from(">l", data, i + 1)[0])
+            i += 5
+        elif b0 == 30:
+            i += 1
+            while i < end and (data[i] & 0x0F) != 0x0F and (data[i] >> 4) != 0x0F:
+                i += 1
+            i += 1
+            operands.append(0.0)
+        elif 32 <= b0 <= 246:
+            operands.append(b0 - 139)
+            i += 1
+        elif 247 <= b0 <= 250:
+            operands.append((b0 - 247) * 256 + data[i + 1] + 108)
+            i += 2
+        elif 251 <= b0 <= 254:
+            operands.append(-(b0 - 251) * 256 - data[i + 1] - 108)
+            i += 2
+        else:
+            i += 1  # reserved
+    return result
+
+
+def parse_charset(data, offset, num_glyphs, strings, is_cid):
+    """Glyph names, following the same conventions as fontTools."""
+
+    def name(sid_or_cid):
+        if is_cid:
+            return "cid" + str(sid_or_cid).zfill(5)
+        return strings(sid_or_cid)
+
+    if offset <= 2:
+        charset = [cffISOAdobeStrings, cffIExpertStrings, cffExpertSubsetStrings]
+        return list(charset[offset][:num_glyphs])
+
+    charset = [".notdef"]
+    fmt = data[offset]
+    pos = offset + 1
+    if fmt == 0:
+        for _ in range(num_glyphs - 1):
+            charset.append(name(struct.unpack_from(">H", data, pos)[0]))
+            pos += 2
+    else:
+        n_left_format = ">B" if fmt == 1 else ">H"
+        n_left_size = 1 if fmt == 1 else 2
+        while len(charset) < num_glyphs:
+            first = struct.unpack_from(">H", data, pos)[0]
+            n_left = struct.unpack_from(n_left_format, data, pos + 2)[0]
+            pos += 2 + n_left_size
+            charset.extend(name(n) for n in range(first, first + n_left + 1))
+
+    # make sure glyph names are unique
+    all_names = {}
+    unique = []
+    for glyph_name in charset:
+        if glyph_name in all_names:
+            n = all_names[glyph_name]
+            names = set(all_names) | set(charset)
+            while f"{glyph_name}.{n}" in names:
+                n += 1
+            all_names[glyph_name] = n + 1
+            glyph_name = f"{glyph_name}.{n}"
+        all_names[glyph_name] = 1
+        unique.append(glyph_name)
+    return unique[:num_glyphs]
+
+
+def parse_fdselect(data, offset, num_glyphs):
+    """The index of the Font DICT used by each glyph."""
+    fmt = data[offset]
+    if fmt == 0:
+        return list(data[offset + 1 : offset + 1 + num_glyphs])
+    if fmt == 3:
+        range_format, range_size, pos = ">HB", 3, offset + 3
+        n_ranges = struct.unpack_from(">H", data, offset + 1)[0]
+    elif fmt == 4:
+        range_format, range_size, pos = ">LH", 6, offset + 5
+        n_ranges = struct.unpack_from(">L", data, offset + 1)[0]
+    else:
+        raise MalformedCFF(f"Unknown FDSelect format {fmt}")
+    fds = []
+    ranges = [
+        struct.unpack_from(range_format, data, pos + i * range_size)
+        for i in range(n_ranges)
+    ]
+    sentinel = struct.unpack_from(range_format[:2], data, pos + n_ranges * range_size)
+    bounds = [first for first, _ in ranges[1:]] + [sentinel[0]]
+    for (first, fd), end in zip(ranges, bounds):
+        fds.extend([fd] * (end - first))
+    return fds[:num_glyphs]
+
+
+def parse_region_counts(data, offset):
+    """The number of regions of each ItemVariationData of a CFF2 VariationStore."""
+    ivs = offset + 2  # skip the length field
+    ivd_count = struct.unpack_from(">H", data, ivs + 6)[0]
+    counts = []
+    for i in range(ivd_count):
+        ivd = ivs + struct.unpack_from(">L", data, ivs + 8 + i * 4)[0]
+        counts.append(struct.unpack_from(">H", data, ivd + 4)[0])
+    return counts
+
+
+class _Recursion(Exception):
+    pass
+
+
+class _Program:
+    """What we learned from parsing one subroutine."""
+
+    __slots__ = ("calls", "seac", "dotsection", "mask_bytes")
+
+    def __init__(self, calls, seac, dotsection, mask_bytes):
+        self.calls = calls
+        self.seac = seac
+        self.dotsection = dotsection
+        self.mask_bytes = mask_bytes
+
+
+class _State:
+    """The part of the charstring interpreter state that affects parsing."""
+
+    __slots__ = ("stack", "hints", "mask_bytes", "num_regions")
+
+    def __init__(self, num_regions):
+        self.stack = []
+        self.hints = 0
+        self.mask_bytes = 0
+        self.num_regions = num_regions
+
+
+INFINITY = float("inf")
+
+
+class CharstringAnalyzer:
+    """Walks the charstrings of one Top DICT.
+
+    The only interpreter state which affects how bytecode is parsed is the
+    number of stem hints, which determines the length of hintmask operands.
+    As fontTools does, each subroutine is parsed the first time it is
+    called, and that parse is kept for all subsequent calls. Subroutines
+    are only executed again while a glyph has not yet seen its first
+    hintmask, since until then they may still declare stems.
+    """
+
+    def __init__(self, data, global_subrs, cff2=False, region_counts=None):
+        self.data = data
+        self.cff2 = cff2
+        self.region_counts = region_counts or []
+        self.global_subrs = global_subrs
+        self.global_bias = subr_bias(len(global_subrs))
+        self.programs = {}
+        self.summaries = {}
+
+    def analyze_glyph(self, start, end, fd_index, local_subrs, vsindex=0):
+        """Returns (max_depth, seac_depth, dotsection_depth), the call depths
+        at which the deprecated operators were first seen (or infinity)."""
+        num_regions = (
+            self.region_counts[vsindex] if vsindex < len(self.region_counts) else 0
+        )
+        state = _State(num_regions)
+        context = (fd_index, local_subrs, subr_bias(len(local_subrs)))
+        calls, seac, dotsection, _ = self._parse(start, end, None, state, context, ())
+        depth, seac_depth, dot_depth = 0, INFINITY, INFINITY
+        if seac:
+            seac_depth = 0
+        if dotsection:
+            dot_depth = 0
+        visiting = set()
+        for callee in calls:
+            d, s, t = self._summarize(callee, visiting)
+            depth = max(depth, d + 1)
+            seac_depth = min(seac_depth, s + 1)
+            dot_depth = min(dot_depth, t + 1)
+        return depth, seac_depth, dot_depth
+
+    def _summarize(self, key, visiting):
+        """(max depth, seac depth, dotsection depth) below a subroutine."""
+        if key in self.summaries:
+            return self.summaries[key]
+        if key in visiting:
+            raise _Recursion()
+        visiting.add(key)
+        program = self.programs[key]
+        depth = 0
+        seac_depth = 0 if program.seac else INFINITY
+        dot_depth = 0 if program.dotsection else INFINITY
+        for callee in program.calls:
+            d, s, t = self._summarize(callee, visiting)
+            depth = max(depth, d + 1)
+            seac_depth = min(seac_depth, s + 1)
+            dot_depth = min(dot_depth, t + 1)
+        visiting.discard(key)
+        self.summaries[key] = (depth, seac_depth, dot_depth)
+        return self.summaries[key]
+
+    def _call(self, key, start, end, state, context, chain):
+        program = self.programs.get(key)
+        if program is not None and state.mask_bytes:
+            # Nothing left to learn by running it again. Whatever it
+            # leaves on the stack no longer matters for parsing.
+            state.stack.clear()
+            return
+        if key in chain:
+            raise _Recursion()
+        parsed = self._parse(start, end, program, state, context, chain + (key,))
+        if program is None:
+            self.programs[key] = _Program(*parsed)
+
+    def _parse(self, start, end, program, state, context, chain):
+        data = self.data
+        stack = state.stack
+        calls = []
+        last_tokens = deque(maxlen=5)
+        dotsection = False
+        mask_bytes = None
+        i = start
+        while i < end:
+            b0 = data[i]
+            if b0 >= 32 or b0 == 28:
+                if b0 == 28:
+                    value = struct.unpack_from(">h", data, i + 1)[0]
+                    i += 3
+                elif b0 <= 246:
+                    value = b0 - 139
+                    i += 1
+                elif b0 <= 250:
+                    value = (b0 - 247) * 256 + data[i + 1] + 108
+                    i += 2
+                elif b0 <= 254:
+                    value = -(b0 - 251) * 256 - data[i + 1] - 108
+                    i += 2
+                else:
+                    value = struct.unpack_from(">l", data, i + 1)[0] / 65536
+                    i += 5
+                stack.append(value)
+                last_tokens.append(isinstance(value, int))
+                continue
+
+            if b0 == 12:
+                operator = (12, data[i + 1])
+                i += 2
+            else:
+                operator = b0
+                i += 1
+            last_tokens.append(operator)
+
+            if operator in STEM_OPERATORS:
+                state.hints += len(stack) // 2
+                stack.clear()
+            elif operator in HINTMASK_OPERATORS:
+                if not state.mask_bytes:
+                    state.hints += len(stack) // 2
+                    stack.clear()
+                    state.mask_bytes = (state.hints + 7) // 8
+                if program is not None:
+                    i += program.mask_bytes
+                else:
+                    mask_bytes = state.mask_bytes
+                    i += mask_bytes
+                last_tokens.append(None)
+            elif operator in (CALLSUBR, CALLGSUBR):
+                if not stack:
+                    continue
+                if operator == CALLSUBR:
+                    fd_index, subrs, bias = context
+                    key = (fd_index, int(stack.pop()) + bias)
+                else:
+                    subrs, bias = self.global_subrs, self.global_bias
+                    key = (None, int(stack.pop()) + bias)
+                if not 0 <= key[1] < len(subrs):
+                    continue
+                calls.append(key)
+                sub_start, sub_end = subrs[key[1]]
+                self._call(key, sub_start, sub_end, state, context, chain)
+            elif operator in (RETURN, ENDCHAR, DOTSECTION):
+                if operator == DOTSECTION:
+                    dotsection = True
+            elif self.cff2 and operator == CS_VSINDEX and stack:
+                vsindex = int(stack.pop())
+                if vsindex < len(self.region_counts):
+                    state.num_regions = self.region_counts[vsindex]
+            elif self.cff2 and operator == BLEND and stack:
+                num_blends = int(stack.pop())
+                drop = num_blends * state.num_regions
+                if drop:
+                    del stack[-drop:]
+            else:
+                stack.clear()
+
+        seac = (
+            len(last_tokens) == 5
+            and last_tokens[-1] == ENDCHAR
+            and all(token is True for token in list(last_tokens)[:4])
+        )
+        return calls, seac, dotsection, mask_bytes
+
+
+def analyze_cff(font_file, glyph_order=None, font_number=-1):
+    """Analyze the CFF or CFF2 table of a font file.
+
+    glyph_order is only needed for CFF2 tables, which do not name their glyphs.
+    """
+    with open(font_file, "rb") as f:
+        reader = SFNTReader(f, fontNumber=font_number)
+        if "CFF " in reader:
+            data = reader["CFF "]
+            cff2 = False
+        elif "CFF2" in reader:
+            data = reader["CFF2"]
+            cff2 = True
+        else:
+            return CFFAnalysis()
+    return analyze_cff_table(data, cff2, glyph_order)
+
+
+def analyze_cff_table(data, cff2, glyph_order=None):
+    """Analyze the raw data of a CFF (or, with cff2=True, CFF2) table."""
+    analysis = CFFAnalysis()
+    if cff2:
+        header_size = data[2]
+        top_dict_size = struct.unpack_from(">H", data, 3)[0]
+        top_dicts = [(header_size, header_size + top_dict_size)]
+        global_subrs, _ = read_index(data, header_size + top_dict_size, 4)
+        strings = None
+    else:
+        header_size = data[2]
+        font_names, offset = read_index(data, header_size)
+        try:
+            for start, end in font_names:
+                data[start:end].decode("ascii")
+        except UnicodeDecodeError:
+            analysis.string_not_ascii = None
+            return analysis
+        top_dicts, offset = read_index(data, offset)
+        string_spans, offset = read_index(data, offset)
+        global_subrs, _ = read_index(data, offset)
+
+        def strings(sid):
+            if sid < len(cffStandardStrings):
+                return cffStandardStrings[sid]
+            start, end = string_spans[sid - len(cffStandardStrings)]
+            return data[start:end].decode("latin1")
+
+    count_size = 4 if cff2 else 2
+    for top_start, top_end in top_dicts:
+        top_dict = parse_dict(data, top_start, top_end)
+
+        if not cff2:
+            for key, operator in TOP_DICT_STRINGS:
+                if operator in top_dict:
+                    string = strings(top_dict[operator][0])
+                    if any(ord(char) > 0x7F for char in string):
+                        analysis.string_not_ascii.append((key, string))
+
+        charstrings, _ = read_index(data, top_dict[CHARSTRINGS][0], count_size)
+        num_glyphs = len(charstrings)
+        if cff2:
+            glyph_names = glyph_order
+        else:
+            glyph_names = parse_charset(
+                data,
+                top_dict.get(CHARSET, [0])[0],
+                num_glyphs,
+                strings,
+                ROS in top_dict,
+            )
+        region_counts = []
+        if VSTORE in top_dict:
+            region_counts = parse_region_counts(data, top_dict[VSTORE][0])
+
+        # (local subrs, vsindex) of each Font DICT
+        font_dicts = []
+        if FDARRAY in top_dict:
+            fd_spans, _ = read_index(data, top_dict[FDARRAY][0], count_size)
+            for fd_start, fd_end in fd_spans:
+                font_dicts.append(parse_dict(data, fd_start, fd_end))
+        else:
+            font_dicts.append(top_dict)
+        privates = []
+        for font_dict in font_dicts:
+            subrs, vsindex = [], 0
+            if PRIVATE in font_dict:
+                size, private_offset = font_dict[PRIVATE][:2]
+                private = parse_dict(data, private_offset, private_offset + size)
+                if SUBRS in private:
+                    subrs, _ = read_index(
+                        data, private_offset + private[SUBRS][0], count_size
+                    )
+                vsindex = private.get(VSINDEX, [0])[0]
+            privates.append((subrs, vsindex))
+
+        fd_select = None
+        if FDSELECT in top_dict:
+            try:
+                fd_select = parse_fdselect(data, top_dict[FDSELECT][0], num_glyphs)
+            except MalformedCFF as err:
+                analysis.malformed = str(err)
+                return analysis
+
+        analyzer = CharstringAnalyzer(data, global_subrs, cff2, region_counts)
+        for fd_index, (subrs, vsindex) in enumerate(privates):
+            for gid, (start, end) in enumerate(charstrings):
+                if fd_select is not None and fd_select[gid] != fd_index:
+                    continue
+                glyph_name = glyph_names[gid]
+                try:
+                    depth, seac_depth, dot_depth = analyzer.analyze_glyph(
+                        start, end, fd_index, subrs, vsindex
+                    )
+                except (_Recursion, RecursionError):
+                    analysis.glyphs_recursion_errors.append(glyph_name)
+                    continue
+                if depth > MAX_CALL_DEPTH:
+                    analysis.glyphs_exceed_max.append(glyph_name)
+                if seac_depth <= MAX_CALL_DEPTH:
+                    analysis.glyphs_endchar_seac.append(glyph_name)
+                if dot_depth <= MAX_CALL_DEPTH:
+                    analysis.glyphs_dotsection.append(glyph_name)
+    return analysis
@@ -12,13 +12,22 @@ Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 
 """
 
-from collections import OrderedDict
+from collections import Counter, OrderedDict, defaultdict
 import concurrent.futures
+import copy
+from dataclasses import dataclass
+from functools import cached_property
 import inspect
+import multiprocessing
+import pickle
+import queue
 import threading
+import time
 from typing import Union, Tuple
 
+from fontbakery.callable import FontBakeryCheck
 from fontbakery.configuration import Configuration
+from fontbakery.profile import Section
 from fontbakery.result import (
     CheckResult,
     Subresult,
@@ -34,6 +43,31 @@ from fontbakery.status import (
     SKIP,
 )
 from fontbakery.legacy_checkids import renaming_map as old_to_new
+from fontbakery.testable import ReleasableMixin
+
+
+# How many check results may be waiting for the reporters (and how many
+# checks may be submitted ahead of the ones running) per worker thread.
+RESULTS_PER_WORKER = 4
+# The most check results handed over to the reporters at once.
+REPORTER_BATCH_SIZE = 64
+
+# The legacy check-IDs of each check, by its current check-ID.
+NEW_TO_OLD = {}
+for _old_id, _new_id in old_to_new.items():
+    NEW_TO_OLD.setdefault(_new_id, []).append(_old_id)
+
+
+@dataclass
+class PlannedCheck:
+    """The scheduling decision the CheckRunner made for one check: the
+    identities it expands to, and a short note of what it will run on
+    (e.g. "collection" or "font"), or of why it won't run at all."""
+
+    section: Section
+    check: FontBakeryCheck
+    identities: Tuple[Identity, ...]
+    scope: str
 
 
 class CheckRunner:
@@ -53,28 +87,43 @@ class CheckRunner:
         self.config.update(config)
         self._explicit_checks = config.get("explicit_checks")
         self._exclude_checks = config.get("exclude_checks")
-        self._iterargs = OrderedDict()
         self._jobs = jobs
+        self.profile = profile
+        self.catch_errors = True
+        # Drop the heavy cached state of each testable (parsed fonts,
+        # outlines, ...) as soon as all of its checks have finished.
+        self.release_resources = True
+        self.new_to_old = NEW_TO_OLD
+        self._bind(context)
+
+    def _bind(self, context):
+        """Set up the state of a run on the files of a context."""
         # self._iterargs is the *count of each type of thing*.
-        for singular, plural in profile.iterargs.items():
+        self._iterargs = OrderedDict()
+        for singular in self.profile.iterargs:
             # self._iterargs["fonts"] = len(values.fonts)
             self._iterargs[singular] = len(context.testables_by_type.get(singular, []))
 
-        self.profile = profile
         self.context = context
         self.context.config = self.config  # Move later
-        self.catch_errors = True
-
         for testable in self.context.testables:
             testable.context = self.context
 
+        # How long each identity of each check took to run, by check id.
+        self.timings = defaultdict(list)
         self.legacy_checkid_references = set()
-        self.new_to_old = {}
-        for old_id, new_id in old_to_new.items():
-            try:
-                self.new_to_old[new_id].append(old_id)
-            except KeyError:
-                self.new_to_old[new_id] = [old_id]
+
+    def with_context(self, context):
+        """A runner with the same profile and configuration as this one, for
+        the files of another context. This is cheaper than setting up a new
+        CheckRunner, for callers which run the same checks over and over
+        (e.g. the code-tests)."""
+        runner = copy.copy(self)
+        for name in ("_context_attributes", "_testable_attributes", "plan", "order"):
+            runner.__dict__.pop(name, None)
+        runner.config = Configuration(**self.config)
+        runner._bind(context)
+        return runner
 
     @staticmethod
     def _check_result(result) -> Subresult:
@@ -121,7 +170,7 @@ class CheckRunner:
 
     def _get(self, name, iterargs, condition=False):
         # Is this a property of the whole collection?
-        if name in dir(self.context):
+        if name in self._context_attributes:
             return getattr(self.context, name)
         # Is it a property of the file we're testing?
         for thing, index in iterargs:
@@ -129,7 +178,7 @@ class CheckRunner:
             # Allow "font" to return the Font object itself
             if name == thing:
                 return specific_thing
-            if name not in dir(specific_thing):
+            if name not in self._testable_attributes[(thing, index)]:
                 continue
             return getattr(specific_thing, name)
         if condition:
@@ -215,120 +264,440 @@ class CheckRunner:
             }
             check.inject_globals(new_globals)
 
+        if check.cache_key is None:
+            subresults = self._call_check(check, args)
+        else:
+            # The outcome only depends on the values of the cache key, so
+            # every identity with the same key gets its own copy of the
+            # subresults of the first one to run.
+            key = ("check", check.id) + tuple(
+                self._get(name, identity.iterargs) for name in check.cache_key
+            )
+            subresults = [
+                self._copy_subresult(subresult)
+                for subresult in self.context.shared_results.get(
+                    key, lambda: self._call_check(check, args)
+                )
+            ]
+
+        result.extend(
+            [
+                self._override_status(self._check_result(result), check)
+                for result in subresults
+            ]
+        )
+        return result
+
+    def _call_check(self, check, args):
         try:
             subresults = check(**args)  # Might raise.
             if inspect.isgenerator(subresults) or inspect.isgeneratorfunction(
                 subresults
             ):
-                subresults = list(subresults)
-            else:
-                subresults = [subresults]
+                return list(subresults)
+            return [subresults]
         except Exception as error:
             if not self.catch_errors:
                 raise
-            subresults = [(ERROR, Message("failed-check", format_error(error)))]
+            return [(ERROR, Message("failed-check", format_error(error)))]
 
-        result.extend(
-            [
-                self._override_status(self._check_result(result), check)
-                for result in subresults
-            ]
-        )
-        return result
+    @staticmethod
+    def _copy_subresult(subresult):
+        # Status overrides modify the message in place, so each identity
+        # needs a message of its own.
+        if (
+            isinstance(subresult, tuple)
+            and len(subresult) == 2
+            and isinstance(subresult[1], Message)
+        ):
+            status, message = subresult
+            return status, copy.copy(message)
+        return subresult
 
-    @property
-    def order(self) -> Tuple[Identity, ...]:
-        _order = []
+    def _is_selected(self, check):
+        """Whether the user's explicit/excluded check lists let this check
+        run, keeping track of any legacy check-IDs they referenced."""
+        if self._explicit_checks:
+            selected_via_new_checkid = any(
+                explicit in check.id for explicit in self._explicit_checks
+            )
+            selected_via_legacy_checkid = False
+            if not selected_via_new_checkid:
+                for legacy in self.new_to_old.get(check.id, ()):
+                    if any(explicit in legacy for explicit in self._explicit_checks):
+                        selected_via_legacy_checkid = True
+                        self.legacy_checkid_references.add(legacy)
+
+            if not selected_via_legacy_checkid and not selected_via_new_checkid:
+                return False
+
+        if self._exclude_checks:
+            if any(excluded in check.id for excluded in self._exclude_checks):
+                return False
+
+            for legacy in self.new_to_old.get(check.id, ()):
+                if any(excluded in legacy for excluded in self._exclude_checks):
+                    self.legacy_checkid_references.add(legacy)
+        return True
+
+    @cached_property
+    def _context_attributes(self):
+        return frozenset(dir(self.context))
+
+    @cached_property
+    def _testable_attributes(self):
+        """The names each testable provides, keyed by its iterarg."""
+        return {
+            (singular, index): frozenset(dir(testable))
+            for singular, testables in self.context.testables_by_type.items()
+            for index, testable in enumerate(testables)
+        }
+
+    @cached_property
+    def plan(self) -> Tuple[PlannedCheck, ...]:
+        """How each check of the profile is going to be run (or why it
+        won't be), worked out once per runner."""
+        plan = []
         for section in self.profile.sections:
             for check in section.checks:
-                if self._explicit_checks:
-                    selected_via_new_checkid = any(
-                        explicit in check.id for explicit in self._explicit_checks
-                    )
-                    selected_via_legacy_checkid = False
-                    if (
-                        not selected_via_new_checkid
-                        and check.id in self.new_to_old.keys()
-                    ):
-                        for legacy in self.new_to_old[check.id]:
-                            if any(
-                                explicit in legacy for explicit in self._explicit_checks
-                            ):
-                                selected_via_legacy_checkid = True
-                                self.legacy_checkid_references.add(legacy)
-
-                    if not selected_via_legacy_checkid and not selected_via_new_checkid:
-                        continue
-
-                if self._exclude_checks:
-                    if any(excluded in check.id for excluded in self._exclude_checks):
-                        continue
-
-                    if check.id in self.new_to_old:
-                        for legacy in self.new_to_old[check.id]:
-                            if any(
-                                excluded in legacy for excluded in self._exclude_checks
-                            ):
-                                self.legacy_checkid_references.add(legacy)
-                                continue
-
+                if not self._is_selected(check):
+                    plan.append(PlannedCheck(section, check, (), "not selected"))
+                    continue
                 args = set(check.args)
-                context_args = set(arg for arg in args if arg in dir(self.context))
+                context_args = args & self._context_attributes
 
                 # Either this is a check which runs on the whole collection
                 # (i.e. all of its arguments can be called as methods on the
                 # CheckRunContext):
                 if context_args == args:
                     # In which case, we run it once
-                    _order.append(Identity(section, check, ()))
+                    plan.append(
+                        PlannedCheck(
+                            section,
+                            check,
+                            (Identity(section, check, ()),),
+                            "collection",
+                        )
+                    )
                     continue
                 # Or it's a check which runs on each item in the collection.
+                identities = []
+                scopes = []
+                individual_args = args - context_args
                 for singular, files in self.context.testables_by_type.items():
-                    individual_args = args - context_args
-                    if (
-                        all(
-                            arg in dir(file)
-                            for arg in individual_args
-                            for file in files
-                        )
-                        or singular in args
+                    if singular in args or all(
+                        individual_args <= self._testable_attributes[(singular, i)]
+                        for i in range(len(files))
                     ):
                         # In which case, we run it once for each item
-                        for i, file in enumerate(files):
-                            _order.append(Identity(section, check, ((singular, i),)))
-        return tuple(_order)
+                        if files:
+                            scopes.append(singular)
+                        identities.extend(
+                            Identity(section, check, ((singular, i),))
+                            for i in range(len(files))
+                        )
+                plan.append(
+                    PlannedCheck(
+                        section,
+                        check,
+                        tuple(identities),
+                        ", ".join(scopes) if scopes else "nothing to check",
+                    )
+                )
+        return tuple(plan)
+
+    @cached_property
+    def order(self) -> Tuple[Identity, ...]:
+        return tuple(
+            identity for planned in self.plan for identity in planned.identities
+        )
+
+    def _check_timeout(self, check):
+        """The time budget of a single identity of a check, if it has one."""
+        timeouts = self.config.get("timeouts") or {}
+        return timeouts.get(check.id, self.config.get("check_timeout"))
+
+    def _timed_out(self, identity, code, message):
+        result = CheckResult(identity=identity)
+        result.append(
+            self._override_status(
+                Subresult(ERROR, Message(code, message)), identity.check
+            )
+        )
+        return result
+
+    def _run_check_within_budget(self, identity, deadline):
+        """Run a check, making sure that it respects its own time budget
+        and what is left of the budget of the whole run.
+
+        Checks without a budget of their own run as usual, and the run's
+        budget only stops them from being started. Checks with a budget run
+        in a forked worker process, which is killed if they haven't finished
+        when the budget runs out (see _run_check_in_worker)."""
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            return self._timed_out(
+                identity,
+                "run-timeout",
+                "This check was not run because the time budget"
+                " of the whole run had been used up.",
+            )
+        timeout = self._check_timeout(identity.check)
+        if timeout is None:
+            return self._run_check(identity)
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        return self._run_check_in_worker(identity, timeout)
+
+    def _run_check_in_worker(self, identity, timeout):
+        """Run a check in a forked worker process, which has a copy of
+        everything loaded so far, and kill it if it does not finish in time.
+
+        Whatever the check computes in the worker (conditions, shared
+        results) is lost with it; only its results come back. A worker
+        forked while another job's thread held a lock it needs waits for
+        it until it is killed, like any other check over its budget.
+        Where processes can't be forked, the check runs on a thread instead
+        (see _run_check_on_thread)."""
+        try:
+            mp_context = multiprocessing.get_context("fork")
+        except ValueError:
+            return self._run_check_on_thread(identity, timeout)
+
+        receiver, sender = mp_context.Pipe(duplex=False)
+        worker = mp_context.Process(
+            target=self._isolated_worker, args=(identity, sender), daemon=True
+        )
+        worker.start()
+        sender.close()
+        try:
+            if not receiver.poll(timeout):
+                worker.kill()
+                return self._timed_out(
+                    identity,
+                    "timeout",
+                    f"This check was stopped after running for {timeout:g}"
+                    f" seconds, the most it was allowed to take.",
+                )
+            subresults, legacy_checkid_references = receiver.recv()
+        except EOFError:
+            subresults = [
+                Subresult(
+                    ERROR,
+                    Message(
+                        "worker-crashed", "The worker process running this check died."
+                    ),
+                )
+            ]
+            legacy_checkid_references = set()
+        finally:
+            worker.join()
+            receiver.close()
+
+        self.legacy_checkid_references |= legacy_checkid_references
+        result = CheckResult(identity=identity)
+        result.extend(subresults)
+        return result
+
+    def _run_check_on_thread(self, identity, timeout):
+        """Run a check on a thread of its own, where there are no worker
+        processes. A thread can't be stopped, so a check which runs over
+        its budget is reported as such and left to finish in the background
+        while the run goes on."""
+        outcome = []
+
+        def run():
+            try:
+                outcome.append(self._run_check(identity))
+            except BaseException as error:  # pylint: disable=broad-except
+                outcome.append(error)
+
+        thread = threading.Thread(
+            target=run, name=f"fontbakery-check-{identity.check.id}", daemon=True
+        )
+        thread.start()
+        thread.join(timeout)
+        if not outcome:
+            return self._timed_out(
+                identity,
+                "timeout-not-stopped",
+                f"This check was still running after {timeout:g} seconds, the"
+                f" most it was allowed to take. It could not be stopped, as"
+                f" there are no worker processes on this system, so it goes"
+                f" on in the background.",
+            )
+        if isinstance(outcome[0], BaseException):
+            raise outcome[0]
+        return outcome[0]
+
+    def _isolated_worker(self, identity, connection):
+        try:
+            subresults = self._run_check(identity).results
+            try:
+                pickle.dumps(subresults)
+            except Exception:  # pylint: disable=broad-except
+                # Messages which can't be sent back are sent as text.
+                subresults = [
+                    Subresult(
+                        subresult.status,
+                        Message(subresult.message.code, str(subresult.message.message)),
+                    )
+                    for subresult in subresults
+                ]
+        except Exception as error:  # pylint: disable=broad-except
+            subresults = [
+                Subresult(ERROR, Message("failed-check", format_error(error)))
+            ]
+        connection.send((subresults, self.legacy_checkid_references))
+        connection.close()
+
+    @staticmethod
+    def schedule(order) -> Tuple[Identity, ...]:
+        """Rearrange an order so that all of the identities of a testable
+        run one after the other. Checks on the whole collection come first,
+        while every file is still loaded; then files are finished one at a
+        time, so that their resources can be released as early as possible.
+        """
+        collection_wide = []
+        by_testable = OrderedDict()
+        for identity in order:
+            if identity.iterargs:
+                by_testable.setdefault(identity.iterargs, []).append(identity)
+            else:
+                collection_wide.append(identity)
+        return tuple(collection_wide) + tuple(
+            identity for identities in by_testable.values() for identity in identities
+        )
+
+    def _release_keys(self, identity):
+        """The things an identity holds on to: its own testable, plus the
+        collection if it asks for any of the collection's heavy properties."""
+        keys = [identity.iterargs]
+        if identity.iterargs:
+            names = set(identity.check.args) | {
+                is_negated(condition)[1] for condition in identity.check.conditions
+            }
+            if names & self.context.heavy_properties:
+                keys.append(())
+        return keys
+
+    def _release(self, key):
+        if key == ():
+            things = [self.context]
+        else:
+            things = [
+                self.context.testables_by_type[thing][index] for thing, index in key
+            ]
+        for thing in things:
+            # Mock objects used on code-tests are not releasable.
+            if isinstance(thing, ReleasableMixin):
+                thing.release()
 
     def run(self, reporters):
+        order = self.order
         # Tell all the reporters we're starting
         for reporter in reporters:
-            reporter.start(self.order)
+            reporter.start(order)
 
-        reporter_lock = threading.Lock()
+        outstanding = Counter(
+            key for identity in order for key in self._release_keys(identity)
+        )
 
-        def distribute_result(result):
-            with reporter_lock:
-                for reporter in reporters:
-                    reporter.receive_result(result)
+        def distribute_results(results):
+            for reporter in reporters:
+                reporter.receive_results(results)
+            if not self.release_resources:
+                return
+            for result in results:
+                for key in self._release_keys(result.identity):
+                    outstanding[key] -= 1
+                    if outstanding[key] == 0:
+                        self._release(key)
+
+        run_timeout = self.config.get("run_timeout")
+        deadline = None if run_timeout is None else time.monotonic() + run_timeout
+
+        def run_check(identity):
+            start = time.perf_counter()
+            result = self._run_check_within_budget(identity, deadline)
+            # list.append is atomic, so this is fine from worker threads.
+            self.timings[identity.check.id].append(time.perf_counter() - start)
+            return result
 
         if self._jobs > 1:
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=self._jobs
-            ) as executor:
-                for identity in self.order:
-                    future = executor.submit(self._run_check, identity)
-                    future.add_done_callback(
-                        lambda future: distribute_result(future.result())
-                    )
+            self._run_pipelined(self.schedule(order), run_check, distribute_results)
         else:
-            for identity in self.order:
-                result = self._run_check(identity)
-                distribute_result(result)
+            for identity in self.schedule(order):
+                distribute_results([run_check(identity)])
 
         # Tell all the reporters we're done
         for reporter in reporters:
             reporter.legacy_checkid_references = list(self.legacy_checkid_references)
             reporter.end()
 
+    def _run_pipelined(self, identities, run_check, distribute_results):
+        """Run the checks on worker threads, while a single reporter thread
+        hands their results over to the reporters, in batches of whatever
+        has piled up in the meantime.
+
+        Workers only put their results on a bounded queue and move on, so
+        they are not held up by slow reporters until it fills up. Checks
+        are submitted only a few at a time ahead of the workers, so that
+        huge orders don't pile up in memory."""
+        pending_limit = self._jobs * RESULTS_PER_WORKER
+        results = queue.Queue(maxsize=pending_limit)
+        pending = threading.BoundedSemaphore(pending_limit)
+        finished = object()
+        failures = []
+
+        def report():
+            while True:
+                batch = [results.get()]
+                while len(batch) < REPORTER_BATCH_SIZE:
+                    try:
+                        batch.append(results.get_nowait())
+                    except queue.Empty:
+                        break
+                last = batch[-1] is finished
+                batch = [result for result in batch if result is not finished]
+                # After a failure, keep draining the queue so that no worker
+                # stays blocked on it.
+                if batch and not failures:
+                    try:
+                        distribute_results(batch)
+                    except BaseException as e:  # pylint: disable=broad-except
+                        failures.append(e)
+                if last:
+                    return
+
+        def work(identity):
+            try:
+                results.put(run_check(identity))
+            except BaseException as e:  # pylint: disable=broad-except
+                failures.append(e)
+            finally:
+                pending.release()
+
+        reporter_thread = threading.Thread(
+            target=report, name="fontbakery-reporter", daemon=True
+        )
+        reporter_thread.start()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._jobs
+            ) as executor:
+                for identity in identities:
+                    pending.acquire()
+                    if failures:
+                        pending.release()
+                        break
+                    executor.submit(work, identity)
+        finally:
+            results.put(finished)
+            reporter_thread.join()
+        if failures:
+            raise failures[0]
+
     def _override_status(self, subresult: Subresult, check):
         orig_status = subresult.status.name
 
@@ -1,5 +1,4 @@
 from fontbakery.prelude import PASS, WARN, Message, check
-from fontbakery.utils import feature_tags
 
 
 @check(
@@ -15,10 +14,10 @@ from fontbakery.utils import feature_tags
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3363",
 )
-def check_cjk_chws_feature(ttFont):
+def check_cjk_chws_feature(layout_graph):
     """Does the font contain chws and vchw features?"""
     passed = True
-    tags = feature_tags(ttFont)
+    tags = layout_graph.feature_tags
     FEATURE_NOT_FOUND = (
         "{} feature not found in font."
         " Use chws_tool (https://github.com/googlefonts/chws_tool)"
@@ -10,6 +10,7 @@ from fontbakery.testable import (
     TTCFont,
     Ufo,
 )
+from fontbakery.sources import lint_ufos
 from fontbakery.utils import get_glyph_name
 
 
@@ -18,6 +19,28 @@ def network(collection):
     return not collection.config["skip_network"]
 
 
+@condition(CheckRunContext)
+def http_client(collection):
+    """The HTTP client shared by all online checks of this run."""
+    from fontbakery.http_client import HTTPClient
+
+    config = collection.config
+    return HTTPClient(
+        timeout=config.get("timeout"),
+        record_dir=config.get("http_record"),
+        replay_dir=config.get("http_replay"),
+    )
+
+
+@condition(CheckRunContext)
+def artifact_store(collection):
+    """Where the checks of this run keep the large payloads of their
+    messages (see fontbakery.artifacts)."""
+    from fontbakery.artifacts import ArtifactStore
+
+    return ArtifactStore(collection.config.get("artifacts_dir"))
+
+
 @condition(CheckRunContext)
 def are_ttf(collection):
     return all(f.is_ttf for f in collection.fonts)
@@ -214,16 +237,37 @@ def is_cjk_font(font):
 @condition(Font)
 def get_cjk_glyphs(font):
     """Return all glyphs which belong to a CJK unicode block"""
-    from fontbakery.constants import CJK_UNICODE_RANGES
+    cjk_unicodes = set(font.repertoire_coverage.present("CJK"))
+    return [
+        glyph_name
+        for uni, glyph_name in font.ttFont.getBestCmap().items()
+        if uni in cjk_unicodes
+    ]
+
+
+@condition(Font)
+def repertoire_coverage(font):
+    """How much of each registered character repertoire the font covers."""
+    from fontbakery.repertoires import RepertoireCoverage
+
+    return RepertoireCoverage(font.font_codepoints)
+
+
+@condition(Font)
+def table_sizes(font):
+    """Table tag -> uncompressed size of the table in the font file."""
+    from fontbakery import sizes
 
-    results = []
-    cjk_unicodes = set()
-    for start, end in CJK_UNICODE_RANGES:
-        cjk_unicodes |= set(u for u in range(start, end + 1))
-    for uni, glyph_name in font.ttFont.getBestCmap().items():
-        if uni in cjk_unicodes:
-            results.append(glyph_name)
-    return results
+    return sizes.table_sizes(font.ttFont)
+
+
+@condition(Font)
+def hinting_sizes(font):
+    """Where the bytes dehinting the font would save are (see
+    fontbakery.sizes.hinting_sizes)."""
+    from fontbakery import sizes
+
+    return sizes.hinting_sizes(font.ttFont)
 
 
 @condition(Font)
@@ -264,24 +308,20 @@ def superfamily(font):
     Given a list of directories, this functions looks for font files
     and returs a list of lists of the detected filepaths.
     """
-    result = []
-    for family_dir in font.sibling_directories:
-        filepaths = []
-        for entry in os.listdir(family_dir):
-            if entry[-4:] in [".otf", ".ttf"]:
-                filepaths.append(os.path.join(family_dir, entry))
-        result.append(filepaths)
-    return result
+    font_pool = font.context.font_pool
+    return [
+        list(font_pool.font_files(family_dir))
+        for family_dir in font.sibling_directories
+    ]
 
 
-@condition(Font)
+@condition(Font, heavy=True)
 def superfamily_ttFonts(font):
-    from fontTools.ttLib import TTFont
-
-    result = []
-    for family in font.superfamily:
-        result.append([TTFont(f) for f in family])
-    return result
+    """The fonts of each sibling family, as shared read-only handles from the
+    run's font pool, which keeps them until this font is released. Do not
+    modify them."""
+    font_pool = font.context.font_pool
+    return [[font_pool.get(f, font) for f in family] for family in font.superfamily]
 
 
 @condition(Font)
@@ -326,156 +366,42 @@ def missing_whitespace_chars(font):
     return missing
 
 
-class CFFAnalysis:
-    def __init__(self):
-        self.glyphs_dotsection = []
-        self.glyphs_endchar_seac = []
-        self.glyphs_exceed_max = []
-        self.glyphs_recursion_errors = []
-        self.string_not_ascii = []
+@condition(Font)
+def cff_analysis(font):
+    from fontbakery.cff import CFFAnalysis, analyze_cff, analyze_cff_table
 
+    glyph_order = None
+    if "CFF2" in font.ttFont:
+        glyph_order = font.ttFont.getGlyphOrder()
+    if not isinstance(font, TTCFont):
+        return analyze_cff(font.file, glyph_order)
 
-def _get_subr_bias(count):
-    if count < 1240:
-        bias = 107
-    elif count < 33900:
-        bias = 1131
-    else:
-        bias = 32768
-    return bias
-
-
-def _traverse_subr_call_tree(info, program, depth):
-    global_subrs = info["global_subrs"]
-    subrs = info["subrs"]
-    gsubr_bias = info["gsubr_bias"]
-    subr_bias = info["subr_bias"]
-
-    if depth > info["max_depth"]:
-        info["max_depth"] = depth
-
-    # once we exceed the max depth we can stop going deeper
-    if depth > 10:
-        return
-
-    if (
-        len(program) >= 5
-        and program[-1] == "endchar"
-        and all([isinstance(a, int) for a in program[-5:-1]])
-    ):
-        info["saw_endchar_seac"] = True
-    if "ignore" in program:  # decompiler expresses 'dotsection' as 'ignore'
-        info["saw_dotsection"] = True
-
-    while program:
-        x = program.pop()
-        if x == "callgsubr":
-            y = int(program.pop()) + gsubr_bias
-            sub_program = global_subrs[y].program.copy()
-            _traverse_subr_call_tree(info, sub_program, depth + 1)
-        elif x == "callsubr":
-            y = int(program.pop()) + subr_bias
-            sub_program = subrs[y].program.copy()
-            _traverse_subr_call_tree(info, sub_program, depth + 1)
-
-
-def _analyze_cff(analysis, top_dict, private_dict, fd_index=0):
-    char_strings = top_dict.CharStrings
-    global_subrs = top_dict.GlobalSubrs
-    gsubr_bias = _get_subr_bias(len(global_subrs))
-
-    if hasattr(top_dict, "rawDict"):
-        raw_dict = top_dict.rawDict
-        for key in ["Notice", "Copyright", "FontName", "FullName", "FamilyName"]:
-            for char in raw_dict.get(key, ""):
-                if ord(char) > 0x7F:
-                    analysis.string_not_ascii.append((key, raw_dict[key]))
-                    break
-
-    if private_dict is not None and hasattr(private_dict, "Subrs"):
-        subrs = private_dict.Subrs
-        subr_bias = _get_subr_bias(len(subrs))
-    else:
-        subrs = None
-        subr_bias = None
-
-    char_list = char_strings.keys()
-
-    for glyph_name in char_list:
-        t2_char_string, fd_select_index = char_strings.getItemAndSelector(glyph_name)
-        if fd_select_index is not None and fd_select_index != fd_index:
-            continue
-        try:
-            t2_char_string.decompile()
-        except RecursionError:
-            analysis.glyphs_recursion_errors.append(glyph_name)
-            continue
-        info = {}
-        info["subrs"] = subrs
-        info["global_subrs"] = global_subrs
-        info["gsubr_bias"] = gsubr_bias
-        info["subr_bias"] = subr_bias
-        info["max_depth"] = 0
-        depth = 0
-        program = t2_char_string.program.copy()
-        _traverse_subr_call_tree(info, program, depth)
-        max_depth = info["max_depth"]
-
-        if max_depth > 10:
-            analysis.glyphs_exceed_max.append(glyph_name)
-        if info.get("saw_endchar_seac"):
-            analysis.glyphs_endchar_seac.append(glyph_name)
-        if info.get("saw_dotsection"):
-            analysis.glyphs_dotsection.append(glyph_name)
+    # Read the table from the collection that is already in memory.
+    for tag, cff2 in (("CFF ", False), ("CFF2", True)):
+        if tag in font.ttFont:
+            data = font.collection.table_data(font.index, tag)
+            return analyze_cff_table(data, cff2, glyph_order)
+    return CFFAnalysis()
 
 
-@condition(Font)
-def cff_analysis(font):
-    from fontTools.ttLib import TTFont
+@condition(Font, heavy=True)
+def layout_graph(font):
+    """A shared, read-only view of the font's GSUB and GPOS lookups."""
+    from fontbakery.layout import LayoutGraph
 
-    analysis = CFFAnalysis()
-    if isinstance(font, TTCFont):
-        ttFont = TTFont(font.file, fontNumber=font.index)
-    else:
-        ttFont = TTFont(font.file)  # Use our own copy here since we are decompiling
-
-    if "CFF " in ttFont:
-        try:
-            cff = ttFont["CFF "].cff
-        except UnicodeDecodeError:
-            analysis.string_not_ascii = None
-            return analysis
-
-        for top_dict in cff.topDictIndex:
-            if hasattr(top_dict, "FDArray"):
-                for fd_index, font_dict in enumerate(top_dict.FDArray):
-                    if hasattr(font_dict, "Private"):
-                        private_dict = font_dict.Private
-                    else:
-                        private_dict = None
-                    _analyze_cff(analysis, top_dict, private_dict, fd_index)
-            else:
-                if hasattr(top_dict, "Private"):
-                    private_dict = top_dict.Private
-                else:
-                    private_dict = None
-                _analyze_cff(analysis, top_dict, private_dict)
-
-    elif "CFF2" in ttFont:
-        cff = ttFont["CFF2"].cff
-
-        for top_dict in cff.topDictIndex:
-            for fd_index, font_dict in enumerate(top_dict.FDArray):
-                if hasattr(font_dict, "Private"):
-                    private_dict = font_dict.Private
-                else:
-                    private_dict = None
-                _analyze_cff(analysis, top_dict, private_dict, fd_index)
-
-    return analysis
+    return LayoutGraph(font.ttFont)
 
 
-@condition(Font)
+@condition(Font, heavy=True)
+def shaper(font):
+    """A HarfBuzz shaper for the font (or for its face of a collection),
+    shared by the checks which shape text."""
+    from fontbakery.utils import font_shaper
+
+    return font_shaper(font.ttFont, font.file, getattr(font, "index", 0))
+
+
+@condition(Font, scope="directory")
 def licenses(font):
     """Get a list of paths for every license
     file found in a font project."""
@@ -497,13 +423,13 @@ def licenses(font):
     return found
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def license_contents(font):
     if font.license_path:
         return open(font.license_path, encoding="utf-8").read().replace(" \n", "\n")
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def license_path(font):
     """Get license path."""
     # This assumes that a repo can have multiple license files
@@ -513,7 +439,7 @@ def license_path(font):
         return font.licenses[0]
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def license_filename(font):
     """Get license filename."""
     if font.license_path:
@@ -525,38 +451,79 @@ def is_ofl(font):
     return font.license_filename and "OFL" in font.license_filename
 
 
-@condition(Font)
+@condition(Font, heavy=True)
 def outlines_dict(font):
-    from beziers.path import BezierPath
+    """The outlines of each glyph, keyed by (glyph name, display name).
+    They are only converted when a check first looks at them."""
+    from fontbakery.outlines import GlyphOutlines
 
-    ttFont = font.ttFont
-    reversed_cmap = {v: k for k, v in ttFont.getBestCmap().items()}
+    return GlyphOutlines(font.ttFont)
 
-    def display_name(glyphname):
-        if glyphname in reversed_cmap:
-            return f"{glyphname} (U+{reversed_cmap[glyphname]:04X})"
-        return glyphname
 
-    return {
-        (glyphname, display_name(glyphname)): BezierPath.fromFonttoolsGlyph(
-            ttFont, glyphname
-        )
-        for glyphname in ttFont.getGlyphOrder()
-    }
+def _ufo_source(testable, path):
+    from fontbakery.sources import UFOSource
+
+    pool = getattr(getattr(testable, "context", None), "source_pool", None)
+    if pool is None:
+        return UFOSource(path)
+    return pool[path]
 
 
-@condition(Ufo)
+@condition(Ufo, heavy=True)
+def ufo_source(ufo):
+    """The UFO, shared with any designspace which uses it as a source."""
+    return _ufo_source(ufo, ufo.file)
+
+
+@condition(Ufo, heavy=True)
 def ufo_font(ufo):
     from fontTools.ufoLib.errors import UFOLibError
-    import defcon
 
     try:
-        return defcon.Font(ufo.file)
+        return ufo.ufo_source.font
     except UFOLibError:
         return None
 
 
+@condition(CheckRunContext)
+def ufolint_results(collection):
+    """The outcome of running ufolint on each UFO of the run, by path.
+    The UFOs are linted in parallel, and unchanged ones are not linted again."""
+    return lint_ufos(ufo.file for ufo in collection.ufos)
+
+
+@condition(Ufo, heavy=True)
+def ufo_glyph_facts(ufo):
+    """The GlyphFacts of every glyph of every layer of the UFO. These come
+    from an on-disk cache, so only the glyphs which changed since the last
+    run need to be parsed."""
+    from fontbakery.sources import font_glyph_facts
+
+    if getattr(ufo, "file", None) is None:
+        # Code-tests can pass in a font which only exists in memory.
+        return font_glyph_facts(ufo.ufo_font)
+    return ufo.ufo_source.glyph_facts
+
+
 @condition(Designspace)
+def designspace_document(designspace):
+    """The parsed designspace file, without loading any of its sources."""
+    from fontTools.designspaceLib import DesignSpaceDocument
+
+    return DesignSpaceDocument.fromfile(designspace.file)
+
+
+@condition(Designspace, heavy=True)
+def designspace_ufos(designspace):
+    """The UFO sources of a designspace, keyed by path. Their glyph names,
+    code points and groups can be read without loading any outlines."""
+    return {
+        source.path: _ufo_source(designspace, source.path)
+        for source in designspace.designspace_document.sources
+    }
+
+
+@condition(Designspace, heavy=True)
 def designSpace(designspace):
     """
     Given a filepath for a designspace file, parse it
@@ -565,21 +532,20 @@ def designSpace(designspace):
     interpolation systems for typefaces'.
     """
     from fontTools.designspaceLib import DesignSpaceDocument
-    import defcon
 
     if designspace:
         DS = DesignSpaceDocument.fromfile(designspace.file)
-        DS.loadSourceFonts(defcon.Font)
+        ufos = designspace.designspace_ufos
+        for source in DS.sources:
+            source.font = ufos[source.path].font
         return DS
 
 
-@condition(Designspace)
+@condition(Designspace, heavy=True)
 def designspace_sources(designspace):
     """
     Given a DesignSpaceDocument object,
     return a set of UFO font sources.
     """
-    import defcon
-
     if designspace.designSpace:
-        return designspace.designSpace.loadSourceFonts(defcon.Font)
+        return [source.font for source in designspace.designSpace.sources]
@@ -7,28 +7,35 @@ from fontbakery.prelude import check, FAIL, PASS, Message
         This check ensures that Unicode assignments are consistent
         across all sources specified in a designspace file.
     """,
-    conditions=["designspace_sources"],
+    conditions=["designspace_ufos"],
     proposal="https://github.com/fonttools/fontbakery/pull/3168",
 )
-def check_designspace_has_consistent_codepoints(designSpace, config):
+def check_designspace_has_consistent_codepoints(
+    designspace_document, designspace_ufos, config
+):
     """Check codepoints consistency in a designspace file."""
     from fontbakery.utils import bullet_list
 
-    default_source = designSpace.findDefault()
-    default_unicodes = {g.name: g.unicode for g in default_source.font}
+    def first_unicodes(source):
+        return {
+            name: unicodes[0] if unicodes else None
+            for name, unicodes in designspace_ufos[source.path].unicodes.items()
+        }
+
+    default_unicodes = first_unicodes(designspace_document.findDefault())
     failures = []
-    for source in designSpace.sources:
-        for g in source.font:
-            if g.name not in default_unicodes:
+    for source in designspace_document.sources:
+        for name, unicode in first_unicodes(source).items():
+            if name not in default_unicodes:
                 # Previous test will cover this
                 continue
 
-            if g.unicode != default_unicodes[g.name]:
+            if unicode != default_unicodes[name]:
                 failures.append(
                     f"Source {source.filename} has"
-                    f" {g.name}={g.unicode};"
+                    f" {name}={unicode};"
                     f" default master has"
-                    f" {g.name}={default_unicodes[g.name]}"
+                    f" {name}={default_unicodes[name]}"
                 )
     if failures:
         yield FAIL, Message(
@@ -7,17 +7,20 @@ from fontbakery.prelude import check, FAIL, PASS, Message
         This check ensures that non-default masters don't have glyphs
         not present in the default one.
     """,
-    conditions=["designspace_sources"],
+    conditions=["designspace_ufos"],
     proposal="https://github.com/fonttools/fontbakery/pull/3168",
 )
-def check_designspace_has_consistent_glyphset(designSpace, config):
+def check_designspace_has_consistent_glyphset(
+    designspace_document, designspace_ufos, config
+):
     """Check consistency of glyphset in a designspace file."""
     from fontbakery.utils import bullet_list
 
-    default_glyphset = set(designSpace.findDefault().font.keys())
+    default_source = designspace_document.findDefault()
+    default_glyphset = set(designspace_ufos[default_source.path].glyph_names)
     failures = []
-    for source in designSpace.sources:
-        master_glyphset = set(source.font.keys())
+    for source in designspace_document.sources:
+        master_glyphset = set(designspace_ufos[source.path].glyph_names)
         outliers = master_glyphset - default_glyphset
         if outliers:
             outliers = ", ".join(list(outliers))
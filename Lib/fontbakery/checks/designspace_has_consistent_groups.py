@@ -9,15 +9,17 @@ from fontbakery.prelude import check, WARN, Message
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/4814",
 )
-def check_designspace_has_consistent_groups(config, designSpace):
+def check_designspace_has_consistent_groups(
+    config, designspace_document, designspace_ufos
+):
     """Confirms that all sources have the same kerning groups per Designspace."""
 
-    default_source = designSpace.findDefault()
-    reference = default_source.font.groups
-    for source in designSpace.sources:
+    default_source = designspace_document.findDefault()
+    reference = designspace_ufos[default_source.path].groups
+    for source in designspace_document.sources:
         if source is default_source:
             continue
-        if source.font.groups != reference:
+        if designspace_ufos[source.path].groups != reference:
             yield (
                 WARN,
                 Message(
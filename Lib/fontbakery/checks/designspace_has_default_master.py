@@ -8,9 +8,9 @@ from fontbakery.prelude import check, FAIL, PASS, Message
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3168",
 )
-def check_designspace_has_default_master(designSpace):
+def check_designspace_has_default_master(designspace_document):
     """Ensure a default master is defined."""
-    if not designSpace.findDefault():
+    if not designspace_document.findDefault():
         yield FAIL, Message("not-found", "Unable to find a default master.")
     else:
         yield PASS, "We located a default master."
@@ -25,9 +25,9 @@ from fontbakery.checks.shaping.utils import is_complex_shaper_font
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3600",
 )
-def check_dotted_circle(ttFont, config):
+def check_dotted_circle(ttFont, layout_graph, config):
     """Ensure dotted circle glyph is present and can attach marks."""
-    from fontbakery.utils import bullet_list, iterate_lookup_list_with_extensions
+    from fontbakery.utils import bullet_list
 
     mark_glyphs = []
     if (
@@ -66,16 +66,12 @@ def check_dotted_circle(ttFont, config):
     attachments = {dotted_circle: []}
     does_attach = {}
 
-    def find_mark_base(lookup, attachments):
-        if lookup.LookupType == 4:
-            # Assume all-to-all
-            for st in lookup.SubTable:
-                for base in st.BaseCoverage.glyphs:
-                    for mark in st.MarkCoverage.glyphs:
-                        attachments.setdefault(base, []).append(mark)
-                        does_attach[mark] = True
-
-    iterate_lookup_list_with_extensions(ttFont, "GPOS", find_mark_base, attachments)
+    for st in layout_graph.gpos.subtables(lookup_type=4):
+        # Assume all-to-all
+        for base in st.BaseCoverage.glyphs:
+            for mark in st.MarkCoverage.glyphs:
+                attachments.setdefault(base, []).append(mark)
+                does_attach[mark] = True
 
     unattached = []
     for g in nonspacing_mark_glyphs:
@@ -1,10 +1,7 @@
 import unicodedata
 
-from fontbakery.constants import (
-    ALL_HANGUL_SYLLABLES_CODEPOINTS,
-    MODERN_HANGUL_SYLLABLES_CODEPOINTS,
-)
 from fontbakery.prelude import check, Message, FAIL, WARN, PASS
+from fontbakery.repertoires import repertoire
 
 
 def _quick_and_dirty_glyph_is_empty(font, glyph_name):
@@ -59,10 +56,12 @@ def _quick_and_dirty_glyph_is_empty(font, glyph_name):
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/2460",
 )
-def check_empty_letters(ttFont):
+def check_empty_letters(ttFont, repertoire_coverage):
     """Letters in font have glyphs that are not empty?"""
     cmap = ttFont.getBestCmap()
-    blank_ok_set = ALL_HANGUL_SYLLABLES_CODEPOINTS - MODERN_HANGUL_SYLLABLES_CODEPOINTS
+    blank_ok_set = set(
+        repertoire_coverage.present("Hangul_Syllables") - repertoire("Hangul_Modern")
+    )
     num_blank_hangul_glyphs = 0
     passed = True
 
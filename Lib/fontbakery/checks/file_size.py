@@ -4,6 +4,14 @@ from fontbakery.prelude import check, Message, FAIL, WARN, PASS
 from fontbakery.utils import filesize_formatting
 
 
+def largest_tables(font, count=3):
+    """A short description of the tables taking most space in the font."""
+    sizes = sorted(font.table_sizes.items(), key=lambda item: -item[1])
+    return ", ".join(
+        f"'{tag.strip()}' ({filesize_formatting(size)})" for tag, size in sizes[:count]
+    )
+
+
 @check(
     id="file_size",
     rationale="""
@@ -23,13 +31,15 @@ def check_file_size(font):
         yield FAIL, Message(
             "massive-font",
             f"Font file is {filesize_formatting(size)}, larger than limit"
-            f" {filesize_formatting(FAIL_SIZE or 9 * 1024 * 1024)}",  # noqa:F821 pylint:disable=E0602
+            f" {filesize_formatting(FAIL_SIZE or 9 * 1024 * 1024)}."  # noqa:F821 pylint:disable=E0602
+            f" The largest tables are {largest_tables(font)}.",
         )
     elif size > (WARN_SIZE or 1 * 1024 * 1024):  # noqa:F821 pylint:disable=E0602
         yield WARN, Message(
             "large-font",
             f"Font file is {filesize_formatting(size)}; ideally it should be less than"
-            f" {filesize_formatting(WARN_SIZE or 1 * 1024 * 1024)}",  # noqa:F821 pylint:disable=E0602
+            f" {filesize_formatting(WARN_SIZE or 1 * 1024 * 1024)}."  # noqa:F821 pylint:disable=E0602
+            f" The largest tables are {largest_tables(font)}.",
         )
     else:
         yield PASS, "Font had a reasonable file size"
@@ -65,6 +65,7 @@ def is_up_to_date(installed_str, latest_str):
 @check(
     id="fontbakery_version",
     conditions=["network"],
+    cache_key=[],  # The same for every font
     rationale="""
         Running old versions of FontBakery can lead to a poor report which may
         include false WARNs and FAILs due do bugs, as well as outdated
@@ -75,15 +76,13 @@ def is_up_to_date(installed_str, latest_str):
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/2093",
 )
-def check_fontbakery_version(font, config):
+def check_fontbakery_version(font, http_client):
     """Do we have the latest version of FontBakery installed?"""
     import pip_api
     import requests
 
     try:
-        response = requests.get(
-            "https://pypi.org/pypi/fontbakery/json", timeout=config.get("timeout")
-        )
+        response = http_client.get("https://pypi.org/pypi/fontbakery/json")
 
     except requests.exceptions.ConnectionError as err:
         return FAIL, Message(
@@ -8,9 +8,10 @@ from fontbakery.prelude import check, Message, ERROR, INFO, PASS
         that is http://namecheck.fontdata.com
     """,
     conditions=["network", "familyname"],
+    cache_key=["familyname"],
     proposal="https://github.com/fonttools/fontbakery/issues/494",
 )
-def check_fontdata_namecheck(ttFont, familyname):
+def check_fontdata_namecheck(ttFont, familyname, http_client):
     """Familyname must be unique according to namecheck.fontdata.com"""
     import requests
 
@@ -18,7 +19,7 @@ def check_fontdata_namecheck(ttFont, familyname):
     API_URL = f"https://namecheck.fontdata.com/api/?q={familyname.replace(' ', '+')}"
     HTML_URL = f"http://namecheck.fontdata.com/?q={familyname.replace(' ', '+')}"
     try:
-        response = requests.get(API_URL, timeout=10)
+        response = http_client.get(API_URL)
         data = response.json()
         # "1.0" means there is a 100% confidence that the name is already in use
         if data["data"]["confidence"]["1.0"] > 0:
@@ -1,5 +1,4 @@
 from fontbakery.prelude import PASS, WARN, Message, check
-from fontbakery.utils import iterate_lookup_list_with_extensions
 
 
 @check(
@@ -21,16 +20,9 @@ from fontbakery.utils import iterate_lookup_list_with_extensions
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3643",
 )
-def check_gpos7(ttFont):
+def check_gpos7(layout_graph):
     """Ensure no GPOS7 lookups are present."""
-    has_gpos7 = False
-
-    def find_gpos7(lookup):
-        nonlocal has_gpos7
-        if lookup.LookupType == 7:
-            has_gpos7 = True
-
-    iterate_lookup_list_with_extensions(ttFont, "GPOS", find_gpos7)
+    has_gpos7 = any(lookup.type == 7 for lookup in layout_graph.gpos.lookups)
 
     if not has_gpos7:
         yield PASS, "Font has no GPOS7 lookups"
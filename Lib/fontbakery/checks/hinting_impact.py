@@ -1,60 +1,40 @@
 import os
-from io import BytesIO
-import tempfile
-
-from dehinter.font import dehint
-from fontTools.subset import main as pyftsubset
-from fontTools.ttLib import TTFont
 
 from fontbakery.prelude import check, Message, INFO
+from fontbakery.sizes import dehinted_size
 from fontbakery.testable import Font
 from fontbakery.utils import filesize_formatting
 
 
-def hinting_stats(font: Font):
+def hinting_stats(font: Font, precise=False):
     """Return file size differences for a hinted font compared
     to an dehinted version of same file.
+
+    By default, the size of the dehinted font is worked out from the
+    hinting data found in the font's tables. With precise=True (and for
+    WOFF and WOFF2 files, whose tables are compressed) the font is
+    actually dehinted and compiled again, which is much slower.
     """
     hinted_size = os.stat(font.file).st_size
-    ttFont = TTFont(font.file)  # Use our own copy since we will dehint it
-
-    if font.is_ttf:
-        dehinted_buffer = BytesIO()
-        dehint(ttFont, verbose=False)
-        ttFont.save(dehinted_buffer)
-        dehinted_buffer.seek(0)
-        dehinted_size = len(dehinted_buffer.read())
-    elif font.is_cff or font.is_cff2:
-        ext = os.path.splitext(font.file)[1]
-        tmp_dir = tempfile.mkdtemp()
-        tmp = os.path.join(tmp_dir, "dehinted%s" % ext)
-
-        args = [
-            font.file,
-            "--no-hinting",
-            "--glyphs=*",
-            "--ignore-missing-glyphs",
-            "--no-notdef-glyph",
-            "--no-recommended-glyphs",
-            "--no-layout-closure",
-            "--layout-features=*",
-            "--no-desubroutinize",
-            "--name-languages=*",
-            "--glyph-names",
-            "--no-prune-unicode-ranges",
-            "--output-file=%s" % tmp,
-        ]
-        pyftsubset(args)
 
-        dehinted_size = os.stat(tmp).st_size
-        os.remove(tmp)
-        os.rmdir(tmp_dir)
+    if precise or font.ttFont.flavor:
+        dehinted = dehinted_size(font)
+        if dehinted is None:
+            return None
+        hinting = {}
+        estimated = False
+    elif font.is_ttf or font.is_cff or font.is_cff2:
+        hinting = font.hinting_sizes
+        dehinted = hinted_size - sum(hinting.values())
+        estimated = True
     else:
         return None
 
     return {
-        "dehinted_size": dehinted_size,
+        "dehinted_size": dehinted,
         "hinted_size": hinted_size,
+        "hinting_sizes": hinting,
+        "estimated": estimated,
     }
 
 
@@ -63,12 +43,19 @@ def hinting_stats(font: Font):
     rationale="""
         This check is merely informative, displaying an useful comparison of filesizes
         of hinted versus unhinted font files.
+
+        The size of the unhinted font is estimated from the hinting data in its
+        tables. Set the PRECISE configuration option to actually dehint the font
+        and measure the resulting file instead.
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
+    configs=["PRECISE"],
 )
 def check_hinting_impact(font):
     """Show hinting filesize impact."""
-    stats = hinting_stats(font)
+    # pytype: disable=name-error
+    stats = hinting_stats(font, precise=PRECISE)  # noqa:F821 pylint:disable=E0602
+    # pytype: enable=name-error
     hinted = stats["hinted_size"]
     dehinted = stats["dehinted_size"]
     increase = hinted - dehinted
@@ -76,16 +63,34 @@ def check_hinting_impact(font):
 
     hinted_size = filesize_formatting(hinted)
     dehinted_size = filesize_formatting(dehinted)
+    dehinted_label = (
+        "Dehinted Size (estimated)" if stats["estimated"] else "Dehinted Size"
+    )
     increase = filesize_formatting(increase)
 
+    breakdown = "".join(
+        f" | {source} | {filesize_formatting(size)} |\n"
+        for source, size in sorted(
+            stats["hinting_sizes"].items(), key=lambda item: -item[1]
+        )
+    )
+    if breakdown:
+        breakdown = (
+            "\n"
+            "Hinting data found in the font:\n"
+            "\n"
+            " | Source | Size |\n"
+            " |:------ | ----:|\n" + breakdown
+        )
+
     yield INFO, Message(
         "size-impact",
         f"Hinting filesize impact:\n"
         f"\n"
         f" |               | {font.file}     |\n"
         f" |:------------- | ---------------:|\n"
-        f" | Dehinted Size | {dehinted_size} |\n"
+        f" | {dehinted_label} | {dehinted_size} |\n"
         f" | Hinted Size   | {hinted_size}   |\n"
         f" | Increase      | {increase}      |\n"
-        f" | Change        | {change:.1f} %  |\n",
+        f" | Change        | {change:.1f} %  |\n" + breakdown,
     )
@@ -5,22 +5,14 @@ from fontbakery.utils import bullet_list
 
 @condition(Font)
 def ligature_glyphs(font):
-    from fontTools.ttLib.tables.otTables import LigatureSubst
-
-    ttFont = font.ttFont
     all_ligature_glyphs = []
     try:
-        if "GSUB" in ttFont and ttFont["GSUB"].table.LookupList:
-            for record in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-                if record.FeatureTag == "liga":
-                    for index in record.Feature.LookupListIndex:
-                        lookup = ttFont["GSUB"].table.LookupList.Lookup[index]
-                        for subtable in lookup.SubTable:
-                            if isinstance(subtable, LigatureSubst):
-                                for firstGlyph in subtable.ligatures.keys():
-                                    for lig in subtable.ligatures[firstGlyph]:
-                                        if lig.LigGlyph not in all_ligature_glyphs:
-                                            all_ligature_glyphs.append(lig.LigGlyph)
+        gsub = font.layout_graph.gsub
+        for subtable in gsub.subtables(lookup_type=4, feature_tag="liga"):
+            for firstGlyph in subtable.ligatures.keys():
+                for lig in subtable.ligatures[firstGlyph]:
+                    if lig.LigGlyph not in all_ligature_glyphs:
+                        all_ligature_glyphs.append(lig.LigGlyph)
         return all_ligature_glyphs
     except (AttributeError, IndexError):
         return []  # fontTools bug perhaps? (issue #1596)
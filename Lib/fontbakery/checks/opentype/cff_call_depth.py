@@ -14,6 +14,12 @@ def check_cff_call_depth(font):
     """Is the CFF subr/gsubr call depth > 10?"""
     analysis = font.cff_analysis
 
+    if analysis.malformed:
+        yield FAIL, Message(
+            "malformed-cff",
+            f"Unable to analyze the charstrings: {analysis.malformed}.",
+        )
+
     if analysis.glyphs_exceed_max or analysis.glyphs_recursion_errors:
         for gn in analysis.glyphs_exceed_max:
             yield FAIL, Message(
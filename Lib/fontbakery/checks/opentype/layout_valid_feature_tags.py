@@ -1,7 +1,6 @@
 from opentypespec.tags import FEATURE_TAGS
 
 from fontbakery.prelude import check, Message, FAIL
-from fontbakery.utils import feature_tags
 
 
 DEPRECATED_TAGS = ["hngl", "opbd", "size"]
@@ -20,7 +19,7 @@ DEPRECATED_TAGS = ["hngl", "opbd", "size"]
     proposal="https://github.com/fonttools/fontbakery/issues/3355",
     severity=8,
 )
-def check_layout_valid_feature_tags(ttFont):
+def check_layout_valid_feature_tags(layout_graph):
     """Does the font have any invalid feature tags?"""
 
     # We'll accept any of the OpenType specified feature tags:
@@ -30,7 +29,7 @@ def check_layout_valid_feature_tags(ttFont):
     acceptable_tags += ["HARF", "BUZZ"]
 
     bad_tags = set()
-    for tag in feature_tags(ttFont):
+    for tag in layout_graph.feature_tags:
         if tag not in acceptable_tags:
             if not tag.isupper() or len(tag) > 4:
                 bad_tags.add(tag)
@@ -1,7 +1,6 @@
 from opentypespec.tags import LANGUAGE_TAGS
 
 from fontbakery.prelude import check, Message, FAIL
-from fontbakery.utils import language_tags
 
 
 @check(
@@ -14,10 +13,10 @@ from fontbakery.utils import language_tags
     proposal="https://github.com/fonttools/fontbakery/issues/3355",
     severity=8,
 )
-def check_layout_valid_language_tags(ttFont):
+def check_layout_valid_language_tags(layout_graph):
     """Does the font have any invalid language tags?"""
     bad_tags = set()
-    for tag in language_tags(ttFont):
+    for tag in layout_graph.language_tags:
         if tag not in LANGUAGE_TAGS.keys():
             bad_tags.add(tag)
     if bad_tags:
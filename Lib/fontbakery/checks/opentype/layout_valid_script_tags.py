@@ -1,7 +1,6 @@
 from opentypespec.tags import SCRIPT_TAGS
 
 from fontbakery.prelude import check, Message, FAIL
-from fontbakery.utils import script_tags
 
 
 @check(
@@ -14,10 +13,10 @@ from fontbakery.utils import script_tags
     proposal="https://github.com/fonttools/fontbakery/issues/3355",
     severity=8,
 )
-def check_layout_valid_script_tags(ttFont):
+def check_layout_valid_script_tags(layout_graph):
     """Does the font have any invalid script tags?"""
     bad_tags = set()
-    for tag in script_tags(ttFont):
+    for tag in layout_graph.script_tags:
         if tag not in SCRIPT_TAGS.keys():
             bad_tags.add(tag)
     if bad_tags:
@@ -6,7 +6,7 @@ from fontbakery.testable import Font
 REFERENCE = "H"
 
 
-@condition(Font)
+@condition(Font, heavy=True)
 def uharfbuzz_blob(font):
     import uharfbuzz as hb
 
@@ -1,4 +1,5 @@
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import OutlineScan
 from fontbakery.utils import (
     bullet_list,
     close_but_not_on,
@@ -55,7 +56,8 @@ def check_outline_alignment_miss(ttFont, outlines_dict, config):
             " and version >= 2 is required for those checks.",
         )
 
-    for glyph, outlines in outlines_dict.items():
+    scan = OutlineScan(outlines_dict, config)
+    for glyph, outlines in scan:
         glyphname, display_name = glyph
         for p in outlines:
             for node in p.asNodelist():
@@ -72,11 +74,12 @@ def check_outline_alignment_miss(ttFont, outlines_dict, config):
                             f"{display_name}: X={node.x},Y={node.y}"
                             f" (should be at {line} {yExpected}?)"
                         )
-        if len(warnings) > FALSE_POSITIVE_CUTOFF:
+        if scan.too_many(warnings):
             # Let's not waste time.
-            yield PASS, (
+            yield PASS, scan.note(
                 "So many Y-coordinates of points were close to"
-                " boundaries that this was probably by design."
+                " boundaries that this was probably by design.",
+                estimated=True,
             )
             return
 
@@ -84,9 +87,11 @@ def check_outline_alignment_miss(ttFont, outlines_dict, config):
         formatted_list = bullet_list(config, warnings, bullet="*")
         yield WARN, Message(
             "found-misalignments",
-            f"The following glyphs have on-curve points which"
-            f" have potentially incorrect y coordinates:\n\n"
-            f"{formatted_list}",
+            scan.note(
+                f"The following glyphs have on-curve points which"
+                f" have potentially incorrect y coordinates:\n\n"
+                f"{formatted_list}"
+            ),
         )
     else:
-        yield PASS, "Y-coordinates of points fell on appropriate boundaries."
+        yield PASS, scan.note("Y-coordinates of points fell on appropriate boundaries.")
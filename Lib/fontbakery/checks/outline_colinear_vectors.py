@@ -1,9 +1,7 @@
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import OutlineScan
 from fontbakery.utils import bullet_list
-from fontbakery.checks.outline_settings import (
-    COLINEAR_EPSILON,
-    FALSE_POSITIVE_CUTOFF,
-)
+from fontbakery.checks.outline_settings import COLINEAR_EPSILON
 
 
 @check(
@@ -22,7 +20,8 @@ def check_outline_colinear_vectors(ttFont, outlines_dict, config):
     """Do any segments have colinear vectors?"""
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
+    scan = OutlineScan(outlines_dict, config)
+    for glyph, outlines in scan:
         glyphname, display_name = glyph
         for p in outlines:
             segments = p.asSegments()
@@ -37,9 +36,10 @@ def check_outline_colinear_vectors(ttFont, outlines_dict, config):
                         < COLINEAR_EPSILON
                     ):
                         warnings.append(f"{display_name}: {prev} -> {this}")
-        if len(warnings) > FALSE_POSITIVE_CUTOFF:
-            yield PASS, (
-                "So many colinear vectors were found that this was probably by design."
+        if scan.too_many(warnings):
+            yield PASS, scan.note(
+                "So many colinear vectors were found that this was probably by design.",
+                estimated=True,
             )
             return
 
@@ -47,7 +47,9 @@ def check_outline_colinear_vectors(ttFont, outlines_dict, config):
         formatted_list = bullet_list(config, sorted(set(warnings)), bullet="*")
         yield WARN, Message(
             "found-colinear-vectors",
-            f"The following glyphs have colinear vectors:\n\n{formatted_list}",
+            scan.note(
+                f"The following glyphs have colinear vectors:\n\n{formatted_list}"
+            ),
         )
     else:
-        yield PASS, "No colinear vectors found."
+        yield PASS, scan.note("No colinear vectors found.")
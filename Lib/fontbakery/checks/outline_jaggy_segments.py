@@ -1,6 +1,7 @@
 import math
 
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import OutlineScan
 from fontbakery.utils import bullet_list
 from fontbakery.checks.outline_settings import JAG_ANGLE
 
@@ -20,7 +21,8 @@ def check_outline_jaggy_segments(ttFont, outlines_dict, config):
     """Do outlines contain any jaggy segments?"""
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
+    scan = OutlineScan(outlines_dict, config)
+    for glyph, outlines in scan:
         glyphname, display_name = glyph
         for p in outlines:
             segments = p.asSegments()
@@ -44,12 +46,14 @@ def check_outline_jaggy_segments(ttFont, outlines_dict, config):
                 warnings.append(
                     f"{display_name}: {prev}/{this} = {math.degrees(jag_angle)}"
                 )
+        if scan.enough(warnings):
+            break
 
     if warnings:
         formatted_list = bullet_list(config, sorted(warnings), bullet="*")
         yield WARN, Message(
             "found-jaggy-segments",
-            f"The following glyphs have jaggy segments:\n\n{formatted_list}",
+            scan.note(f"The following glyphs have jaggy segments:\n\n{formatted_list}"),
         )
     else:
-        yield PASS, "No jaggy segments found."
+        yield PASS, scan.note("No jaggy segments found.")
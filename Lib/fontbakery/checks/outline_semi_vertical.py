@@ -1,6 +1,7 @@
 import math
 
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import OutlineScan
 from fontbakery.utils import bullet_list
 
 
@@ -23,7 +24,8 @@ def check_outline_semi_vertical(ttFont, outlines_dict, config):
 
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
+    scan = OutlineScan(outlines_dict, config)
+    for glyph, outlines in scan:
         glyphname, display_name = glyph
         for p in outlines:
             segments = p.asSegments()
@@ -36,15 +38,19 @@ def check_outline_semi_vertical(ttFont, outlines_dict, config):
                 for yExpected in [-180, -90, 0, 90, 180]:
                     if close_but_not_on(angle, yExpected, 0.5):
                         warnings.append(f"{display_name}: {s}")
+        if scan.enough(warnings):
+            break
 
     if warnings:
         formatted_list = bullet_list(config, sorted(warnings), bullet="*")
         yield WARN, Message(
             "found-semi-vertical",
-            f"The following glyphs have"
-            f" semi-vertical/semi-horizontal lines:\n"
-            f"\n"
-            f"{formatted_list}",
+            scan.note(
+                f"The following glyphs have"
+                f" semi-vertical/semi-horizontal lines:\n"
+                f"\n"
+                f"{formatted_list}"
+            ),
         )
     else:
-        yield PASS, "No semi-horizontal/semi-vertical lines found."
+        yield PASS, scan.note("No semi-horizontal/semi-vertical lines found.")
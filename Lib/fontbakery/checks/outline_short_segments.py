@@ -1,6 +1,7 @@
 import math
 
 from fontbakery.prelude import check, Message, PASS, WARN
+from fontbakery.outlines import OutlineScan
 from fontbakery.utils import bullet_list
 from fontbakery.checks.outline_settings import (
     FALSE_POSITIVE_CUTOFF,
@@ -27,7 +28,8 @@ def check_outline_short_segments(ttFont, outlines_dict, config):
     """Are any segments inordinately short?"""
     warnings = []
 
-    for glyph, outlines in outlines_dict.items():
+    scan = OutlineScan(outlines_dict, config)
+    for glyph, outlines in scan:
         glyphname, display_name = glyph
         for p in outlines:
             outline_length = p.length
@@ -44,9 +46,10 @@ def check_outline_short_segments(ttFont, outlines_dict, config):
                 ) and (prev_was_line or len(seg) > 2):
                     warnings.append(f"{display_name} contains a short segment {seg}")
                 prev_was_line = len(seg) == 2
-        if len(warnings) > FALSE_POSITIVE_CUTOFF:
-            yield PASS, (
-                "So many short segments were found that this was probably by design."
+        if scan.too_many(warnings):
+            yield PASS, scan.note(
+                "So many short segments were found that this was probably by design.",
+                estimated=True,
             )
             return
 
@@ -54,8 +57,10 @@ def check_outline_short_segments(ttFont, outlines_dict, config):
         formatted_list = bullet_list(config, warnings, bullet="*")
         yield WARN, Message(
             "found-short-segments",
-            f"The following glyphs have segments which seem very short:\n\n"
-            f"{formatted_list}",
+            scan.note(
+                f"The following glyphs have segments which seem very short:\n\n"
+                f"{formatted_list}"
+            ),
         )
     else:
-        yield PASS, "No short segments were found."
+        yield PASS, scan.note("No short segments were found.")
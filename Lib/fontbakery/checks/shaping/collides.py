@@ -1,6 +1,7 @@
 from pathlib import Path
 
 from fontbakery.prelude import check, FAIL, Message
+from fontbakery.sweep import ShapingSweep
 from fontbakery.utils import exit_with_install_instructions
 from fontbakery.checks.shaping.utils import (
     create_report_item,
@@ -25,7 +26,7 @@ from fontbakery.checks.shaping.utils import (
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_collides(config, ttFont):
+def check_shaping_collides(config, ttFont, layout_graph, artifact_store):
     """Check that no collisions are found while shaping"""
     yield from run_a_set_of_shaping_tests(
         config,
@@ -34,11 +35,14 @@ def check_shaping_collides(config, ttFont):
         lambda test, configuration: "collidoscope" in test
         or "collidoscope" in configuration,
         collides_glyph_test_results,
-        setup_glyph_collides,
+        lambda ttFont, configuration: setup_glyph_collides(
+            ttFont, configuration, layout_graph
+        ),
+        artifact_store=artifact_store,
     )
 
 
-def setup_glyph_collides(ttFont, configuration):
+def setup_glyph_collides(ttFont, configuration, layout_graph=None):
     try:
         from collidoscope import Collidoscope
     except ImportError:
@@ -58,7 +62,7 @@ def setup_glyph_collides(ttFont, configuration):
         collidoscope_configuration,
         direction=configuration.get("direction", "LTR"),
     )
-    return {"collidoscope": col}
+    return {"collidoscope": col, "ttFont": ttFont, "layout_graph": layout_graph}
 
 
 def run_collides_glyph_test(
@@ -86,18 +90,32 @@ def run_collides_glyph_test(
     else:
         strings = [test["input"]]
 
-    for shaping_text in strings:
-        output_buf = vharfbuzz.shape(shaping_text, parameters)
+    def find_bumps(shaping_text, output_buf):
         glyphs = col.get_glyphs(shaping_text, buf=output_buf)
         collisions = col.has_collisions(glyphs)
         bumps = [f"{c.glyph1}/{c.glyph2}" for c in collisions]
         bumps = [b for b in bumps if b not in allowed_collisions]
         if bumps:
-            draw = fix_svg(col.draw_overlaps(glyphs, collisions))
+            return bumps, col.draw_overlaps(glyphs, collisions), output_buf
+
+    # Pattern inputs can expand into many strings. Those which are mapped
+    # to the same glyphs as an earlier one are not shaped again.
+    sweep = ShapingSweep(
+        extra_data["ttFont"],
+        parameters,
+        by_glyph=True,
+        vharfbuzz=vharfbuzz,
+        layout_graph=extra_data["layout_graph"],
+    )
+    for shaping_text, failure in sweep.outcomes(strings, find_bumps):
+        if failure:
+            bumps, draw, output_buf = failure
             failed_shaping_tests.append((shaping_text, bumps, draw, output_buf))
 
 
-def collides_glyph_test_results(vharfbuzz, shaping_file, failed_shaping_tests):
+def collides_glyph_test_results(
+    vharfbuzz, shaping_file, failed_shaping_tests, artifact_store=None
+):
     report_items = []
     seen_bumps = {}
     for shaping_text, bumps, draw, buf in failed_shaping_tests:
@@ -108,8 +126,10 @@ def collides_glyph_test_results(vharfbuzz, shaping_file, failed_shaping_tests):
         report_item = create_report_item(
             vharfbuzz,
             f"{',' .join(bumps)} collision found in"
-            f" e.g. <span class='tf'>{shaping_text}</span> <div>{draw}</div>",
+            f" e.g. <span class='tf'>{shaping_text}</span>"
+            f" <div>{fix_svg(draw, artifact_store)}</div>",
             buf1=buf,
+            artifact_store=artifact_store,
         )
         report_items.append(report_item)
     header = (
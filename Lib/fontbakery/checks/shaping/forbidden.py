@@ -22,7 +22,7 @@ from fontbakery.checks.shaping.utils import (
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_forbidden(config, ttFont):
+def check_shaping_forbidden(config, ttFont, artifact_store):
     """Check that no forbidden glyphs are found while shaping"""
     yield from run_a_set_of_shaping_tests(
         config,
@@ -30,6 +30,7 @@ def check_shaping_forbidden(config, ttFont):
         run_forbidden_glyph_test,
         lambda test, configuration: "forbidden_glyphs" in configuration,
         forbidden_glyph_test_results,
+        artifact_store=artifact_store,
     )
 
 
@@ -61,12 +62,20 @@ def run_forbidden_glyph_test(
                 failed_shaping_tests.append((shaping_text, output_buf, forbidden))
 
 
-def forbidden_glyph_test_results(vharfbuzz, shaping_file, failed_shaping_tests):
+def forbidden_glyph_test_results(
+    vharfbuzz, shaping_file, failed_shaping_tests, artifact_store=None
+):
     report_items = []
     for shaping_text, buf, forbidden in failed_shaping_tests:
         msg = f"{shaping_text} produced '{forbidden}'"
         report_items.append(
-            create_report_item(vharfbuzz, msg, text=shaping_text, buf1=buf)
+            create_report_item(
+                vharfbuzz,
+                msg,
+                text=shaping_text,
+                buf1=buf,
+                artifact_store=artifact_store,
+            )
         )
 
     header = f"{shaping_file}: Forbidden glyphs found while shaping"
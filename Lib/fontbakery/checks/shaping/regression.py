@@ -23,7 +23,9 @@ def run_shaping_regression(
         failed_shaping_tests.append((test, expectation, output_buf, output_serialized))
 
 
-def generate_shaping_regression_report(vharfbuzz, shaping_file, failed_shaping_tests):
+def generate_shaping_regression_report(
+    vharfbuzz, shaping_file, failed_shaping_tests, artifact_store=None
+):
     report_items = []
     for test, expected, output_buf, output_serialized in failed_shaping_tests:
         extra_data = {
@@ -45,6 +47,7 @@ def generate_shaping_regression_report(vharfbuzz, shaping_file, failed_shaping_t
             buf2=buf2,
             note=test.get("note"),
             extra_data=extra_data,
+            artifact_store=artifact_store,
         )
         report_items.append(report_item)
 
@@ -67,7 +70,7 @@ def generate_shaping_regression_report(vharfbuzz, shaping_file, failed_shaping_t
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/3223",
 )
-def check_shaping_regression(config, ttFont):
+def check_shaping_regression(config, ttFont, artifact_store):
     """Check that texts shape as per expectation"""
     yield from run_a_set_of_shaping_tests(
         config,
@@ -75,4 +78,5 @@ def check_shaping_regression(config, ttFont):
         run_shaping_regression,
         lambda test, configuration: "expectation" in test,
         generate_shaping_regression_report,
+        artifact_store=artifact_store,
     )
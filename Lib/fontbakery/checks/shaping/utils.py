@@ -24,9 +24,13 @@ from fontbakery.prelude import FAIL, PASS, SKIP, Message
 from fontbakery.utils import exit_with_install_instructions
 
 
-def fix_svg(svg):
+def fix_svg(svg, artifact_store=None):
+    """Prepare an SVG rendering for a report. With an artifact store, the
+    SVG goes there and a reference to it is returned instead."""
     svg = svg.replace("<svg", '<svg style="height:100px;margin:10px;"')
     svg = svg.replace("\n", " ")
+    if artifact_store is not None:
+        return artifact_store.add(svg, "svg")
     return svg
 
 
@@ -38,6 +42,7 @@ def create_report_item(
     buf2=None,
     note=None,
     extra_data=None,
+    artifact_store=None,
 ):
     from vharfbuzz import FakeBuffer
 
@@ -78,11 +83,12 @@ def create_report_item(
 
     # Now draw it as SVG
     if buf1:
-        message += f"  Got: {fix_svg(vharfbuzz.buf_to_svg(buf1))}"
+        message += f"  Got: {fix_svg(vharfbuzz.buf_to_svg(buf1), artifact_store)}"
 
     if buf2 and isinstance(buf2, FakeBuffer):
         try:
-            message += f" Expected: {fix_svg(vharfbuzz.buf_to_svg(buf2))}"
+            svg = fix_svg(vharfbuzz.buf_to_svg(buf2), artifact_store)
+            message += f" Expected: {svg}"
         except KeyError:
             pass
 
@@ -107,7 +113,13 @@ def get_shaping_parameters(test, configuration):
 # This is a very generic "do something with shaping" test runner.
 # It'll be given concrete meaning later.
 def run_a_set_of_shaping_tests(
-    config, ttFont, run_a_test, test_filter, generate_report, preparation=None
+    config,
+    ttFont,
+    run_a_test,
+    test_filter,
+    generate_report,
+    preparation=None,
+    artifact_store=None,
 ):
     try:
         from vharfbuzz import Vharfbuzz
@@ -187,7 +199,7 @@ def run_a_set_of_shaping_tests(
                 yield PASS, f"{shaping_file}: No regression detected"
             else:
                 yield from generate_report(
-                    vharfbuzz, shaping_file, failed_shaping_tests
+                    vharfbuzz, shaping_file, failed_shaping_tests, artifact_store
                 )
 
     if not shaping_file_found:
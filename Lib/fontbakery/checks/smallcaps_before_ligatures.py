@@ -17,27 +17,15 @@ from fontbakery.prelude import PASS, FAIL, SKIP, Message, check
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3020",
 )
-def check_smallcaps_before_ligatures(ttFont):
+def check_smallcaps_before_ligatures(ttFont, layout_graph):
     """
     Ensure 'smcp' (small caps) lookups are defined before ligature lookups in the 'GSUB' table.
     """
     if "GSUB" not in ttFont:
         return SKIP, "Font lacks a 'GSUB' table."
 
-    gsub_table = ttFont["GSUB"].table
-
-    smcp_indices = [
-        index
-        for feature in gsub_table.FeatureList.FeatureRecord
-        if feature.FeatureTag == "smcp"
-        for index in feature.Feature.LookupListIndex
-    ]
-    liga_indices = [
-        index
-        for feature in gsub_table.FeatureList.FeatureRecord
-        if feature.FeatureTag == "liga"
-        for index in feature.Feature.LookupListIndex
-    ]
+    smcp_indices = layout_graph.gsub.features.get("smcp", [])
+    liga_indices = layout_graph.gsub.features.get("liga", [])
 
     if not smcp_indices or not liga_indices:
         return SKIP, "Font lacks 'smcp' or 'liga' features."
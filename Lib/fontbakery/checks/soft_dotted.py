@@ -2,9 +2,9 @@ import itertools
 
 from beziers.path import BezierPath
 from fontTools import unicodedata
-from vharfbuzz import Vharfbuzz
 
 from fontbakery.prelude import check, Message, PASS, WARN, SKIP
+from fontbakery.sweep import ShapingSweep
 
 
 @check(
@@ -27,7 +27,7 @@ from fontbakery.prelude import check, Message, PASS, WARN, SKIP
     ],  # use Shaperglot, which uses youseedee, which downloads Unicode files
     proposal="https://github.com/fonttools/fontbakery/issues/4059",
 )
-def check_soft_dotted(ttFont):
+def check_soft_dotted(ttFont, layout_graph, shaper):
     """Ensure soft_dotted characters lose their dot when combined with marks that
     replace the dot."""
 
@@ -87,9 +87,14 @@ def check_soft_dotted(ttFont):
         )
         return
 
-    # Use harfbuzz to check if soft dotted glyphs are substituted
-    filename = ttFont.reader.file.name
-    vharfbuzz = Vharfbuzz(filename)
+    # Use harfbuzz to check if soft dotted glyphs are substituted.
+    # Strings the font can't tell apart are only shaped once.
+    sweep = ShapingSweep(ttFont, vharfbuzz=shaper, layout_graph=layout_graph)
+
+    def unchanged(text, buf):
+        output = sweep.vharfbuzz.serialize_buf(buf, glyphsonly=True)
+        return output == "|".join(cmap[ord(char)] for char in text)
+
     fail_unchanged_strings = []
     warn_unchanged_strings = []
     for sequence in sorted(
@@ -100,21 +105,13 @@ def check_soft_dotted(ttFont):
             mark_above_chars,
         )
     ):
-        soft, non_above, above = sequence
-        if non_above:
-            unchanged = f"{cmap[soft]}|{cmap[non_above]}|{cmap[above]}"
-            text = f"{chr(soft)}{chr(non_above)}{chr(above)}"
-        else:
-            unchanged = f"{cmap[soft]}|{cmap[above]}"
-            text = f"{chr(soft)}{chr(above)}"
+        text = "".join(chr(codepoint) for codepoint in sequence if codepoint)
 
         # Only check a few strings that we WARN about.
         if text not in ortho_soft_dotted_strings and len(warn_unchanged_strings) >= 20:
             continue
 
-        buf = vharfbuzz.shape(text)
-        output = vharfbuzz.serialize_buf(buf, glyphsonly=True)
-        if output == unchanged:
+        if sweep.outcome(text, unchanged):
             if text in ortho_soft_dotted_strings:
                 fail_unchanged_strings.append(text)
             else:
@@ -22,7 +22,7 @@ from fontbakery.utils import mark_glyphs
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/4440",
 )
-def check_tabular_kerning(ttFont):
+def check_tabular_kerning(ttFont, layout_graph):
     """Check tabular widths don't have kerning."""
     from vharfbuzz import Vharfbuzz
     import uharfbuzz as hb
@@ -76,17 +76,6 @@ def check_tabular_kerning(ttFont):
 
         return unique_combinations
 
-    def has_feature(ttFont, featureTag):
-        if "GSUB" in ttFont and ttFont["GSUB"].table.FeatureList:
-            for FeatureRecord in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-                if FeatureRecord.FeatureTag == featureTag:
-                    return True
-        if "GPOS" in ttFont and ttFont["GPOS"].table.FeatureList:
-            for FeatureRecord in ttFont["GPOS"].table.FeatureList.FeatureRecord:
-                if FeatureRecord.FeatureTag == featureTag:
-                    return True
-        return False
-
     def buf_to_width(buf):
         x_cursor = 0
 
@@ -101,23 +90,6 @@ def check_tabular_kerning(ttFont):
             return gid
         return ttFont.getGlyphID(glyph_name)
 
-    def get_substitutions(
-        ttFont,
-        featureTag,
-        lookupType=1,
-    ):
-        substitutions = {}
-        if "GSUB" in ttFont:
-            for FeatureRecord in ttFont["GSUB"].table.FeatureList.FeatureRecord:
-                if FeatureRecord.FeatureTag == featureTag:
-                    for LookupIndex in FeatureRecord.Feature.LookupListIndex:
-                        for SubTable in (
-                            ttFont["GSUB"].table.LookupList.Lookup[LookupIndex].SubTable
-                        ):
-                            if SubTable.LookupType == lookupType:
-                                substitutions.update(SubTable.mapping)
-        return substitutions
-
     def get_kerning(glyph_list):
         # Either glyph is in EXCLUDED
         # Also stripping .ss01, .ss02, etc
@@ -172,8 +144,8 @@ def check_tabular_kerning(ttFont):
     tabular_numerals = []
 
     # Fonts with tnum feautre
-    if has_feature(ttFont, "tnum"):
-        tabular_glyphs = list(get_substitutions(ttFont, "tnum").values())
+    if "tnum" in layout_graph.feature_tags:
+        tabular_glyphs = list(layout_graph.single_substitutions("tnum").values())
         buf = vhb.shape("0123456789", {"features": {"tnum": True}})
         tabular_numerals = vhb.serialize_buf(buf, glyphsonly=True).split("|")
 
@@ -212,7 +184,7 @@ def check_tabular_kerning(ttFont):
         return
 
     # Actually check for kerning
-    if has_feature(ttFont, "kern"):
+    if "kern" in layout_graph.feature_tags:
         for sets in (
             (all_glyphs, tabular_numerals),
             (tabular_numerals, tabular_glyphs),
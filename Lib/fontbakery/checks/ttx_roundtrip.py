@@ -18,24 +18,19 @@ from fontbakery.testable import TTCFont
 )
 def check_ttx_roundtrip(font):
     """Checking with fontTools.ttx"""
-    from fontTools import ttx
     import subprocess
     import sys
     import tempfile
 
-    font_file = font.file
-    if isinstance(font, TTCFont):
-        ttFont = ttx.TTFont(font.file, fontNumber=font.index)
-        ttf_fd, font_file = tempfile.mkstemp()
-        os.close(ttf_fd)
-        ttFont.save(font_file)
+    # Dump a face of a collection straight from the collection file.
+    face = ["-y", str(font.index)] if isinstance(font, TTCFont) else []
 
     xml_fd, xml_file = tempfile.mkstemp()
     os.close(xml_fd)
 
     export_process = subprocess.Popen(
         # TTX still emits warnings & errors even when -q (quiet) is passed
-        [sys.executable, "-m", "fontTools.ttx", "-qo", xml_file, font.file],
+        [sys.executable, "-m", "fontTools.ttx", "-qo", xml_file, *face, font.file],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         universal_newlines=True,
@@ -96,5 +91,3 @@ def check_ttx_roundtrip(font):
     # and then we need to cleanup our mess...
     if os.path.exists(xml_file):
         os.remove(xml_file)
-    if font_file != font.file and os.path.exists(font_file):
-        os.remove(font_file)
@@ -1,4 +1,3 @@
-from fontbakery.testable import Ufo
 from fontbakery.prelude import check, PASS, WARN, Message
 from fontbakery import utils
 
@@ -12,23 +11,21 @@ from fontbakery import utils
     conditions=["ufo_font"],
     proposal="https://github.com/fonttools/fontbakery/pull/4795",
 )
-def check_ufo_consistent_curve_type(config, ufo: Ufo):
+def check_ufo_consistent_curve_type(config, ufo_glyph_facts):
     """Check that all glyphs across the source use the same curve type"""
 
     cubic_glyphs = []
     quadratic_glyphs = []
     mixed_glyphs = []
-    for layer in ufo.ufo_font.layers:  # type: ignore
-        for glyph in layer:
-            point_types = set(
-                point.segmentType for contour in glyph for point in contour
-            )
+    for layer in ufo_glyph_facts:
+        for name, glyph in layer.glyphs.items():
+            point_types = glyph.segment_types
             if "curve" in point_types and "qcurve" in point_types:
-                mixed_glyphs.append(glyph.name)
+                mixed_glyphs.append(name)
             elif "curve" in point_types:
-                cubic_glyphs.append(glyph.name)
+                cubic_glyphs.append(name)
             elif "qcurve" in point_types:
-                quadratic_glyphs.append(glyph.name)
+                quadratic_glyphs.append(name)
 
     if mixed_glyphs:
         yield (
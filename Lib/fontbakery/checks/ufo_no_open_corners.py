@@ -11,27 +11,15 @@ from fontbakery import utils
     conditions=["ufo_font"],
     proposal="https://github.com/fonttools/fontbakery/pull/4808",
 )
-def check_ufo_no_open_corners(config, ufo):
+def check_ufo_no_open_corners(config, ufo_glyph_facts):
     """Check the sources have no corners"""
-    from glyphsLib.filters.eraseOpenCorners import EraseOpenCornersPen
-    from fontTools.pens.basePen import NullPen
-
-    font = ufo.ufo_font
-    for layer in font.layers:
-        offending_glyphs = []
-        for glyph in layer:
-            erase_open_corners = EraseOpenCornersPen(NullPen())
-            for contour in glyph:
-                contour.draw(erase_open_corners)
-            if erase_open_corners.affected:
-                offending_glyphs.append(glyph.name)
+    for layer in ufo_glyph_facts:
+        offending_glyphs = [
+            name for name, glyph in layer.glyphs.items() if glyph.open_corners
+        ]
 
         if offending_glyphs:
-            location_str = (
-                "Default layer"
-                if layer.name == font.layers.defaultLayer.name
-                else layer.name
-            )
+            location_str = "Default layer" if layer.is_default else layer.name
             yield (
                 FAIL,
                 Message(
@@ -10,26 +10,24 @@ from fontbakery.prelude import check, ERROR, FAIL, PASS, Message
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/1736",
 )
-def check_ufolint(ufo):
+def check_ufolint(ufo, ufolint_results):
     """Run ufolint on UFO source directory."""
 
     # IMPORTANT: This check cannot use the 'ufo_font' condition because it makes it
     # skip malformed UFOs (e.g. if metainfo.plist file is missing).
 
-    import subprocess
-
-    ufolint_cmd = ["ufolint", ufo.file]
+    outcome = ufolint_results[ufo.file]
+    if outcome is None:
+        yield ERROR, Message("ufolint-unavailable", "ufolint is not available!")
+        return
 
-    try:
-        subprocess.check_output(ufolint_cmd, stderr=subprocess.STDOUT)
-    except subprocess.CalledProcessError as e:
+    passed, output = outcome
+    if passed:
+        yield PASS, "ufolint passed the UFO source."
+    else:
         yield FAIL, Message(
             "ufolint-fail",
             ("ufolint failed the UFO source. Output follows :" "\n\n{}\n").format(
-                e.output.decode()
+                output
             ),
         )
-    except OSError:
-        yield ERROR, Message("ufolint-unavailable", "ufolint is not available!")
-    else:
-        yield PASS, "ufolint passed the UFO source."
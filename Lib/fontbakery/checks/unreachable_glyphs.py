@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 from fontbakery.prelude import check, Message, WARN, PASS
 from fontbakery.utils import bullet_list
 
@@ -18,59 +16,9 @@ from fontbakery.utils import bullet_list
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3160",
 )
-def unreachable_glyphs(ttFont, config):
+def unreachable_glyphs(ttFont, layout_graph, config):
     """Check font contains no unreachable glyphs"""
 
-    # remove_lookup_outputs() mutates the TTF; deep copy to avoid this, and so
-    # avoid issues with concurrent tests that also use ttFont.
-    # See https://github.com/fonttools/fontbakery/issues/4834
-    ttFont = deepcopy(ttFont)
-
-    def remove_lookup_outputs(all_glyphs, lookup):
-        if lookup.LookupType == 1:  # Single:
-            # Replace one glyph with one glyph
-            for sub in lookup.SubTable:
-                all_glyphs -= set(sub.mapping.values())
-
-        if lookup.LookupType == 2:  # Multiple:
-            # Replace one glyph with more than one glyph
-            for sub in lookup.SubTable:
-                for slot in sub.mapping.values():
-                    all_glyphs -= set(slot)
-
-        if lookup.LookupType == 3:  # Alternate:
-            # Replace one glyph with one of many glyphs
-            for sub in lookup.SubTable:
-                for slot in sub.alternates.values():
-                    all_glyphs -= set(slot)
-
-        if lookup.LookupType == 4:  # Ligature:
-            # Replace multiple glyphs with one glyph
-            for sub in lookup.SubTable:
-                for ligatures in sub.ligatures.values():
-                    all_glyphs -= set(lig.LigGlyph for lig in ligatures)
-
-        if lookup.LookupType in [5, 6]:
-            # We do nothing here, because these contextual lookup types don't
-            # generate glyphs directly; they only dispatch to other lookups
-            # stored elsewhere in the lookup list. As we are examining all
-            # lookups in the lookup list, other calls to this function will
-            # deal with the lookups that a contextual lookup references.
-            pass
-
-        if lookup.LookupType == 7:  # Extension Substitution:
-            # Extension mechanism for other substitutions
-            for xt in lookup.SubTable:
-                xt.SubTable = [xt.ExtSubTable]
-                xt.LookupType = xt.ExtSubTable.LookupType
-                remove_lookup_outputs(all_glyphs, xt)
-
-        if lookup.LookupType == 8:  # Reverse chaining context single:
-            # Applied in reverse order,
-            # replace single glyph in chaining context
-            for sub in lookup.SubTable:
-                all_glyphs -= set(sub.Substitute)
-
     all_glyphs = set(ttFont.getGlyphOrder())
 
     # Exclude cmapped glyphs
@@ -161,11 +109,8 @@ def unreachable_glyphs(ttFont, config):
                     if hasattr(paint, "Glyph"):
                         all_glyphs.discard(paint.Glyph)
 
-    if "GSUB" in ttFont and ttFont["GSUB"].table.LookupList:
-        lookups = ttFont["GSUB"].table.LookupList.Lookup
-
-        for lookup in lookups:
-            remove_lookup_outputs(all_glyphs, lookup)
+    # Exclude glyphs produced by substitution rules
+    all_glyphs -= layout_graph.substitution_outputs
 
     # Remove components used in TrueType table
     if "glyf" in ttFont:
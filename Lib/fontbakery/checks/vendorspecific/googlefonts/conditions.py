@@ -1,5 +1,7 @@
 import os
 import re
+from functools import lru_cache, partial
+
 import yaml
 
 from fontTools.ttLib.ttFont import TTFont
@@ -12,6 +14,7 @@ from fontbakery.constants import (
     UnicodeEncodingID,
     WindowsLanguageID,
 )
+from fontbakery.repertoires import register_repertoire, repertoire
 from fontbakery.utils import exit_with_install_instructions
 from fontbakery.checks.vendorspecific.googlefonts.utils import parse_html
 
@@ -102,7 +105,7 @@ def canonical_stylename(font):
         return s
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def article(font):
     """Read article/ARTICLE.en_us.html file from a font directory."""
     descfile = os.path.join(os.path.dirname(font.file), "article", "ARTICLE.en_us.html")
@@ -112,12 +115,12 @@ def article(font):
         return None
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def article_html(font):
     return parse_html(font.article)
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def descfile(font):
     """Get the path of the DESCRIPTION file of a given font project."""
     if font:
@@ -127,7 +130,7 @@ def descfile(font):
             return descfilepath
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def description(font):
     """Get the contents of the DESCRIPTION file of a font project."""
     if not font.descfile:
@@ -137,12 +140,12 @@ def description(font):
     return io.open(font.descfile, "r", encoding="utf-8").read()
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def description_html(font):
     return parse_html(font.description)
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def description_and_article(font):
     description = font.description
     article = font.article
@@ -154,7 +157,7 @@ def description_and_article(font):
     return result
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def description_and_article_html(font):
     description = font.description_html
     article = font.article_html
@@ -180,7 +183,7 @@ def metadata_file(font, metadata_pb=None):
             return pb_file
 
 
-@condition(Font)
+@condition(Font, cache_key="metadata_file")
 def family_metadata_text_content(font):
     if not font.metadata_file:
         return
@@ -188,7 +191,7 @@ def family_metadata_text_content(font):
     return open(font.metadata_file, "r", encoding="utf-8").read()
 
 
-@condition(Font)
+@condition(Font, cache_key="metadata_file")
 def family_metadata(font):
     if not font.metadata_file:
         return
@@ -321,12 +324,12 @@ def rfn_exception(font):
             return True
 
 
-@condition(Font)
+@condition(Font, heavy=True)
 def remote_styles(font):
     """Get a dictionary of TTFont objects of all font files of
     a given family as currently hosted at Google Fonts.
     """
-    from fontbakery.utils import download_file
+    from io import BytesIO
     import json
     import requests
 
@@ -337,7 +340,8 @@ def remote_styles(font):
     dl_url = "https://fonts.google.com/download/list?family={}"
     family_name = font.google_familyname
     url = dl_url.format(family_name.replace(" ", "%20"))
-    data = json.loads(requests.get(url, timeout=10).text[5:])
+    http_client = font.context.http_client
+    data = json.loads(http_client.get(url).text[5:])
     remote_fonts = []
     for item in data["manifest"]["fileRefs"]:
         filename = item["filename"]
@@ -346,9 +350,12 @@ def remote_styles(font):
             continue
         if not filename.endswith(("otf", "ttf")):
             continue
-        file_obj = download_file(dl_url)
-        if file_obj:
-            remote_fonts.append(TTFont(file_obj))
+        try:
+            response = http_client.get(dl_url)
+        except requests.RequestException:
+            continue
+        if response.ok:
+            remote_fonts.append(TTFont(BytesIO(response.content)))
 
     rstyles = {}
     for remote_font in remote_fonts:
@@ -365,7 +372,7 @@ def remote_styles(font):
     return rstyles
 
 
-@condition(Font)
+@condition(Font, heavy=True)
 def remote_style(font):
     font_style = font.ttFont["name"].getBestSubFamilyName()
     remote_styles = font.remote_styles
@@ -374,7 +381,7 @@ def remote_style(font):
     return remote_styles.get(font_style)
 
 
-@condition(Font)
+@condition(Font, heavy=True)
 def regular_remote_style(font):
     from fontbakery.checks.conditions import get_instance_axis_value
 
@@ -392,7 +399,7 @@ def regular_remote_style(font):
     return list(remote_styles.items())[0][1]
 
 
-@condition(CheckRunContext)
+@condition(CheckRunContext, heavy=True)
 def regular_ttFont(context):
     from fontbakery.checks.conditions import get_instance_axis_value
 
@@ -481,13 +488,11 @@ def production_metadata(context):
     if not context.network:
         return
 
-    import requests
-
     meta_url = "https://fonts.google.com/metadata/fonts"
-    return requests.get(meta_url, timeout=context.config.get("timeout")).json()
+    return context.http_client.get(meta_url).json()
 
 
-@condition(Font)
+@condition(Font, scope="directory")
 def upstream_yaml(font):
     fp = os.path.join(font.family_directory, "upstream.yaml")
     if not os.path.isfile(fp):
@@ -561,3 +566,60 @@ def is_claiming_to_be_cjk_font(font):
 
     # default, return False if the above checks did not identify a CJK font
     return False
+
+
+@lru_cache(maxsize=None)
+def gf_glyphsets():
+    """The names of the GF glyphsets, which are registered as repertoires
+    the first time this is called."""
+    from glyphsets import defined_glyphsets, unicodes_per_glyphset
+
+    names = tuple(defined_glyphsets())
+    for name in names:
+        register_repertoire(name, partial(unicodes_per_glyphset, name))
+    return names
+
+
+@lru_cache(maxsize=None)
+def _unique_in_glyphset(glyphset):
+    """The code points of a glyphset which are not in the basic Latin
+    glyphsets (whichever of GF_Latin_Core or GF_Latin_Kernel leaves more)."""
+    unique_core = repertoire(glyphset) - repertoire("GF_Latin_Core")
+    unique_kernel = repertoire(glyphset) - repertoire("GF_Latin_Kernel")
+    return unique_core if unique_core > unique_kernel else unique_kernel
+
+
+@condition(Font)
+def glyphsets_fulfilled(font):
+    """How much of each GF glyphset is covered by the font.
+
+    This gives the same results as glyphsets.get_glyphsets_fulfilled, but
+    uses the compiled repertoires instead of re-reading each glyphset's
+    definition files for every font."""
+    coverage = font.repertoire_coverage
+    res = {}
+    for glyphset in gf_glyphsets():
+        has = coverage.present(glyphset)
+        missing = coverage.missing(glyphset)
+        if has and not missing:
+            percentage = 1
+        elif glyphset in ("GF_Latin_Kernel", "GF_Latin_Core"):
+            total = len(repertoire(glyphset))
+            percentage = len(has) / total if total else 0
+        else:
+            unique = _unique_in_glyphset(glyphset)
+            percentage = len(has & unique) / len(unique) if unique else 0
+        res[glyphset] = {
+            "has": list(has),
+            "missing": list(missing),
+            "percentage": percentage,
+        }
+    return dict(sorted(res.items(), key=lambda x: x[1]["percentage"], reverse=True))
+
+
+@condition(CheckRunContext)
+def shaperglot_languages(collection):
+    """Shaperglot's language database, loaded once for all fonts."""
+    from shaperglot import Languages
+
+    return Languages()
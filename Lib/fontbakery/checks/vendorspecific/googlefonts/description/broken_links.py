@@ -14,7 +14,7 @@ from fontbakery.prelude import check, Message, FAIL, WARN
         "https://github.com/fonttools/fontbakery/issues/4829",  # legacy check
     ],
 )
-def check_description_broken_links(description_and_article_html, font):
+def check_description_broken_links(description_and_article_html, font, http_client):
     """Does DESCRIPTION file contain broken links?"""
     import requests
 
@@ -34,7 +34,7 @@ def check_description_broken_links(description_and_article_html, font):
 
             unique_links.append(link)
             try:
-                response = requests.head(link, allow_redirects=True, timeout=10)
+                response = http_client.head(link)
                 code = response.status_code
                 # Status 429: "Too Many Requests" is acceptable
                 # because it means the website is probably ok and
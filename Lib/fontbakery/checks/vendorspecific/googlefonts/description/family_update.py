@@ -4,7 +4,7 @@ from fontbakery.prelude import check, Message, WARN
 from fontbakery.testable import Font
 
 
-def github_gfonts_description(font: Font, network, config):
+def github_gfonts_description(font: Font, network, http_client):
     """Get the contents of the DESCRIPTION.en_us.html file
     from the google/fonts github repository corresponding
     to a given ttFont.
@@ -23,7 +23,7 @@ def github_gfonts_description(font: Font, network, config):
         f"/{LICENSE_DIRECTORY[license_file]}/{familyname}/DESCRIPTION.en_us.html"
     )
     try:
-        return requests.get(url, timeout=config.get("timeout")).text
+        return http_client.get(url).text
     except requests.RequestException:
         return None
 
@@ -41,11 +41,11 @@ def github_gfonts_description(font: Font, network, config):
     conditions=["description", "network"],
     proposal="https://github.com/fonttools/fontbakery/issues/3182",
 )
-def check_description_family_update(font, network, config):
+def check_description_family_update(font, network, http_client):
     """
     On a family update, the DESCRIPTION.en_us.html file should ideally also be updated.
     """
-    remote_description = github_gfonts_description(font, network, config)
+    remote_description = github_gfonts_description(font, network, http_client)
     if remote_description == font.description:
         yield WARN, Message(
             "description-not-updated",
@@ -1,6 +1,5 @@
-from glyphsets import languages_per_glyphset, get_glyphsets_fulfilled
+from glyphsets import languages_per_glyphset
 from shaperglot import Checker
-from shaperglot import Languages
 
 from fontbakery.prelude import check, Message, FAIL, WARN
 from fontbakery.utils import markdown_table
@@ -18,7 +17,9 @@ from fontbakery.utils import markdown_table
     ],  # use Shaperglot, which uses youseedee, which downloads Unicode files
     proposal=["https://github.com/googlefonts/fontbakery/issues/4147"],
 )
-def check_glyphsets_shape_languages(ttFont, config):
+def check_glyphsets_shape_languages(
+    ttFont, glyphsets_fulfilled, shaperglot_languages, config
+):
     """Shapes languages in all GF glyphsets."""
 
     def table_of_results(level, results):
@@ -36,12 +37,10 @@ def check_glyphsets_shape_languages(ttFont, config):
         return markdown_table(results_table)
 
     shaperglot_checker = Checker(ttFont.reader.file.name)
-    shaperglot_languages = Languages()
     any_glyphset_supported = False
 
     warns = {}
     fails = {}
-    glyphsets_fulfilled = get_glyphsets_fulfilled(ttFont)
     for glyphset in glyphsets_fulfilled:
         if glyphsets_fulfilled[glyphset]["percentage"] > 0.8:
             any_glyphset_supported = True
@@ -13,7 +13,7 @@ from fontbakery.prelude import check, Message, FAIL, WARN
         field of the METADATA.pb file are valid.
     """,
 )
-def check_metadata_broken_links(family_metadata):
+def check_metadata_broken_links(family_metadata, http_client):
     """Does METADATA.pb copyright field contain broken links?"""
     import requests
 
@@ -43,7 +43,7 @@ def check_metadata_broken_links(family_metadata):
 
             unique_links.append(link)
             try:
-                response = requests.head(link, allow_redirects=True, timeout=10)
+                response = http_client.head(link)
                 code = response.status_code
                 # Status 429: "Too Many Requests" is acceptable
                 # because it means the website is probably ok and
@@ -59,9 +59,7 @@ def check_metadata_broken_links(family_metadata):
                                 f"{protocol}//{domain}/{user}/"
                                 f"{repo}/tree/{branch}/{something}"
                             )
-                            response = requests.head(
-                                alternate_link, allow_redirects=True, timeout=10
-                            )
+                            response = http_client.head(alternate_link)
                             code = response.status_code
                             if code in [
                                 requests.codes.ok,
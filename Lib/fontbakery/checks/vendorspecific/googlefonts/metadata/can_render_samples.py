@@ -1,8 +1,6 @@
 from fontbakery.prelude import check, Message, FAIL, WARN
-from fontbakery.utils import (
-    can_shape,
-    exit_with_install_instructions,
-)
+from fontbakery.utils import unshapeable_texts
+from fontbakery.checks.vendorspecific.googlefonts.utils import GFLanguages
 
 
 @check(
@@ -18,21 +16,13 @@ from fontbakery.utils import (
         "https://github.com/fonttools/fontbakery/issues/3605",
     ],
 )
-def check_metadata_can_render_samples(ttFont, family_metadata):
+def check_metadata_can_render_samples(ttFont, family_metadata, layout_graph, shaper):
     """Check samples can be rendered."""
-    try:
-        from gflanguages import LoadLanguages
-    except ImportError:
-        exit_with_install_instructions("googlefonts")
-
-    languages = LoadLanguages()
+    languages = GFLanguages()
+    samples = []  # (lang, sample_text), or (lang, None) if there's no sample
     for lang in family_metadata.languages:
         if lang not in languages:
-            yield WARN, Message(
-                "no-sample-string",
-                f"Aparently there's no sample strings for"
-                f" '{lang}' in the gflanguages package.",
-            )
+            samples.append((lang, None))
             continue
 
         # Note: checking against all samples often results in
@@ -51,9 +41,26 @@ def check_metadata_can_render_samples(ttFont, family_metadata):
             # Remove line-breaks and zero width space (U+200B) characteres.
             # For more info, see https://github.com/fonttools/fontbakery/issues/3990
             sample_text = sample_text.replace("\n", "").replace("\u200b", "")
+            samples.append((lang, sample_text))
 
-            if not can_shape(ttFont, sample_text):
-                yield FAIL, Message(
-                    "sample-text",
-                    f'Font can\'t render "{lang}" sample text:\n"{sample_text}"\n',
-                )
+    # Shape all samples in one go, rather than loading the font once per sample.
+    failed = set(
+        unshapeable_texts(
+            ttFont,
+            [text for _, text in samples if text is not None],
+            layout_graph=layout_graph,
+            shaper=shaper,
+        )
+    )
+    for lang, sample_text in samples:
+        if sample_text is None:
+            yield WARN, Message(
+                "no-sample-string",
+                f"Aparently there's no sample strings for"
+                f" '{lang}' in the gflanguages package.",
+            )
+        elif sample_text in failed:
+            yield FAIL, Message(
+                "sample-text",
+                f'Font can\'t render "{lang}" sample text:\n"{sample_text}"\n',
+            )
@@ -17,9 +17,10 @@ from fontbakery.checks.vendorspecific.googlefonts.utils import (
         It also validates the URLs and file formats are all correctly set.
     """,
     conditions=["network", "family_metadata", "not is_noto"],
+    cache_key=["metadata_file"],
     proposal="https://github.com/fonttools/fontbakery/issues/3083",
 )
-def check_metadata_designer_profiles(family_metadata, config):
+def check_metadata_designer_profiles(family_metadata, http_client):
     """METADATA.pb: Designers are listed correctly on the Google Fonts catalog?"""
     DESIGNER_INFO_RAW_URL = (
         "https://raw.githubusercontent.com/google/fonts/master/catalog/designers/{}/"
@@ -72,13 +73,7 @@ def check_metadata_designer_profiles(family_metadata, config):
             continue
 
         url = DESIGNER_INFO_RAW_URL.format(normalized_name) + "info.pb"
-        response = requests.get(url, timeout=config.get("timeout"))
-
-        # https://github.com/fonttools/fontbakery/pull/3892#issuecomment-1248758859
-        # For debugging purposes:
-        # yield WARN,\
-        #      Message("config",
-        #              f"Config is '{config}'")
+        response = http_client.get(url)
 
         if response.status_code != requests.codes.OK:
             yield WARN, Message(
@@ -117,7 +112,7 @@ def check_metadata_designer_profiles(family_metadata, config):
             avatar_url = (
                 DESIGNER_INFO_RAW_URL.format(normalized_name) + info.avatar.file_name
             )
-            response = requests.get(avatar_url, timeout=config.get("timeout"))
+            response = http_client.get(avatar_url)
             if response.status_code != requests.codes.OK:
                 yield FAIL, Message(
                     "bad-avatar-filename",
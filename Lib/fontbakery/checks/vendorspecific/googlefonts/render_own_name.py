@@ -16,7 +16,7 @@ from fontbakery.utils import can_shape
     """,
     proposal="https://github.com/fonttools/fontbakery/issues/3159",
 )
-def check_render_own_name(ttFont):
+def check_render_own_name(ttFont, layout_graph, shaper):
     """Ensure font can render its own name."""
     menu_name = (
         ttFont["name"]
@@ -28,7 +28,7 @@ def check_render_own_name(ttFont):
         )
         .toUnicode()
     )
-    if not can_shape(ttFont, menu_name):
+    if not can_shape(ttFont, menu_name, layout_graph=layout_graph, shaper=shaper):
         yield FAIL, Message(
             "render-own-name",
             f".notdef glyphs were found when attempting to render {menu_name}",
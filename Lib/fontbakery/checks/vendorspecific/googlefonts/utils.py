@@ -2,7 +2,7 @@ import re
 from functools import lru_cache
 from pkg_resources import resource_filename
 
-from fontbakery.utils import exit_with_install_instructions
+from fontbakery.utils import exit_with_install_instructions, load_snapshot
 
 
 @lru_cache(maxsize=1)
@@ -12,20 +12,50 @@ def GFAxisRegistry():
     return AxisRegistry()
 
 
+@lru_cache(maxsize=1)
+def GFLanguages():
+    """The gflanguages language database, keyed by language code."""
+    try:
+        from importlib.metadata import version
+        from gflanguages import LoadLanguages, languages_public_pb2
+    except ImportError:
+        exit_with_install_instructions("googlefonts")
+
+    # Parsing the textproto files takes much longer than
+    # loading their binary serialization from a snapshot.
+    LanguageProto = languages_public_pb2.LanguageProto
+    return load_snapshot(
+        "gflanguages",
+        version("gflanguages"),
+        LoadLanguages,
+        encode=lambda langs: {k: v.SerializeToString() for k, v in langs.items()},
+        decode=lambda langs: {k: LanguageProto.FromString(v) for k, v in langs.items()},
+    )
+
+
 @lru_cache(maxsize=1)
 def registered_vendor_ids():
     """Get a list of vendor IDs from Microsoft's website."""
+    import hashlib
 
+    CACHED = resource_filename(
+        "fontbakery", "data/fontbakery-microsoft-vendorlist.cache"
+    )
+    content = open(CACHED, encoding="utf-8").read()
+    return load_snapshot(
+        "vendorlist",
+        hashlib.sha1(content.encode("utf-8")).hexdigest(),
+        lambda: parse_vendor_list(content),
+    )
+
+
+def parse_vendor_list(content):
     try:
         from bs4 import BeautifulSoup, NavigableString
     except ImportError:
         exit_with_install_instructions("googlefonts")
 
     registered_vendor_ids = {}
-    CACHED = resource_filename(
-        "fontbakery", "data/fontbakery-microsoft-vendorlist.cache"
-    )
-    content = open(CACHED, encoding="utf-8").read()
     # Strip all <A> HTML tags from the raw HTML. The current page contains a
     # closing </A> for which no opening <A> is present, which causes
     # beautifulsoup to silently stop processing that section from the error
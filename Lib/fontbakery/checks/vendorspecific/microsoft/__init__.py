@@ -1,11 +1,20 @@
 from fontbakery.prelude import PASS, FAIL
+from fontbakery.repertoires import register_repertoire
+from fontbakery.checks.vendorspecific.microsoft.character_repertoires import (
+    OGL2,
+    WGL4_OPTIONAL,
+    WGL4_REQUIRED,
+)
 
+register_repertoire("OGL2", OGL2)
+register_repertoire("WGL4", WGL4_REQUIRED)
+register_repertoire("WGL4_OPTIONAL", WGL4_OPTIONAL)
 
-def check_repertoire(ttFont, character_repertoire, name, error_status=FAIL):
-    charset = set(ttFont["cmap"].getBestCmap())
-    missing = character_repertoire - charset
+
+def check_repertoire(repertoire_coverage, name, error_status=FAIL):
+    missing = repertoire_coverage.missing(name)
     if missing:
-        missing_formatted = ", ".join(f"0x{v:04X}" for v in sorted(missing))
+        missing_formatted = ", ".join(f"0x{v:04X}" for v in missing)
         yield error_status, (
             f"character repertoire not complete for {name}; missing: {missing_formatted}"
         )
@@ -1,6 +1,5 @@
 from fontbakery.prelude import check
 from fontbakery.checks.vendorspecific.microsoft import check_repertoire
-from fontbakery.checks.vendorspecific.microsoft.character_repertoires import OGL2
 
 
 # FIXME: There's no way to run this check, as it is not included in any profile!
@@ -11,7 +10,7 @@ from fontbakery.checks.vendorspecific.microsoft.character_repertoires import OGL
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/4657",
 )
-def check_office_ogl2(ttFont):
+def check_office_ogl2(repertoire_coverage):
     """OGL2 compliance."""
 
-    yield from check_repertoire(ttFont, OGL2, "OGL2")
+    yield from check_repertoire(repertoire_coverage, "OGL2")
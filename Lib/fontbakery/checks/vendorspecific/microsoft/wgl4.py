@@ -1,9 +1,5 @@
 from fontbakery.prelude import check, WARN
 from fontbakery.checks.vendorspecific.microsoft import check_repertoire
-from fontbakery.checks.vendorspecific.microsoft.character_repertoires import (
-    WGL4_OPTIONAL,
-    WGL4_REQUIRED,
-)
 
 
 # FIXME: There's no way to run this check, as it is not included in any profile!
@@ -14,10 +10,8 @@ from fontbakery.checks.vendorspecific.microsoft.character_repertoires import (
     """,
     proposal="https://github.com/fonttools/fontbakery/pull/4657",
 )
-def check_office_wgl4(ttFont):
+def check_office_wgl4(repertoire_coverage):
     """WGL4 compliance."""
 
-    yield from check_repertoire(ttFont, WGL4_REQUIRED, "WGL4")
-    yield from check_repertoire(
-        ttFont, WGL4_OPTIONAL, "WGL4_OPTIONAL", error_status=WARN
-    )
+    yield from check_repertoire(repertoire_coverage, "WGL4")
+    yield from check_repertoire(repertoire_coverage, "WGL4_OPTIONAL", error_status=WARN)
@@ -2,12 +2,12 @@ from fontbakery.testable import CheckRunContext
 from fontbakery.prelude import check, condition, Message, PASS, WARN
 
 
-@condition(CheckRunContext)
+@condition(CheckRunContext, heavy=True)
 def roman_ttFonts(context):
     return [font.ttFont for font in context.fonts if not font.is_italic]
 
 
-@condition(CheckRunContext)
+@condition(CheckRunContext, heavy=True)
 def italic_ttFonts(context):
     return [font.ttFont for font in context.fonts if font.is_italic]
 
@@ -3,8 +3,11 @@ from fontbakery.utils import (
     bullet_list,
     exit_with_install_instructions,
 )
+from fontbakery.repertoires import register_repertoire
 from fontbakery.checks.vendorspecific.typenetwork.glyphsets import TN_latin_set
 
+register_repertoire("TN_Latin", TN_latin_set)
+
 
 @check(
     id="typenetwork/glyph_coverage",
@@ -15,17 +18,15 @@ from fontbakery.checks.vendorspecific.typenetwork.glyphsets import TN_latin_set
     conditions=["font_codepoints"],
     proposal=["https://github.com/fonttools/fontbakery/pull/4260"],
 )
-def check_glyph_coverage(ttFont, font_codepoints, config):
+def check_glyph_coverage(ttFont, repertoire_coverage, config):
     """Check Type Network minimum glyph coverage."""
     try:
         import unicodedata2
     except ImportError:
         exit_with_install_instructions("typenetwork")
 
-    required_codepoints = set(TN_latin_set)
-    diff = required_codepoints - font_codepoints
     missing = []
-    for c in sorted(diff):
+    for c in repertoire_coverage.missing("TN_Latin"):
         try:
             missing.append("uni%04X %s (%s)\n" % (c, chr(c), unicodedata2.name(chr(c))))
         except ValueError:
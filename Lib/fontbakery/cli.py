@@ -3,11 +3,14 @@
 # $ fontbakery check-profile fontbakery.profiles.googlefonts -h
 import argparse
 from collections import OrderedDict
+import json
+import logging
 import os
 import sys
 import signal
 
 from fontbakery import __version__
+from fontbakery.artifacts import artifact_store_of
 from fontbakery.checkrunner import CheckRunner
 from fontbakery.status import (
     DEBUG,
@@ -27,6 +30,7 @@ from fontbakery.fonts_profile import (
     setup_context,
     ITERARGS,
 )
+from fontbakery.planner import Planner, TimingHistory, print_plan
 from fontbakery.reporters.terminal import TerminalReporter
 from fontbakery.reporters.serialize import JSONReporter
 from fontbakery.reporters.badge import BadgeReporter
@@ -104,10 +108,152 @@ def ArgumentParser():
             )
         add_profile_arguments(subparser)
 
-    argument_parser.subcommands = subcommands
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a local check server, which keeps profiles and caches loaded.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    add_server_arguments(serve_parser)
+    serve_parser.add_argument(
+        "--preload",
+        action="append",
+        default=[],
+        metavar="PROFILE",
+        help="Load this profile at startup rather than on its first job.\n"
+        "Use this option multiple times to preload multiple profiles.",
+    )
+    serve_parser.add_argument(
+        "--allow-profile",
+        action="append",
+        default=[],
+        metavar="PROFILE",
+        help="Let jobs use this profile module or file, besides the built-in\n"
+        "profiles. Use this option multiple times to allow multiple profiles.",
+    )
+    serve_parser.add_argument(
+        "--workers",
+        default=2,
+        type=int,
+        help="How many jobs may run at the same time. (default: %(default)s)",
+    )
+    serve_parser.add_argument(
+        "-J",
+        "--jobs",
+        default=1,
+        type=int,
+        dest="multiprocessing",
+        help="Worker threads used to run the checks of each job."
+        " (default: %(default)s)",
+    )
+    serve_parser.add_argument(
+        "--record-timings",
+        action="store_true",
+        help="Remember how long each check took, to estimate the duration\n"
+        "of later runs with --plan.",
+    )
+
+    submit_parser = subparsers.add_parser(
+        "submit",
+        help="Run checks on a server started with `fontbakery serve`.",
+        formatter_class=argparse.RawTextHelpFormatter,
+    )
+    add_server_arguments(submit_parser)
+    add_submit_arguments(submit_parser)
+
+    argument_parser.subcommands = subcommands + ["serve", "submit"]
     return argument_parser
 
 
+def add_server_arguments(argument_parser):
+    from fontbakery.server import DEFAULT_PORT, default_socket_path
+
+    address_group = argument_parser.add_mutually_exclusive_group()
+    address_group.add_argument(
+        "--socket",
+        default=None,
+        metavar="PATH",
+        help="Unix socket of the check server." f" (default: {default_socket_path()})",
+    )
+    address_group.add_argument(
+        "--port",
+        default=None,
+        type=int,
+        help="Use a local TCP port instead of a Unix socket,\n" f"e.g. {DEFAULT_PORT}.",
+    )
+
+
+def add_submit_arguments(argument_parser):
+    argument_parser.add_argument(
+        "profile",
+        help="Profile to check the files against: the name of one of the\n"
+        "built-in profiles (e.g. googlefonts) or a profile module/file.",
+        metavar="PROFILE",
+    )
+    argument_parser.add_argument(
+        "--configuration",
+        dest="configfile",
+        help="Read configuration file (TOML/YAML).\n",
+    )
+    argument_parser.add_argument(
+        "-c",
+        "--checkid",
+        action="append",
+        help="Explicit check-ids (or parts of their name) to be executed.",
+    )
+    argument_parser.add_argument(
+        "-x",
+        "--exclude-checkid",
+        action="append",
+        help="Exclude check-ids (or parts of their name) from execution.",
+    )
+    argument_parser.add_argument(
+        "--skip-network",
+        default=False,
+        action="store_true",
+        help="Skip network checks",
+    )
+
+    valid_keys = ", ".join(log_levels.keys())
+
+    def log_levels_get(key):
+        if key in log_levels:
+            return log_levels[key]
+        raise argparse.ArgumentTypeError(f'Key "{key}" must be one of: {valid_keys}.')
+
+    argument_parser.add_argument(
+        "-l",
+        "--loglevel",
+        dest="loglevel",
+        type=log_levels_get,
+        default=DEFAULT_LOG_LEVEL,
+        metavar="LOGLEVEL",
+        help=f"Report checks with a result of this status or higher.\n"
+        f"One of: {valid_keys}.\n"
+        f"(default: {DEFAULT_LOG_LEVEL.name})",
+    )
+    argument_parser.add_argument(
+        "-e",
+        "--error-code-on",
+        dest="error_code_on",
+        type=log_levels_get,
+        default=DEFAULT_ERROR_CODE_ON,
+        help=f"Threshold for emitting process error code 1.\n"
+        f"One of: {valid_keys}.\n"
+        f"(default: {DEFAULT_ERROR_CODE_ON.name})",
+    )
+    argument_parser.add_argument(
+        "--json",
+        default=None,
+        metavar="JSON_FILE",
+        help="Write a json formatted report to JSON_FILE.",
+    )
+    argument_parser.add_argument(
+        "files",
+        nargs="+",
+        help="file path(s) to check. Wildcards like *.ttf are allowed.",
+    )
+
+
 def add_profile_arguments(argument_parser):
     argument_parser.add_argument(
         "-L",
@@ -117,6 +263,36 @@ def add_profile_arguments(argument_parser):
         help="List the checks available in the selected profile.",
     )
 
+    argument_parser.add_argument(
+        "--plan",
+        dest="plan",
+        action="store_const",
+        const="text",
+        help=(
+            "Don't run the checks. Instead, report how many times each of\n"
+            "them would run, the conditions they need, which of those use\n"
+            "the network or run other programs, and an estimate of how long\n"
+            "the run would take, based on the timings of previous runs."
+        ),
+    )
+
+    argument_parser.add_argument(
+        "--plan-json",
+        dest="plan",
+        action="store_const",
+        const="json",
+        help="Like --plan, but print the report as JSON.",
+    )
+
+    argument_parser.add_argument(
+        "--record-timings",
+        action="store_true",
+        help=(
+            "Remember how long each check took on this run, to estimate the\n"
+            "duration of later runs with --plan."
+        ),
+    )
+
     argument_parser.add_argument(
         "--configuration",
         dest="configfile",
@@ -291,16 +467,16 @@ def add_profile_arguments(argument_parser):
         help="Use a color theme with light colors.",
     )
 
-    network_group = argument_parser.add_argument_group(
+    network_options = argument_parser.add_argument_group(
         "Network", "Network related options"
     )
-    network_group = network_group.add_mutually_exclusive_group()
+    network_group = network_options.add_mutually_exclusive_group()
 
     network_group.add_argument(
         "--timeout",
-        default=10,
+        default=None,
         type=int,
-        help="Timeout (in seconds) for network operations.",
+        help="Timeout (in seconds) for network operations. (default: 10)",
     )
 
     network_group.add_argument(
@@ -310,6 +486,24 @@ def add_profile_arguments(argument_parser):
         help="Skip network checks",
     )
 
+    http_fixtures = network_options.add_mutually_exclusive_group()
+
+    http_fixtures.add_argument(
+        "--http-record",
+        default=None,
+        metavar="DIR",
+        help="Save the responses to all network requests in this directory,"
+        " to be used later with --http-replay.",
+    )
+
+    http_fixtures.add_argument(
+        "--http-replay",
+        default=None,
+        metavar="DIR",
+        help="Don't access the network; instead, answer network requests"
+        " with the responses previously saved by --http-record.",
+    )
+
     report_group = argument_parser.add_argument_group(
         "Reports", "Options which control report generation"
     )
@@ -350,6 +544,15 @@ def add_profile_arguments(argument_parser):
         help="Write a HTML report to HTML_FILE.",
     )
 
+    report_group.add_argument(
+        "--artifacts-dir",
+        default=None,
+        metavar="DIRECTORY",
+        help="Keep large payloads of the check results (e.g. renderings of\n"
+        "shaping failures) as files in DIRECTORY, which the reports link\n"
+        "to, instead of embedding them in every report.",
+    )
+
     def positive_int(value):
         int_value = int(value)
         if int_value < 0:
@@ -423,6 +626,10 @@ def main():
     elif args.command is None:
         argument_parser.print_usage()
         sys.exit(2)
+    elif args.command == "serve":
+        return serve(args)
+    elif args.command == "submit":
+        return submit(args)
 
     theme = get_theme(args)
 
@@ -463,6 +670,10 @@ def main():
             exclude_checks=exclude_checks,
             full_lists=args.full_lists,
             skip_network=args.skip_network,
+            timeout=args.timeout,
+            http_record=args.http_record,
+            http_replay=args.http_replay,
+            artifacts_dir=args.artifacts_dir,
         )
     )
 
@@ -479,6 +690,14 @@ def main():
         argument_parser.print_usage()
         sys.exit(1)
 
+    if args.plan:
+        report = Planner(runner).report()
+        if args.plan == "json":
+            print(json.dumps(report, indent=2))
+        else:
+            print_plan(report)
+        sys.exit(0)
+
     if not args.loglevels:
         args.loglevels = [
             status
@@ -516,8 +735,15 @@ def main():
 
     runner.run(reporters)
 
+    if args.record_timings:
+        history = TimingHistory()
+        history.update(runner.timings)
+        history.save()
+
     for reporter in reporters:
         reporter.write()
+    if artifact_store_of(runner) is not None:
+        artifact_store_of(runner).cleanup()
 
     # Fail and error let the command fail
     return (
@@ -528,6 +754,102 @@ def main():
     )
 
 
+def serve(args):
+    from fontbakery.server import CheckService, make_server, server_address
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    service = CheckService(
+        workers=args.workers,
+        jobs=args.multiprocessing,
+        record_timings=args.record_timings,
+        profiles=args.allow_profile
+        + [name for name in args.preload if name not in CLI_PROFILES],
+    )
+    service.warm(args.preload)
+    args.port, args.socket = server_address(args.port, args.socket)
+    server = make_server(service, port=args.port, socket_path=args.socket)
+    address = args.socket or f"http://127.0.0.1:{args.port}"
+    print(f"FontBakery {__version__} is ready for check jobs at {address}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+def submit(args):
+    import glob
+    from fontbakery.server import submit_job
+
+    if args.configfile:
+        configuration = Configuration.from_config_file(args.configfile)
+    else:
+        configuration = Configuration()
+    configuration.maybe_override(
+        Configuration(
+            explicit_checks=[c.replace("-", "_") for c in args.checkid or []] or None,
+            exclude_checks=[x.replace("-", "_") for x in args.exclude_checkid or []]
+            or None,
+            skip_network=args.skip_network or None,
+        )
+    )
+    # The server may well run in another directory.
+    files = [
+        os.path.abspath(path)
+        for pattern in args.files
+        for path in (glob.glob(pattern) or [pattern])
+    ]
+    profile = args.profile
+    if os.path.isfile(profile):
+        profile = os.path.abspath(profile)
+    job = {"profile": profile, "files": files, "config": dict(configuration)}
+
+    worst_status = None
+    try:
+        for item in submit_job(job, port=args.port, socket_path=args.socket):
+            if "error" in item:
+                print(f"ERROR: {item['error']}")
+                return 1
+            if "report" in item:
+                if args.json:
+                    with open(args.json, "w", encoding="utf-8") as fh:
+                        json.dump(item["report"], fh, sort_keys=True, indent=4)
+                print(
+                    ", ".join(
+                        f"{name}: {count}"
+                        for name, count in sorted(item["report"]["result"].items())
+                        if count
+                    )
+                )
+                continue
+            check = item["check"]
+            status = log_levels[check["result"]]
+            if not check["experimental"] and (
+                worst_status is None or status > worst_status
+            ):
+                worst_status = status
+            if status < args.loglevel:
+                continue
+            filename = check.get("filename")
+            where = f" [{filename}]" if filename else ""
+            print(f"{status.name}: {item['check_id']}{where}")
+            for log in check["logs"]:
+                if log_levels[log["status"]] >= args.loglevel:
+                    code = log["message"].get("code")
+                    code = f" [code: {code}]" if code else ""
+                    print(f"    {log['status']} {log['message']['message']}{code}")
+    except (ConnectionError, FileNotFoundError) as e:
+        print(f"Could not reach the check server: {e}")
+        return 2
+    except ValueValidationError as e:
+        print(e)
+        return 1
+
+    return 1 if worst_status is not None and worst_status >= args.error_code_on else 0
+
+
 def list_checks(profile, theme, verbose=False):
     if verbose:
         for section in profile.sections:
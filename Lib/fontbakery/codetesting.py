@@ -14,6 +14,9 @@
 # limitations under the License.
 #
 from functools import cached_property
+from io import BytesIO
+import os
+import threading
 from typing import Iterable, Optional
 
 import defcon
@@ -32,6 +35,7 @@ from fontbakery.profile import Profile
 from fontbakery.profile import Section
 from fontbakery.testable import FILE_TYPES, CheckRunContext, Font, GlyphsFile, Ufo
 from fontbakery.result import Subresult
+from fontbakery.utils import font_shaper
 
 PATH_TEST_DATA = "data/test/"
 PATH_TEST_DATA_GLYPHS_FILES = f"{PATH_TEST_DATA}glyphs_files/"
@@ -74,6 +78,70 @@ MockGlyphsFile = make_mock(GlyphsFile, "MockGlyphsFile")
 MockUfo = make_mock(Ufo, "MockUfo")
 
 
+class TestFontCache:
+    """Parsed test fonts, kept for the whole test session.
+
+    `get` hands out one shared TTFont per file, which must be treated as
+    read-only: CheckTester uses it for the fonts given to it by path, as
+    checks never modify the fonts they look at.
+
+    `copy` hands out a private TTFont for tests which modify their font. It
+    is read from the file's bytes already in memory, and decompiles only
+    the tables that the test actually uses.
+
+    Fonts are cached by path, size and modification time, so files rewritten
+    during the session are read again. Each process has its own cache, so
+    this is safe with pytest-xdist.
+    """
+
+    __test__ = False  # Not a test class, despite the name.
+
+    def __init__(self):
+        self._data = {}
+        self._fonts = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path):
+        stat = os.stat(path)
+        return (os.path.realpath(path), stat.st_size, stat.st_mtime_ns)
+
+    def _read(self, path, key):
+        if key not in self._data:
+            with open(path, "rb") as f:
+                self._data[key] = f.read()
+        return self._data[key]
+
+    def get(self, path):
+        from fontTools.ttLib import TTFont
+
+        key = self._key(path)
+        with self._lock:
+            if key not in self._fonts:
+                self._fonts[key] = TTFont(path)
+            return self._fonts[key]
+
+    def copy(self, path):
+        from fontTools.ttLib import TTFont
+
+        key = self._key(path)
+        with self._lock:
+            data = BytesIO(self._read(path, key))
+        data.name = path  # Checks look at the name of the file it came from.
+        return TTFont(data)
+
+
+test_fonts = TestFontCache()
+
+
+class CachedFont(Font):
+    """A Font which reads its TTFont from the session's test font cache."""
+
+    @cached_property
+    def ttFont(self):
+        return test_fonts.get(self.file)
+
+
 class CheckTester:
     """
     This class offers a bit of automation to aid in the implementation of
@@ -102,6 +170,18 @@ class CheckTester:
             )
         self.check_id = check_id
 
+    @cached_property
+    def runner(self):
+        """A runner for just this check, set up once and then handed the
+        context of each call."""
+        runner = CheckRunner(
+            self.profile,
+            CheckRunContext([]),
+            Configuration(explicit_checks=[self.check_id], full_lists=True),
+        )
+        runner.catch_errors = False
+        return runner
+
     def __call__(
         self, values, condition_overrides=None, config=None
     ) -> Iterable[Subresult]:
@@ -114,6 +194,11 @@ class CheckTester:
             context = values
         elif isinstance(values, str):
             context = setup_context([values])
+            context.testables = [
+                # pylint: disable=unidiomatic-typecheck
+                CachedFont(testable.file) if type(testable) is Font else testable
+                for testable in context.testables
+            ]
         elif hasattr(values, "mocked"):
             context = CheckRunContext([values])
         elif isinstance(values, list) and all(hasattr(v, "mocked") for v in values):
@@ -128,22 +213,20 @@ class CheckTester:
             context = CheckRunContext([])
             for value in values:
                 if isinstance(value, TTFont):
+                    # The font may have been changed in memory, so it is
+                    # shaped as it is rather than as it is on disk.
                     context.testables.append(
-                        MockFont(ttFont=value, file=value.reader.file.name)
+                        MockFont(
+                            ttFont=value,
+                            file=value.reader.file.name,
+                            shaper=font_shaper(value),
+                        )
                     )
                 elif isinstance(value, GSFont):
                     context.testables.append(MockGlyphsFile(gsfont=value))
                 elif isinstance(value, defcon.Font):
                     context.testables.append(MockUfo(ufo_font=value))
-        for testable in context.testables:
-            testable.context = context
-
-        runner = CheckRunner(
-            self.profile,
-            context,
-            Configuration(explicit_checks=[self.check_id], full_lists=True),
-        )
-        runner.catch_errors = False
+        runner = self.runner.with_context(context)
         if config:
             for key, value in config.items():
                 context.config[key] = value
@@ -167,6 +250,11 @@ def TEST_FILE(f):
     return portable_path(f"{PATH_TEST_DATA}{f}")
 
 
+def TEST_FONT(f):
+    """A private copy of a test font, for tests which modify it."""
+    return test_fonts.copy(TEST_FILE(f))
+
+
 def GLYPHSAPP_TEST_FILE(f):
     import glyphsLib
 
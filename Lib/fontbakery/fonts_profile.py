@@ -9,11 +9,15 @@ import os
 import pkgutil
 import warnings
 
-from fontTools.ttLib.sfnt import readTTCHeader
 
 import fontbakery.checks
 from fontbakery.callable import FontBakeryCheck
-from fontbakery.testable import CheckRunContext, FILE_TYPES, TTCFont
+from fontbakery.testable import (
+    CheckRunContext,
+    FILE_TYPES,
+    FontCollection,
+    TTCFont,
+)
 from fontbakery.errors import ValueValidationError
 from fontbakery.profile import Profile, Section
 
@@ -34,11 +38,11 @@ def setup_context(files):
             # Special case for .ttc files, which add multiple testables
             # to the context.
             if file.endswith(".ttc") or file.endswith(".otc"):
-                with open(file, "rb") as ttcfile:
-                    ttc = readTTCHeader(ttcfile)
-                    for i in range(ttc.numFonts):
-                        context.testables.append(TTCFont(file, index=i))
-                    accepted = True
+                collection = FontCollection(file)
+                for i in range(collection.num_fonts):
+                    context.testables.append(
+                        TTCFont(file, index=i, collection=collection)
+                    )
                 continue
             for filetype in FILE_TYPES:
                 if file.endswith(tuple(filetype.extensions)):
@@ -0,0 +1,164 @@
+"""
+The HTTP client shared by all online checks of a run.
+
+It keeps a pooled `requests.Session`, caps how many requests may be in
+flight to a single host, retries transient failures with backoff, and
+only performs each distinct GET/HEAD request once per run. Large responses
+(such as font downloads) are only shared by the callers which asked for
+them at the same time, and are not kept for the rest of the run.
+
+Responses can also be recorded into a directory and replayed from there
+later, which makes runs of the online checks deterministic and fast
+(e.g. on CI).
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+DEFAULT_TIMEOUT = 10
+MAX_CACHED_SIZE = 1024 * 1024  # Larger bodies are only kept if they are JSON
+
+
+class HTTPClient:
+    def __init__(
+        self,
+        timeout=None,
+        retries=2,
+        backoff_factor=0.5,
+        max_per_host=4,
+        record_dir=None,
+        replay_dir=None,
+    ):
+        self.timeout = timeout or DEFAULT_TIMEOUT
+        self.max_per_host = max_per_host
+        self.record_dir = record_dir
+        self.replay_dir = replay_dir
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=max_per_host,
+            max_retries=Retry(
+                total=retries,
+                read=0,  # Don't wait for slow servers over and over again
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                backoff_factor=backoff_factor,
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._lock = threading.Lock()
+        self._host_slots = defaultdict(
+            lambda: threading.BoundedSemaphore(self.max_per_host)
+        )
+        self._request_locks = defaultdict(threading.Lock)
+        self._waiting = defaultdict(int)  # Callers of each request in flight
+        self._responses = {}
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def request(self, method, url, allow_redirects=True):
+        """Performs a request, or returns the response (or raises the same
+        kind of exception) that the same request got earlier in this run."""
+        key = (method, url, allow_redirects)
+        with self._lock:
+            self._waiting[key] += 1
+            request_lock = self._request_locks[key]
+        try:
+            with request_lock:
+                if key not in self._responses:
+                    try:
+                        self._responses[key] = self._fetch(method, url, allow_redirects)
+                    except requests.RequestException as err:
+                        # Don't keep the frames of the failed request alive.
+                        self._responses[key] = err.with_traceback(None)
+                result = self._responses[key]
+        finally:
+            with self._lock:
+                self._waiting[key] -= 1
+                if not self._waiting[key]:
+                    del self._waiting[key]
+                    del self._request_locks[key]
+                    if not self._keep(self._responses.get(key)):
+                        self._responses.pop(key, None)
+        if isinstance(result, Exception):
+            # Each caller gets an exception of its own to raise.
+            raise type(result)(
+                *result.args, request=result.request, response=result.response
+            ) from result
+        return result
+
+    def _keep(self, result):
+        """Whether a result is small (or useful) enough to be kept for
+        later requests, once nobody is waiting for it any more."""
+        if result is None or isinstance(result, Exception):
+            return True
+        if "json" in result.headers.get("Content-Type", ""):
+            return True
+        return len(result.content) <= MAX_CACHED_SIZE
+
+    def _fetch(self, method, url, allow_redirects):
+        if self.replay_dir:
+            return self._replay(method, url)
+
+        with self._lock:
+            slot = self._host_slots[urlsplit(url).netloc]
+        with slot:
+            response = self.session.request(
+                method, url, allow_redirects=allow_redirects, timeout=self.timeout
+            )
+        if self.record_dir:
+            self._record(method, url, response)
+        return response
+
+    def _fixture_path(self, directory, method, url):
+        digest = hashlib.sha1(f"{method} {url}".encode("utf-8")).hexdigest()
+        return os.path.join(directory, f"{digest}.json")
+
+    def _record(self, method, url, response):
+        os.makedirs(self.record_dir, exist_ok=True)
+        fixture = {
+            "method": method,
+            "url": url,
+            "status_code": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        path = self._fixture_path(self.record_dir, method, url)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, indent=2)
+
+    def _replay(self, method, url):
+        path = self._fixture_path(self.replay_dir, method, url)
+        if not os.path.exists(path):
+            raise requests.ConnectionError(
+                f"No recorded response for {method} {url} in {self.replay_dir}"
+            )
+        with open(path, encoding="utf-8") as f:
+            fixture = json.load(f)
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = fixture["status_code"]
+        response.reason = fixture["reason"]
+        response.headers = CaseInsensitiveDict(fixture["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = base64.b64decode(fixture["content"])
+        return response
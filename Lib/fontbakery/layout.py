@@ -0,0 +1,191 @@
+"""
+A read-only view of the GSUB and GPOS tables of a font.
+
+Features, lookups and subtables are walked once, with Extension subtables
+resolved to the subtables they wrap, so that layout checks can share a
+single traversal instead of each re-walking (or deep-copying) the tables.
+The font itself is never modified.
+"""
+from functools import cached_property
+
+EXTENSION_LOOKUP_TYPES = {"GSUB": 7, "GPOS": 9}
+
+
+class Lookup:
+    """A GSUB or GPOS lookup, with its Extension subtables resolved."""
+
+    def __init__(self, table_tag, index, lookup):
+        self.table_tag = table_tag
+        self.index = index
+        self.lookup = lookup
+        self.features = set()
+
+        self.subtables = []
+        for subtable in lookup.SubTable:
+            if lookup.LookupType == EXTENSION_LOOKUP_TYPES[table_tag]:
+                subtable = subtable.ExtSubTable
+            self.subtables.append(subtable)
+
+    @property
+    def type(self):
+        if self.subtables:
+            return self.subtables[0].LookupType
+        return self.lookup.LookupType
+
+    def __repr__(self):
+        return f"<Lookup {self.table_tag}:{self.index} type {self.type}>"
+
+
+def substitution_pairs(subtable):
+    """Yields (input glyph, output glyphs) for a GSUB subtable."""
+    lookup_type = subtable.LookupType
+    if lookup_type == 1:  # Single
+        for glyph, output in subtable.mapping.items():
+            yield glyph, (output,)
+    elif lookup_type == 2:  # Multiple
+        for glyph, outputs in subtable.mapping.items():
+            yield glyph, tuple(outputs)
+    elif lookup_type == 3:  # Alternate
+        for glyph, alternates in subtable.alternates.items():
+            yield glyph, tuple(alternates)
+    elif lookup_type == 4:  # Ligature
+        for first_glyph, ligatures in subtable.ligatures.items():
+            for ligature in ligatures:
+                for glyph in [first_glyph] + list(ligature.Component):
+                    yield glyph, (ligature.LigGlyph,)
+    elif lookup_type == 8:  # Reverse chaining context single
+        for glyph, output in zip(subtable.Coverage.glyphs, subtable.Substitute):
+            yield glyph, (output,)
+    # Types 5 and 6 only dispatch to other lookups in the lookup list,
+    # which are visited on their own.
+
+
+class LayoutTable:
+    """The features, scripts and lookups of a GSUB or GPOS table."""
+
+    def __init__(self, ttFont, table_tag):
+        self.tag = table_tag
+        self.lookups = []
+        self.features = {}  # feature tag => lookup indices, in feature order
+        self.script_tags = set()
+        self.language_tags = set()
+
+        if table_tag not in ttFont:
+            return
+        table = ttFont[table_tag].table
+
+        if table.LookupList:
+            self.lookups = [
+                Lookup(table_tag, index, lookup)
+                for index, lookup in enumerate(table.LookupList.Lookup)
+            ]
+
+        if table.FeatureList:
+            for record in table.FeatureList.FeatureRecord:
+                indices = self.features.setdefault(record.FeatureTag, [])
+                for index in record.Feature.LookupListIndex:
+                    indices.append(index)
+                    if index < len(self.lookups):
+                        self.lookups[index].features.add(record.FeatureTag)
+
+        if table.ScriptList:
+            for record in table.ScriptList.ScriptRecord:
+                self.script_tags.add(record.ScriptTag)
+                for lang_sys in record.Script.LangSysRecord:
+                    self.language_tags.add(lang_sys.LangSysTag)
+
+    @property
+    def feature_tags(self):
+        return set(self.features)
+
+    def feature_lookups(self, feature_tag):
+        """The lookups referenced by a feature, in feature record order."""
+        return [
+            self.lookups[index]
+            for index in self.features.get(feature_tag, [])
+            if index < len(self.lookups)
+        ]
+
+    def subtables(self, lookup_type=None, feature_tag=None):
+        """All (resolved) subtables, optionally of a single lookup type
+        and/or reachable from a single feature."""
+        if feature_tag is None:
+            lookups = self.lookups
+        else:
+            lookups = self.feature_lookups(feature_tag)
+        for lookup in lookups:
+            for subtable in lookup.subtables:
+                if lookup_type is None or subtable.LookupType == lookup_type:
+                    yield subtable
+
+
+class LayoutGraph:
+    """Lazily built view of a font's GSUB and GPOS tables.
+
+    Obtain it through the `layout_graph` condition, so that every check
+    running on a font shares the same instance.
+    """
+
+    def __init__(self, ttFont):
+        self.ttFont = ttFont
+
+    @cached_property
+    def gsub(self):
+        return LayoutTable(self.ttFont, "GSUB")
+
+    @cached_property
+    def gpos(self):
+        return LayoutTable(self.ttFont, "GPOS")
+
+    def __getitem__(self, table_tag):
+        if table_tag == "GSUB":
+            return self.gsub
+        if table_tag == "GPOS":
+            return self.gpos
+        raise KeyError(table_tag)
+
+    @cached_property
+    def feature_tags(self):
+        return self.gsub.feature_tags | self.gpos.feature_tags
+
+    @cached_property
+    def script_tags(self):
+        return self.gsub.script_tags | self.gpos.script_tags
+
+    @cached_property
+    def language_tags(self):
+        return self.gsub.language_tags | self.gpos.language_tags
+
+    @cached_property
+    def substitutions(self):
+        """Maps each glyph to the set of glyphs GSUB can replace it with,
+        ignoring context. Ligature components map to the ligature glyph."""
+        outputs = {}
+        for subtable in self.gsub.subtables():
+            for glyph, produced in substitution_pairs(subtable):
+                outputs.setdefault(glyph, set()).update(produced)
+        return outputs
+
+    @cached_property
+    def substitution_outputs(self):
+        """All glyphs which can be produced by a GSUB substitution."""
+        return set().union(*self.substitutions.values())
+
+    def single_substitutions(self, feature_tag):
+        """The mapping of the single substitutions of a GSUB feature."""
+        mapping = {}
+        for subtable in self.gsub.subtables(lookup_type=1, feature_tag=feature_tag):
+            mapping.update(subtable.mapping)
+        return mapping
+
+    def closure(self, glyphs):
+        """All glyphs reachable from `glyphs` through GSUB substitutions."""
+        reached = set(glyphs)
+        pending = list(reached)
+        while pending:
+            glyph = pending.pop()
+            for output in self.substitutions.get(glyph, ()):
+                if output not in reached:
+                    reached.add(output)
+                    pending.append(output)
+        return reached
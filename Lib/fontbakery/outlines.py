@@ -0,0 +1,150 @@
+"""
+Glyph outlines for the heuristic outline checks.
+
+The outlines of a font are converted to `beziers` paths only when a check
+first looks at them, so checks which reach their verdict early (or only
+look at a sample of the glyphs) don't pay for the whole glyph set.
+
+The `outline_checks` configuration value picks how much of the font the
+outline checks look at:
+
+    outline_checks = "full"   # every glyph (the default)
+    outline_checks = "quick"  # a sample of glyphs, for quicker feedback
+
+In quick mode they look at a sample of up to QUICK_SAMPLE_SIZE glyphs,
+stratified by the script and general category of their codepoints (and by
+name suffix for unencoded glyphs), so that every part of the glyph set is
+represented. They also stop as soon as the verdict of the sample can't
+change. Their verdicts are then estimated from the sample, and may differ
+from those of a full scan, so their results say that they come from a
+quick scan.
+"""
+import threading
+import unicodedata
+from collections import defaultdict
+from collections.abc import Mapping
+
+from fontTools.unicodedata import script
+
+QUICK_SAMPLE_SIZE = 1000  # Glyphs looked at by each outline check in quick mode
+
+
+class GlyphOutlines(Mapping):
+    """The outlines of every glyph of a font as `beziers` paths, keyed by
+    (glyph name, display name) in glyph order, and converted on first use."""
+
+    def __init__(self, ttFont):
+        self.ttFont = ttFont
+        cmap = ttFont.getBestCmap() or {}
+        self.codepoints = {
+            glyphname: codepoint for codepoint, glyphname in cmap.items()
+        }
+        self._keys = [
+            (glyphname, self.display_name(glyphname))
+            for glyphname in ttFont.getGlyphOrder()
+        ]
+        self._paths = {}
+        self._lock = threading.Lock()
+
+    def display_name(self, glyphname):
+        if glyphname in self.codepoints:
+            return f"{glyphname} (U+{self.codepoints[glyphname]:04X})"
+        return glyphname
+
+    def __getitem__(self, key):
+        from beziers.path import BezierPath
+
+        glyphname, _ = key
+        with self._lock:
+            if glyphname not in self._paths:
+                self._paths[glyphname] = BezierPath.fromFonttoolsGlyph(
+                    self.ttFont, glyphname
+                )
+            return self._paths[glyphname]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def stratum(self, glyphname):
+        """The group a glyph belongs to when sampling the glyph set."""
+        if glyphname in self.codepoints:
+            char = chr(self.codepoints[glyphname])
+            return (script(char), unicodedata.category(char)[0])
+        return ("", glyphname.partition(".")[2])
+
+    def sample(self, size):
+        """The keys of about `size` glyphs, in glyph order, taking from each
+        stratum in proportion to its size (but at least one glyph)."""
+        if len(self._keys) <= size:
+            return list(self._keys)
+        strata = defaultdict(list)
+        for index, (glyphname, _) in enumerate(self._keys):
+            strata[self.stratum(glyphname)].append(index)
+        chosen = []
+        for indices in strata.values():
+            count = max(1, round(size * len(indices) / len(self._keys)))
+            step = len(indices) / count
+            chosen.extend(
+                indices[int(i * step)] for i in range(min(count, len(indices)))
+            )
+        return [self._keys[index] for index in sorted(chosen)]
+
+
+class OutlineScan:
+    """The glyphs an outline check goes through, according to the
+    `outline_checks` configuration value."""
+
+    def __init__(self, outlines, config):
+        self.outlines = outlines
+        self.quick = (config or {}).get("outline_checks") == "quick"
+        if self.quick:
+            self.keys = outlines.sample(QUICK_SAMPLE_SIZE)
+        else:
+            self.keys = list(outlines)
+        self.scanned = 0
+
+    def __iter__(self):
+        for key in self.keys:
+            self.scanned += 1
+            yield key, self.outlines[key]
+
+    def too_many(self, warnings):
+        """Whether there are more than FALSE_POSITIVE_CUTOFF warnings, the
+        point at which the checks decide that what they found is by design.
+        A quick scan estimates the number of warnings in the whole font from
+        the rate at which they turn up in its sample, so its verdict may
+        differ from that of a full scan."""
+        from fontbakery.checks.outline_settings import FALSE_POSITIVE_CUTOFF
+
+        if not self.quick:
+            return len(warnings) > FALSE_POSITIVE_CUTOFF
+        return len(warnings) * len(self.outlines) / len(self.keys) > (
+            FALSE_POSITIVE_CUTOFF
+        )
+
+    def enough(self, warnings):
+        """Whether a quick scan can stop: once there are more warnings than
+        any outline check reports, the verdict of its sample can't change
+        any more."""
+        from fontbakery.checks.outline_settings import FALSE_POSITIVE_CUTOFF
+
+        return self.quick and len(warnings) > FALSE_POSITIVE_CUTOFF
+
+    def note(self, message, estimated=False):
+        """The message of a result, saying which mode produced it, and
+        whether a quick scan `estimated` it for the whole font."""
+        if not self.quick:
+            return message
+        estimate = (
+            " The number of problems in the whole font was estimated from them."
+            if estimated
+            else ""
+        )
+        return (
+            f"{message}\n\n(Quick scan: looked at {self.scanned} of"
+            f" {len(self.outlines)} glyphs.{estimate} Set `outline_checks` to"
+            f' "full" in the configuration file to check all of them.)'
+        )
@@ -0,0 +1,245 @@
+"""
+Reports what a run of the CheckRunner is going to do, without running it:
+how many identities each check expands to, which conditions they need,
+which of those go online or spawn other programs, and roughly how long
+it should all take, based on the timings recorded by previous runs.
+
+The resource flags are a best effort: they come from the names used by
+the code of the checks and of the conditions they depend on.
+"""
+import inspect
+import json
+import os
+import threading
+from collections import Counter
+from functools import cached_property
+
+from fontbakery.utils import cache_dir, is_negated, write_atomically
+
+NETWORK_NAMES = {"network", "http_client", "requests", "urlopen"}
+SUBPROCESS_NAMES = {"subprocess", "Popen"}
+
+
+class TimingHistory:
+    """The average time each check took per identity, over past runs."""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(cache_dir(), "timings.json")
+        self.checks = {}
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.checks = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def estimate(self, check_id):
+        """Seconds per identity, or None if the check was never timed."""
+        entry = self.checks.get(check_id)
+        return entry["mean"] if entry else None
+
+    def update(self, timings):
+        """Merge in a {check_id: [seconds, ...]} mapping from a run."""
+        with self._lock:
+            for check_id, durations in timings.items():
+                if not durations:
+                    continue
+                entry = self.checks.get(check_id, {"mean": 0.0, "samples": 0})
+                # Cap the weight of older runs, so that the estimates
+                # follow checks getting faster (or slower) over time.
+                old_weight = min(entry["samples"], 1000)
+                total = old_weight + len(durations)
+                self.checks[check_id] = {
+                    "mean": (entry["mean"] * old_weight + sum(durations)) / total,
+                    "samples": entry["samples"] + len(durations),
+                }
+
+    def save(self):
+        """Write the history back; it's only an optimization, so failing to
+        do so is not an error."""
+        try:
+            write_atomically(
+                self.path,
+                json.dumps(self.checks, indent=1, sort_keys=True).encode("utf-8"),
+            )
+        except OSError:
+            pass
+
+
+def _code_names(func):
+    """All the global and attribute names used by a function, including
+    the ones used by its nested functions, lambdas and comprehensions, and
+    by the other FontBakery functions it calls."""
+    names = set()
+    seen = set()
+    todo = [inspect.unwrap(func)]
+    while todo:
+        func = todo.pop()
+        code = getattr(func, "__code__", None)
+        if code is None or code in seen:
+            continue
+        seen.add(code)
+        codes = [code]
+        while codes:
+            code = codes.pop()
+            names.update(code.co_names)
+            codes.extend(const for const in code.co_consts if inspect.iscode(const))
+            for name in code.co_names:
+                helper = func.__globals__.get(name)
+                if inspect.isfunction(helper) and helper.__module__.startswith(
+                    "fontbakery."
+                ):
+                    todo.append(helper)
+    return names
+
+
+class Planner:
+    def __init__(self, runner, history=None):
+        self.runner = runner
+        self.history = history or TimingHistory()
+
+    @cached_property
+    def providers(self):
+        """Condition name -> the functions that compute it, for the context
+        and every kind of testable in this run."""
+        classes = {type(self.runner.context)} | {
+            type(testable) for testable in self.runner.context.testables
+        }
+        providers = {}
+        for cls in classes:
+            for name, member in inspect.getmembers(cls):
+                if isinstance(member, cached_property):
+                    providers.setdefault(name, set()).add(member.func)
+                elif isinstance(member, property) and member.fget:
+                    providers.setdefault(name, set()).add(member.fget)
+        return providers
+
+    def _dependencies(self, names):
+        """The given condition names plus everything they depend on."""
+        seen = set()
+        todo = list(names)
+        while todo:
+            name = todo.pop()
+            if name in seen or name not in self.providers:
+                continue
+            seen.add(name)
+            for func in self.providers[name]:
+                todo.extend(_code_names(func) & self.providers.keys())
+        return seen
+
+    def _flags(self, names, funcs):
+        code_names = set(names)
+        for func in funcs:
+            code_names |= _code_names(func)
+        return {
+            "network": bool(code_names & NETWORK_NAMES),
+            "subprocess": bool(code_names & SUBPROCESS_NAMES),
+        }
+
+    def _condition_flags(self, name):
+        needed = self._dependencies([name])
+        return self._flags(
+            needed, [func for name in needed for func in self.providers[name]]
+        )
+
+    def report(self):
+        """A JSON-serializable description of the plan."""
+        runner = self.runner
+        checks = []
+        files = Counter()
+        conditions = Counter()
+        total_seconds = 0.0
+        for planned in runner.plan:
+            check = planned.check
+            for identity in planned.identities:
+                for thing, index in identity.iterargs:
+                    files[runner.get_iterarg(thing, index)] += 1
+            direct = set(check.args) | {
+                is_negated(condition)[1] for condition in check.conditions
+            }
+            needed = self._dependencies(direct)
+            flags = self._flags(
+                needed,
+                [check] + [func for name in needed for func in self.providers[name]],
+            )
+            estimate = self.history.estimate(check.id)
+            if planned.identities:
+                conditions.update({name: len(planned.identities) for name in needed})
+                if estimate is not None:
+                    total_seconds += estimate * len(planned.identities)
+            checks.append(
+                {
+                    "id": check.id,
+                    "section": str(planned.section),
+                    "scope": planned.scope,
+                    "identities": len(planned.identities),
+                    "conditions": sorted(needed),
+                    **flags,
+                    "estimated_seconds": (
+                        None if estimate is None else estimate * len(planned.identities)
+                    ),
+                }
+            )
+
+        running = [check for check in checks if check["identities"]]
+        return {
+            "identities": sum(check["identities"] for check in checks),
+            "checks": checks,
+            "files": dict(files),
+            "conditions": {
+                name: {"identities": count, **self._condition_flags(name)}
+                for name, count in sorted(conditions.items())
+            },
+            "estimated_seconds": total_seconds,
+            "checks_without_history": [
+                check["id"] for check in running if check["estimated_seconds"] is None
+            ],
+        }
+
+
+def _duration(seconds):
+    minutes, seconds = divmod(round(seconds), 60)
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+def print_plan(report):
+    running = [check for check in report["checks"] if check["identities"]]
+    print(
+        f"{report['identities']} identities of {len(running)} checks"
+        f" on {len(report['files'])} files."
+    )
+    estimate = f"Estimated time: {_duration(report['estimated_seconds'])}"
+    if report["checks_without_history"]:
+        estimate += (
+            f" ({len(report['checks_without_history'])} checks"
+            f" have no timing history yet)"
+        )
+    print(estimate + "\n")
+
+    print("Checks:")
+    for check in sorted(running, key=lambda check: -(check["estimated_seconds"] or 0)):
+        flags = [flag for flag in ("network", "subprocess") if check[flag]]
+        cost = (
+            "?"
+            if check["estimated_seconds"] is None
+            else _duration(check["estimated_seconds"])
+        )
+        print(
+            f"  {check['id']}: {check['identities']} on {check['scope']},"
+            f" ~{cost}" + (f" [{', '.join(flags)}]" if flags else "")
+        )
+    skipped = [check["id"] for check in report["checks"] if not check["identities"]]
+    if skipped:
+        print(f"\nNot running: {', '.join(skipped)}")
+
+    print("\nFiles:")
+    for filename, count in report["files"].items():
+        print(f"  {filename}: {count} identities")
+
+    print("\nConditions:")
+    for name, condition in report["conditions"].items():
+        flags = [flag for flag in ("network", "subprocess") if condition[flag]]
+        print(
+            f"  {name}: needed by {condition['identities']} identities"
+            + (f" [{', '.join(flags)}]" if flags else "")
+        )
@@ -0,0 +1,181 @@
+"""
+Character repertoires (glyphsets, charsets, Unicode ranges) as bitsets.
+
+Every repertoire is registered under a name, and compiled only once per
+process into a `CodepointSet`: a set of code points stored as the bits of
+a Python integer, so that intersections and differences with the code
+points of a font are single operations on whole machine words instead of
+loops over Python sets.
+
+Use the `repertoire_coverage` condition to get the coverage of a font's
+cmap against all the registered repertoires.
+"""
+import re
+import threading
+from functools import cached_property
+
+ONE_BIT = re.compile("1")
+
+
+class CodepointSet:
+    """An immutable, sorted set of code points."""
+
+    __slots__ = ("bits",)
+
+    def __init__(self, codepoints=()):
+        if isinstance(codepoints, CodepointSet):
+            self.bits = codepoints.bits
+            return
+        codepoints = list(codepoints)
+        if not codepoints:
+            self.bits = 0
+            return
+        buffer = bytearray(max(codepoints) // 8 + 1)
+        for codepoint in codepoints:
+            buffer[codepoint >> 3] |= 1 << (codepoint & 7)
+        self.bits = int.from_bytes(buffer, "little")
+
+    @classmethod
+    def from_bits(cls, bits):
+        codepoint_set = cls.__new__(cls)
+        codepoint_set.bits = bits
+        return codepoint_set
+
+    @classmethod
+    def from_ranges(cls, ranges):
+        """A set made of (first, last) inclusive ranges of code points."""
+        bits = 0
+        for first, last in ranges:
+            bits |= (1 << (last + 1)) - (1 << first)
+        return cls.from_bits(bits)
+
+    def __and__(self, other):
+        return CodepointSet.from_bits(self.bits & CodepointSet(other).bits)
+
+    def __or__(self, other):
+        return CodepointSet.from_bits(self.bits | CodepointSet(other).bits)
+
+    def __sub__(self, other):
+        return CodepointSet.from_bits(self.bits & ~CodepointSet(other).bits)
+
+    def __len__(self):
+        if hasattr(int, "bit_count"):  # Python 3.10+
+            return self.bits.bit_count()
+        return bin(self.bits).count("1")
+
+    def __bool__(self):
+        return self.bits != 0
+
+    def __iter__(self):
+        # Scanning the binary representation is done in C, which is much
+        # faster than repeatedly shifting a large integer.
+        for match in ONE_BIT.finditer(bin(self.bits)[:1:-1]):
+            yield match.start()
+
+    def __contains__(self, codepoint):
+        return codepoint >= 0 and bool((self.bits >> codepoint) & 1)
+
+    def __eq__(self, other):
+        if not isinstance(other, CodepointSet):
+            return NotImplemented
+        return self.bits == other.bits
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    def __le__(self, other):
+        return not self.bits & ~other.bits
+
+    def __lt__(self, other):
+        return self <= other and self != other
+
+    def __ge__(self, other):
+        return other <= self
+
+    def __gt__(self, other):
+        return other < self
+
+    def __repr__(self):
+        return f"CodepointSet({', '.join(f'0x{c:04X}' for c in self)})"
+
+
+_loaders = {}
+_compiled = {}
+_lock = threading.Lock()
+
+
+def register_repertoire(name, codepoints):
+    """Register a repertoire. `codepoints` is either an iterable of code
+    points or a function returning one, which is only called the first
+    time the repertoire is needed."""
+    with _lock:
+        _loaders[name] = codepoints
+        _compiled.pop(name, None)
+
+
+def registered_repertoires():
+    return list(_loaders)
+
+
+def repertoire(name):
+    """The CodepointSet of a registered repertoire."""
+    with _lock:
+        if name not in _compiled:
+            codepoints = _loaders[name]
+            if callable(codepoints):
+                codepoints = codepoints()
+            _compiled[name] = CodepointSet(codepoints)
+        return _compiled[name]
+
+
+class RepertoireCoverage:
+    """How much of each registered repertoire a set of code points covers."""
+
+    def __init__(self, codepoints):
+        self.codepoints = CodepointSet(codepoints)
+
+    @cached_property
+    def present_by_name(self):
+        """Repertoire name -> its code points which are in the set, for all
+        the repertoires registered so far."""
+        return {
+            name: self.codepoints & repertoire(name)
+            for name in registered_repertoires()
+        }
+
+    def present(self, name):
+        if name in self.present_by_name:
+            return self.present_by_name[name]
+        return self.codepoints & repertoire(name)
+
+    def missing(self, name):
+        return repertoire(name) - self.codepoints
+
+    def extra(self, name):
+        """The code points of the set which are not in the repertoire."""
+        return self.codepoints - repertoire(name)
+
+
+def _constant(name):
+    def load():
+        from fontbakery import constants
+
+        return getattr(constants, name)
+
+    return load
+
+
+def _cjk_ranges():
+    from fontbakery.constants import CJK_UNICODE_RANGES
+
+    return CodepointSet.from_ranges(CJK_UNICODE_RANGES)
+
+
+register_repertoire("CJK", _cjk_ranges)
+register_repertoire(
+    "Hangul_Syllables", lambda: CodepointSet.from_ranges([(0xAC00, 0xD7A3)])
+)
+register_repertoire("Hangul_Modern", _constant("MODERN_HANGUL_SYLLABLES_CODEPOINTS"))
+register_repertoire(
+    "Hangul_OtherCommon", _constant("OTHER_COMMON_HANGUL_SYLLABLES_CODEPOINTS")
+)
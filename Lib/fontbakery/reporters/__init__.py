@@ -113,3 +113,10 @@ class FontbakeryReporter:
         self._sectioncounter[checkresult.identity.section.name][
             checkresult.summary_status.name
         ] += 1
+
+    def receive_results(self, checkresults: Iterable[CheckResult]):
+        """Receive a batch of check results, in order of completion.
+        Reporters that can handle many results at once more efficiently
+        than one by one may override this."""
+        for checkresult in checkresults:
+            self.receive_result(checkresult)
@@ -7,6 +7,7 @@ from cmarkgfm.cmark import Options as cmarkgfmOptions
 from jinja2 import ChoiceLoader, Environment, PackageLoader, Template, select_autoescape
 from markupsafe import Markup
 
+from fontbakery.artifacts import is_image
 from fontbakery.reporters.serialize import SerializeReporter
 from fontbakery import __version__ as fb_version
 from fontbakery.utils import unindent_and_unwrap_rationale
@@ -48,6 +49,16 @@ class HTMLReporter(SerializeReporter):
     format_name = "HTML"
     format = "html"
 
+    def render_artifact(self, name):
+        """Images are shown in place: SVG blobs from a temporary directory
+        are inlined, and those kept in a directory are linked."""
+        if self.artifact_store.is_temporary:
+            return super().render_artifact(name)
+        path = self.artifact_path(name)
+        if is_image(name):
+            return f'<img src="{path}" style="height:100px;margin:10px;">'
+        return f'<a href="{path}">{name}</a>'
+
     def template_engine(self) -> Template:
         loaders = [PackageLoader("fontbakery.reporters", f"templates/{self.format}")]
         try:
@@ -10,6 +10,9 @@ domains as well.
 Domain specific knowledge should be encoded only in the Profile (Checks,
 Conditions) and MAYBE in *customized* reporters e.g. subclasses.
 """
+import os
+
+from fontbakery.artifacts import artifact_store_of, references
 from fontbakery.result import CheckResult
 from fontbakery.reporters import FontbakeryReporter
 
@@ -26,6 +29,7 @@ class SerializeReporter(FontbakeryReporter):
         # this way we minimize our knowledge of the profile
         self._max_cluster_by_index = None
         self._observed_checks = {}
+        self._artifacts = {}
 
     def start(self, order):
         super().start(order)
@@ -46,11 +50,58 @@ class SerializeReporter(FontbakeryReporter):
         for section in self._sections.keys():
             self._sections[section]["result"] = self._sectioncounter[section]
 
+    @property
+    def artifact_store(self):
+        """The store holding the payloads referenced by check messages, if
+        any check of the run used one."""
+        return artifact_store_of(self.runner)
+
+    def artifact_path(self, name):
+        """Where an artifact is, relative to the report if possible."""
+        path = self.artifact_store.file(name)
+        if self.output_file:
+            return os.path.relpath(path, os.path.dirname(self.output_file) or ".")
+        return path
+
+    def render_artifact(self, name):
+        """What to put in place of a reference to an artifact: the artifact
+        itself if it lives in a temporary directory, or else its (unchanged)
+        reference, listed in the "artifacts" of the document."""
+        if self.artifact_store.is_temporary:
+            return self.artifact_store.read_text(name)
+        self._artifacts[name] = self.artifact_path(name)
+        return f"[[artifact:{name}]]"
+
+    def _render_artifacts(self, check):
+        logs = []
+        for log in check["logs"]:
+            message = log["message"]
+            if references(message.get("message")):
+                text = self.artifact_store.replace(
+                    message["message"], self.render_artifact
+                )
+                log = dict(log, message=dict(message, message=text))
+            logs.append(log)
+        return dict(check, logs=logs)
+
     def getdoc(self):
-        return {
+        sections = list(self._sections.values())
+        self._artifacts = {}
+        if self.artifact_store is not None:
+            sections = [
+                dict(
+                    section,
+                    checks=[self._render_artifacts(c) for c in section["checks"]],
+                )
+                for section in sections
+            ]
+        doc = {
             "result": self._counter,
-            "sections": list(self._sections.values()),
+            "sections": sections,
         }
+        if self._artifacts:
+            doc["artifacts"] = self._artifacts
+        return doc
 
     def write(self):
         with open(self.output_file, "w", encoding="utf-8") as fh:
@@ -16,6 +16,7 @@ from rich.markup import escape
 import rich
 
 from fontbakery.constants import LIGHT_THEME, CUPCAKE, MEANING_MESSAGE
+from fontbakery.artifacts import artifact_store_of
 from fontbakery.message import Message
 from fontbakery.result import CheckResult
 from fontbakery.reporters import FontbakeryReporter
@@ -336,6 +337,17 @@ class TerminalReporter(FontbakeryReporter):
             raise (TypeError(f"Expected Message, got {type(msg)}: {msg}"))
 
         message = str(msg)
+        store = artifact_store_of(self.runner)
+        if store is not None:
+            # Large payloads are for the other reports.
+            message = store.replace(
+                message,
+                lambda name: (
+                    f"({name.rsplit('.', 1)[-1].upper()} not shown)"
+                    if store.is_temporary
+                    else f"(see {store.file(name)})"
+                ),
+            )
 
         if hasattr(msg, "traceback"):
             message = re.sub(r"(<[^<>]*>)", r"**`\1`**", message, flags=re.MULTILINE)
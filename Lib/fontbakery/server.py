@@ -0,0 +1,429 @@
+"""
+A long-lived local check server, and the client to talk to it.
+
+`fontbakery serve` loads the checks and profiles once and keeps them (and
+every other process-wide cache, such as the compiled character repertoires
+or the parsed glyphset definitions) resident. It then accepts check jobs
+over HTTP, on a Unix socket (by default) or on a local TCP port, and runs
+them on a pool of worker threads. `fontbakery submit` sends a job and
+reports its results.
+
+A job is a JSON object:
+
+    {
+        "profile": "googlefonts",   # a built-in profile, or one allowed by
+                                    # `fontbakery serve --allow-profile`
+        "files": ["/path/to/Font-Regular.ttf", ...],
+        "config": {...}             # optional; the JOB_CONFIG_KEYS of a
+                                    # config file, and check sections
+    }
+
+Anything that can reach the server can run checks with it, so it only
+takes jobs as `application/json` requests addressed to the local host.
+Browsers can't send those to another site without asking it first, which
+keeps web pages (including DNS rebinding ones) from submitting jobs.
+
+The paths are opened by the server, so they should be absolute. The
+response is a stream of JSON lines: one `{"check": ...}` line per check
+result as soon as it is available (in the shape used by the JSON report,
+along with the check id and section name), and a final `{"report": ...}`
+line with the whole JSON report.
+"""
+import http.client
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fontbakery import __version__
+from fontbakery.artifacts import artifact_store_of
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.configuration import Configuration
+from fontbakery.errors import FontBakeryRunnerError, ValueValidationError
+from fontbakery.fonts_profile import (
+    checks_by_id,
+    get_module,
+    profile_factory,
+    setup_context,
+)
+from fontbakery.planner import TimingHistory
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.reporters.serialize import JSONReporter
+from fontbakery.status import DEBUG
+
+DEFAULT_PORT = 8732
+JOB_PATH = "/jobs"
+STATUS_PATH = "/status"
+LOCAL_HOSTS = {"localhost", "127.0.0.1"}
+
+# The configuration values a job may set, besides the sections of its checks.
+# Those which write to (or read from) directories of their own choosing, such
+# as artifacts_dir, http_record or http_replay, are left to the command line.
+JOB_CONFIG_KEYS = {
+    "custom_order",
+    "explicit_checks",
+    "exclude_checks",
+    "full_lists",
+    "skip_network",
+    "overrides",
+    "timeout",
+    "check_timeout",
+    "timeouts",
+    "run_timeout",
+    "outline_checks",
+    "is_icon_font",
+    "vendor_id",
+    "shaping",
+    "collidoscope",
+}
+
+log = logging.getLogger(__name__)
+
+
+class StreamReporter(FontbakeryReporter):
+    """Hands every check result over to a callback as soon as it arrives."""
+
+    def __init__(self, callback, **kwargs):
+        super().__init__(**kwargs)
+        self.callback = callback
+
+    def receive_result(self, checkresult):
+        super().receive_result(checkresult)
+        data = checkresult.getData(self.runner)
+        store = artifact_store_of(self.runner)
+        if store is not None:
+            for log in data["logs"]:
+                log["message"]["message"] = store.embed(log["message"]["message"])
+        self.callback(
+            {
+                "section": checkresult.identity.section.name,
+                "check_id": checkresult.identity.check.id,
+                "check": data,
+            }
+        )
+
+
+class CheckService:
+    """Runs check jobs with profiles that are loaded only once.
+
+    Check configuration values are injected into the module globals of the
+    checks, so jobs only run concurrently with other jobs that have the very
+    same configuration; the others wait for their turn."""
+
+    def __init__(self, workers=1, jobs=1, record_timings=False, profiles=()):
+        self.jobs = jobs  # Worker threads of each CheckRunner
+        self.record_timings = record_timings  # For the --plan estimates
+        # Profile modules or files which jobs may use, besides the built-in ones
+        self.allowed_profiles = {self._profile_name(name) for name in profiles}
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self._profiles = {}
+        self._profiles_lock = threading.Lock()
+        self._running = Counter()  # Configuration -> number of running jobs
+        self._turn = threading.Condition()
+        self._history_lock = threading.Lock()
+
+    @staticmethod
+    def _profile_name(name):
+        return os.path.abspath(name) if os.path.isfile(name) else name
+
+    def profile(self, name):
+        """The profile of the given name: one of the CLI_PROFILES, or one of
+        the allowed_profiles. Raises ValueValidationError for any other."""
+        from fontbakery.cli import CLI_PROFILES
+
+        if name not in CLI_PROFILES and (
+            self._profile_name(name) not in self.allowed_profiles
+        ):
+            raise ValueValidationError(
+                f"Unknown profile: {name} is not a built-in profile, and the"
+                f" server was not started with --allow-profile {name}"
+            )
+        with self._profiles_lock:
+            if name not in self._profiles:
+                module = "fontbakery.profiles." + name if name in CLI_PROFILES else name
+                self._profiles[name] = profile_factory(get_module(module))
+            return self._profiles[name]
+
+    def warm(self, profiles=()):
+        """Load the given profiles (and so all the checks), and compile the
+        registered character repertoires."""
+        from fontbakery.repertoires import registered_repertoires, repertoire
+
+        for name in profiles:
+            self.profile(name)
+        for name in registered_repertoires():
+            repertoire(name)
+
+    def status(self):
+        with self._turn:
+            running = sum(self._running.values())
+        return {
+            "version": __version__,
+            "pid": os.getpid(),
+            "profiles": sorted(self._profiles),
+            "running": running,
+        }
+
+    def _wait_for_turn(self, key):
+        with self._turn:
+            self._turn.wait_for(lambda: set(self._running) <= {key})
+            self._running[key] += 1
+
+    def _done(self, key):
+        with self._turn:
+            self._running[key] -= 1
+            if not self._running[key]:
+                del self._running[key]
+            self._turn.notify_all()
+
+    def prepare(self, job):
+        """Validate a job and set up its CheckRunner.
+        Raises ValueValidationError for bad jobs."""
+        if not isinstance(job, dict) or not job.get("files"):
+            raise ValueValidationError("A job needs a list of files.")
+        if not isinstance(job.get("config", {}), dict):
+            raise ValueValidationError("The configuration must be an object.")
+        try:
+            profile = self.profile(job.get("profile", "universal"))
+        except (ImportError, AttributeError, ValueError) as e:
+            raise ValueValidationError(f"Unknown profile: {e}") from e
+        unknown = sorted(
+            key
+            for key in job.get("config", {})
+            if key not in JOB_CONFIG_KEYS and key not in checks_by_id
+        )
+        if unknown:
+            raise ValueValidationError(
+                f"Jobs can't set these configuration values: {', '.join(unknown)}"
+            )
+
+        context = setup_context(job["files"])
+        context.is_multithreaded = self.jobs > 1
+        configuration = Configuration(**job.get("config", {}))
+        return CheckRunner(
+            profile, jobs=self.jobs, context=context, config=configuration
+        )
+
+    def run(self, job):
+        """Run a job, yielding its results as they become available, and the
+        final JSON report."""
+        runner = self.prepare(job)
+        key = json.dumps(job.get("config", {}), sort_keys=True)
+        results = queue.Queue()
+        done = object()
+        report_doc = []
+        loglevels = [DEBUG]  # The client decides what to show.
+        report = JSONReporter(runner=runner, loglevels=loglevels, quiet=True)
+        reporters = [
+            StreamReporter(results.put, runner=runner, loglevels=loglevels),
+            report,
+        ]
+
+        def work():
+            self._wait_for_turn(key)
+            try:
+                runner.run(reporters)
+            finally:
+                self._done(key)
+                results.put(done)
+            report_doc.append(report.getdoc())
+            if artifact_store_of(runner) is not None:
+                artifact_store_of(runner).cleanup()
+            if self.record_timings:
+                with self._history_lock:
+                    history = TimingHistory()
+                    history.update(runner.timings)
+                    history.save()
+
+        future = self.executor.submit(work)
+        while True:
+            item = results.get()
+            if item is done:
+                break
+            yield item
+        future.result()  # Re-raise whatever went wrong.
+        yield {"report": report_doc[0]}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.0"  # The end of a stream closes the connection
+    server_version = f"fontbakery/{__version__}"
+
+    def _send_json(self, code, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _refuse(self, content_type=None):
+        """Send an error and return True if the request doesn't come from a
+        local client (or isn't of the given content type)."""
+        host = (self.headers.get("Host") or "").rpartition(":")
+        hostname = host[0] if host[2].isdigit() else "".join(host)
+        if hostname not in LOCAL_HOSTS:
+            hosts = " or ".join(sorted(LOCAL_HOSTS))
+            self._send_json(403, {"error": f"Requests must be addressed to {hosts}"})
+            return True
+        if content_type is not None:
+            given = (self.headers.get("Content-Type") or "").split(";")[0]
+            if given.strip().lower() != content_type:
+                self._send_json(415, {"error": f"Jobs must be sent as {content_type}"})
+                return True
+        return False
+
+    def do_GET(self):
+        if self._refuse():
+            return
+        if self.path != STATUS_PATH:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        self._send_json(200, self.server.service.status())
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        body = self.rfile.read(length)  # Read even when refusing the request
+        if self._refuse("application/json"):
+            return
+        if self.path != JOB_PATH:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            job = json.loads(body)
+            stream = self.server.service.run(job)
+            first = next(stream)  # Reports bad jobs before any output
+        except (ValueError, ValueValidationError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+        except Exception as e:  # pylint: disable=broad-except
+            log.exception("Job failed")
+            self._send_json(500, {"error": str(e)})
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            self._write_line(first)
+            for item in stream:
+                self._write_line(item)
+        except Exception as e:  # pylint: disable=broad-except
+            log.exception("Job failed")
+            self._write_line({"error": str(e)})
+
+    def _write_line(self, item):
+        self.wfile.write(json.dumps(item).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def address_string(self):
+        # Unix sockets have no client address.
+        return self.client_address[0] if self.client_address else "local"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        log.info("%s - %s", self.address_string(), format % args)
+
+
+class ThreadingUnixHTTPServer(
+    socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, None
+
+
+def default_socket_path():
+    """The Unix socket the server listens on unless told otherwise, in the
+    user's runtime directory. None where there are no Unix sockets."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, f"fontbakery-{os.getuid()}.sock")
+
+
+def server_address(port=None, socket_path=None):
+    """The (port, socket_path) to use: the default socket if neither is
+    given, or the default port where there are no Unix sockets."""
+    if port is None and socket_path is None:
+        socket_path = default_socket_path()
+        if socket_path is None:
+            port = DEFAULT_PORT
+    return port, socket_path
+
+
+def make_server(service, host="127.0.0.1", port=None, socket_path=None):
+    """An HTTP server for the service, listening on a Unix socket that only
+    its user may use, or on a TCP port if one is given."""
+    port, socket_path = server_address(port, socket_path)
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = ThreadingUnixHTTPServer(socket_path, _Handler)
+        os.chmod(socket_path, 0o600)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    server.service = service
+    return server
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def _connection(host="127.0.0.1", port=None, socket_path=None):
+    port, socket_path = server_address(port, socket_path)
+    if socket_path:
+        return UnixHTTPConnection(socket_path)
+    return http.client.HTTPConnection(host, port)
+
+
+def submit_job(job, host="127.0.0.1", port=None, socket_path=None):
+    """Send a job to a check server, yielding the items of its response.
+    Raises ValueValidationError if the server rejects the job, and
+    FontBakeryRunnerError if it fails to start it."""
+    connection = _connection(host, port, socket_path)
+    try:
+        connection.request(
+            "POST",
+            JOB_PATH,
+            body=json.dumps(job).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        response = connection.getresponse()
+        if response.status == 400:
+            raise ValueValidationError(json.loads(response.read())["error"])
+        if response.status != 200:
+            raise FontBakeryRunnerError(json.loads(response.read())["error"])
+        for line in response:
+            yield json.loads(line)
+    finally:
+        connection.close()
+
+
+def server_status(host="127.0.0.1", port=None, socket_path=None):
+    connection = _connection(host, port, socket_path)
+    try:
+        connection.request("GET", STATUS_PATH)
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
@@ -0,0 +1,388 @@
+"""
+Size accounting for font files.
+
+How many bytes each table of a font takes, and how many of those are only
+there for hinting, worked out from the raw table data. This is much faster
+than removing the hints from a copy of the font and compiling it again,
+which is still available (see `dehinted_size`) when exact figures of a
+dehinted file are needed.
+"""
+import os
+from io import BytesIO
+
+# Tables which are dropped altogether when removing the hints.
+# (The "cvar" table only holds hinting data in variable fonts)
+HINTING_TABLES = ("cvt ", "fpgm", "prep", "hdmx", "LTSH", "VDMX", "TTFA", "cvar")
+TABLE_RECORD_SIZE = 16
+# The gasp table of a dehinted font has a single range: 4 + 4 bytes.
+DEHINTED_GASP_SIZE = 8
+
+# Flags of composite glyph components
+ARG_1_AND_2_ARE_WORDS = 0x0001
+WE_HAVE_A_SCALE = 0x0008
+MORE_COMPONENTS = 0x0020
+WE_HAVE_AN_X_AND_Y_SCALE = 0x0040
+WE_HAVE_A_TWO_BY_TWO = 0x0080
+WE_HAVE_INSTRUCTIONS = 0x0100
+
+T2_STEM_OPERATORS = {"hstem", "vstem", "hstemhm", "vstemhm"}
+T2_MASK_OPERATORS = {"hintmask", "cntrmask"}
+# Private DICT entries removed along with the hints, and the size of their
+# operator (the ones starting with the escape byte take two).
+PRIVATE_HINT_OPERATORS = {
+    "BlueValues": 1,
+    "OtherBlues": 1,
+    "FamilyBlues": 1,
+    "FamilyOtherBlues": 1,
+    "StdHW": 1,
+    "StdVW": 1,
+    "BlueScale": 2,
+    "BlueShift": 2,
+    "BlueFuzz": 2,
+    "StemSnapH": 2,
+    "StemSnapV": 2,
+    "ForceBold": 2,
+    "LanguageGroup": 2,
+    "ExpansionFactor": 2,
+}
+
+
+def padded(length):
+    """Tables are padded to a multiple of four bytes in a font file."""
+    return (length + 3) & ~3
+
+
+def table_sizes(ttFont):
+    """Table tag -> compiled (uncompressed) size of each table in the file."""
+    return {
+        tag: getattr(entry, "origLength", None) or entry.length
+        for tag, entry in ttFont.reader.tables.items()
+    }
+
+
+def glyf_instruction_sizes(ttFont):
+    """Glyph name -> bytes taken by its TrueType instructions, read from the
+    raw glyf data, without decompiling any glyph."""
+    data = ttFont.reader["glyf"]
+    locations = ttFont["loca"].locations
+    sizes = {}
+    for glyph_name, start, end in zip(ttFont.getGlyphOrder(), locations, locations[1:]):
+        if end - start < 10:
+            continue  # Empty glyph
+        contours = int.from_bytes(data[start : start + 2], "big", signed=True)
+        if contours >= 0:
+            position = start + 10 + 2 * contours
+            length = int.from_bytes(data[position : position + 2], "big")
+            if length:
+                # The (now zero) length field stays.
+                sizes[glyph_name] = length
+            continue
+
+        position = start + 10
+        flags = MORE_COMPONENTS
+        instructions = False
+        while flags & MORE_COMPONENTS:
+            flags = int.from_bytes(data[position : position + 2], "big")
+            position += 4  # flags and glyph index
+            position += 4 if flags & ARG_1_AND_2_ARE_WORDS else 2
+            if flags & WE_HAVE_A_SCALE:
+                position += 2
+            elif flags & WE_HAVE_AN_X_AND_Y_SCALE:
+                position += 4
+            elif flags & WE_HAVE_A_TWO_BY_TWO:
+                position += 8
+            instructions = instructions or bool(flags & WE_HAVE_INSTRUCTIONS)
+        if instructions:
+            length = int.from_bytes(data[position : position + 2], "big")
+            sizes[glyph_name] = 2 + length
+    return sizes
+
+
+def _t2_operand_size(value):
+    if isinstance(value, int):
+        if -107 <= value <= 107:
+            return 1
+        if -1131 <= value <= 1131:
+            return 2
+        if -32768 <= value <= 32767:
+            return 3
+    return 5  # 16.16 fixed
+
+
+def _t2_operator_size(operator):
+    from fontTools.misc.psCharStrings import T2CharString
+
+    # Escaped operators have a two bytes opcode
+    return len(T2CharString.opcodes[operator])
+
+
+class _T2HintAccounting:
+    """Walks the decompiled Type 2 programs of a CFF font, adding up the
+    bytes which would go away along with the hints.
+
+    Besides the stem hints and hint masks themselves, subroutinized fonts
+    have subroutines which only hold hints (or only push the operands of
+    hints): those are dropped too, along with the calls to them."""
+
+    def __init__(self, global_subrs, has_width):
+        self.global_subrs = global_subrs
+        self.has_width = has_width
+        self.kinds = {}  # id(subroutine) -> "operands", "hints" or "other"
+        # The other subroutines called, with the local subroutines they see
+        self.called = {}
+        self.used_for_paths = set()  # id of operand subroutines
+        self.used_for_hints = {}  # id -> subroutines only used by hints
+
+    def _callee(self, local_subrs, operator, index):
+        from fontTools.misc.psCharStrings import calcSubrBias
+
+        # Global subroutines use the local subroutines of their caller.
+        subrs = self.global_subrs if operator == "callgsubr" else local_subrs
+        return subrs[index + calcSubrBias(subrs)]
+
+    def kind(self, charstring, local_subrs):
+        key = id(charstring)
+        if key not in self.kinds:
+            self.kinds[key] = "other"  # In case of (invalid) recursion
+            kind = "operands"
+            program = charstring.program
+            for position, token in enumerate(program):
+                if isinstance(token, bytes) or token == "return":
+                    continue
+                if token in ("callsubr", "callgsubr"):
+                    callee = self._callee(local_subrs, token, program[position - 1])
+                    callee_kind = self.kind(callee, local_subrs)
+                    if callee_kind == "other":
+                        kind = "other"
+                        break
+                    if callee_kind == "hints":
+                        kind = "hints"
+                elif token in T2_STEM_OPERATORS or token in T2_MASK_OPERATORS:
+                    kind = "hints"
+                elif isinstance(token, str):  # Any other operator
+                    kind = "other"
+                    break
+            if kind == "hints":
+                # Anything left on the stack is used by the caller.
+                last = [t for t in program if t != "return"][-1:]
+                if not last or not (
+                    isinstance(last[0], bytes)
+                    or last[0] in T2_STEM_OPERATORS
+                    or last[0] in T2_MASK_OPERATORS
+                ):
+                    kind = "other"
+            self.kinds[key] = kind
+        return self.kinds[key]
+
+    def program_size(self, program):
+        return sum(
+            len(token)
+            if isinstance(token, bytes)
+            else _t2_operator_size(token)
+            if isinstance(token, str)
+            else _t2_operand_size(token)
+            for token in program
+        )
+
+    def hint_size(self, charstring, local_subrs, is_subroutine=False):
+        """Bytes taken by the hints in the program of a charstring or of a
+        subroutine called for other things than hinting."""
+        size = 0
+        # Each operand is (size, subroutines called to push it)
+        operands = []
+        first_operator = not is_subroutine
+        program = charstring.program
+        for position, token in enumerate(program):
+            if isinstance(token, bytes):  # The mask of the preceding operator
+                size += len(token)
+            elif token in ("callsubr", "callgsubr"):
+                callee = self._callee(local_subrs, token, program[position - 1])
+                call = operands.pop()
+                kind = self.kind(callee, local_subrs)
+                if kind == "operands":
+                    operands.append((call[0] + 1, call[1] + [callee]))
+                elif kind == "hints":
+                    size += call[0] + 1 + sum(o[0] for o in operands)
+                    self._use_for_hints(callee, operands)
+                    operands = []
+                    first_operator = False
+                else:
+                    self.called.setdefault(id(callee), (callee, local_subrs))
+                    self._use_for_paths(operands)
+                    operands = []
+            elif token == "blend":
+                operands.append((1, []))
+            elif isinstance(token, str):
+                if token in T2_STEM_OPERATORS or token in T2_MASK_OPERATORS:
+                    if first_operator and self.has_width and len(operands) % 2:
+                        self._use_for_paths(operands[:1])
+                        operands = operands[1:]  # The advance width stays
+                    size += _t2_operator_size(token) + sum(o[0] for o in operands)
+                    self._use_for_hints(None, operands)
+                else:
+                    self._use_for_paths(operands)
+                operands = []
+                first_operator = False
+            else:
+                operands.append((_t2_operand_size(token), []))
+        self._use_for_paths(operands)
+        return size
+
+    def _use_for_hints(self, subroutine, operands):
+        subroutines = [subroutine] if subroutine is not None else []
+        for operand in operands:
+            subroutines.extend(operand[1])
+        for subroutine in subroutines:
+            self.used_for_hints[id(subroutine)] = subroutine
+
+    def _use_for_paths(self, operands):
+        for operand in operands:
+            for subroutine in operand[1]:
+                self.used_for_paths.add(id(subroutine))
+
+    def dropped_subroutines_size(self):
+        """The size of the subroutines which are only used by hints."""
+        return sum(
+            self.program_size(subroutine.program)
+            for key, subroutine in self.used_for_hints.items()
+            if key not in self.used_for_paths
+        )
+
+
+def _private_hint_size(private):
+    from fontTools.misc.psCharStrings import encodeFloat, encodeIntCFF
+
+    def number_size(value):
+        if isinstance(value, list):  # Blended values of a CFF2 font
+            return sum(number_size(item) for item in value) + 1
+        if isinstance(value, int):
+            return len(encodeIntCFF(value))
+        return len(encodeFloat(value))
+
+    # The values in rawDict are the operands as stored in the font, i.e.
+    # with the arrays still delta-encoded.
+    return sum(
+        number_size(value) + operator_size
+        for name, operator_size in PRIVATE_HINT_OPERATORS.items()
+        if (value := private.rawDict.get(name)) is not None
+    )
+
+
+def cff_hint_sizes(ttFont):
+    """Source -> bytes taken by hints in the CFF or CFF2 table: the stem hints
+    and hint masks in the charstrings and subroutines, and the hinting
+    values of the private dictionaries."""
+    tag = "CFF2" if "CFF2" in ttFont else "CFF "
+    cff = ttFont[tag].cff
+    top_dict = cff[cff.fontNames[0]] if tag == "CFF " else cff.topDictIndex[0]
+    has_width = tag == "CFF "
+
+    if hasattr(top_dict, "FDArray"):
+        privates = [fd.Private for fd in top_dict.FDArray]
+    else:
+        privates = [top_dict.Private]
+
+    charstrings = top_dict.CharStrings
+    # Decompiling the charstrings also decompiles the subroutines they call,
+    # which can't be done on their own as their hint masks depend on the
+    # number of stems declared before the call.
+    accounting = _T2HintAccounting(cff.GlobalSubrs, has_width)
+    charstring_hints = 0
+    for name in charstrings.keys():
+        charstring = charstrings[name]
+        charstring.decompile()
+        local_subrs = getattr(charstring.private, "Subrs", None) or []
+        charstring_hints += accounting.hint_size(charstring, local_subrs)
+
+    # The subroutines only holding hints are counted as a whole; look for
+    # hints in the other ones, which may call yet more subroutines.
+    subroutine_hints = 0
+    walked = set()
+    while len(walked) < len(accounting.called):
+        for key, (subroutine, local_subrs) in list(accounting.called.items()):
+            if key not in walked:
+                walked.add(key)
+                subroutine_hints += accounting.hint_size(
+                    subroutine, local_subrs, is_subroutine=True
+                )
+    return {
+        "charstrings": charstring_hints,
+        "subroutines": subroutine_hints + accounting.dropped_subroutines_size(),
+        "private dictionaries": sum(
+            _private_hint_size(private) for private in privates
+        ),
+    }
+
+
+def hinting_sizes(ttFont):
+    """Where the hinting bytes of a font are: table tag (or a description of
+    the part of the table) -> size.
+
+    These are estimates, within the table and glyph padding, of what would
+    be saved by dehinting the font. Sizes are the uncompressed ones, also
+    for WOFF and WOFF2 files."""
+    sizes = {}
+    table_size = table_sizes(ttFont)
+    for tag in HINTING_TABLES:
+        if tag in table_size and (tag != "cvar" or "fvar" in ttFont):
+            sizes[tag] = padded(table_size[tag]) + TABLE_RECORD_SIZE
+
+    if "gasp" in table_size:
+        gasp = padded(table_size["gasp"]) - DEHINTED_GASP_SIZE
+        if gasp > 0:
+            sizes["gasp"] = gasp
+
+    if "glyf" in table_size:
+        instructions = sum(glyf_instruction_sizes(ttFont).values())
+        if instructions:
+            sizes["glyf instructions"] = instructions
+
+    if "CFF " in table_size or "CFF2" in table_size:
+        for source, size in cff_hint_sizes(ttFont).items():
+            if size:
+                sizes[f"CFF hints in {source}"] = size
+    return sizes
+
+
+def dehinted_size(font):
+    """The exact size of the file, once dehinted: TrueType fonts are dehinted
+    with dehinter, while the hints of CFF fonts are removed by subsetting the
+    font with pyftsubset. Either way, the whole font is compiled again.
+    Returns None for other kinds of fonts."""
+    from fontTools.ttLib import TTFont
+
+    ttFont = TTFont(font.file)  # Use our own copy since we will dehint it
+    if font.is_ttf:
+        from dehinter.font import dehint
+
+        dehinted_buffer = BytesIO()
+        dehint(ttFont, verbose=False)
+        ttFont.save(dehinted_buffer)
+        return len(dehinted_buffer.getvalue())
+
+    if font.is_cff or font.is_cff2:
+        import tempfile
+        from fontTools.subset import main as pyftsubset
+
+        ext = os.path.splitext(font.file)[1]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp = os.path.join(tmp_dir, f"dehinted{ext}")
+            pyftsubset(
+                [
+                    font.file,
+                    "--no-hinting",
+                    "--glyphs=*",
+                    "--ignore-missing-glyphs",
+                    "--no-notdef-glyph",
+                    "--no-recommended-glyphs",
+                    "--no-layout-closure",
+                    "--layout-features=*",
+                    "--no-desubroutinize",
+                    "--name-languages=*",
+                    "--glyph-names",
+                    "--no-prune-unicode-ranges",
+                    f"--output-file={tmp}",
+                ]
+            )
+            return os.stat(tmp).st_size
+    return None
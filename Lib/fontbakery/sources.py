@@ -0,0 +1,335 @@
+"""
+Shared, lazily loaded access to UFO sources.
+
+Each UFO is opened only once per run, however many of the testables (UFOs
+and designspaces) refer to it. Checks which only need glyph names, code
+points or kerning groups can get them without parsing any glyph outlines;
+the full defcon object is only loaded when something asks for it.
+
+Facts about the outlines of each glyph (see `GlyphFacts`) are kept in an
+on-disk cache keyed by the hash of its .glif file, so that only the glyphs
+which changed since the previous run need to be parsed again. Likewise,
+ufolint is only run on UFOs whose files changed since it last checked them.
+"""
+import hashlib
+import json
+import os
+import pickle
+import plistlib
+import re
+import subprocess
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, FrozenSet, NamedTuple, Tuple
+
+from fontTools.pens.pointPen import AbstractPointPen, PointToSegmentPen
+
+from fontbakery.utils import cache_dir, write_atomically
+
+DEFAULT_GLYPHS_DIRECTORY = "glyphs"
+DEFAULT_LAYER_NAME = "public.default"
+# Bump this whenever GlyphFacts or the way it is computed changes.
+GLYPH_FACTS_VERSION = 1
+UFOLINT_TIMEOUT = 300  # Seconds
+
+UNICODE_ELEMENT = re.compile(rb"""<unicode\s+hex\s*=\s*["']([0-9A-Fa-f]+)["']""")
+XML_COMMENT = re.compile(rb"<!--.*?-->", re.DOTALL)
+# Unicode elements come before any of these in a .glif file.
+GLIF_BODY_ELEMENTS = (b"<outline", b"<lib", b"<anchor", b"<guideline", b"<note")
+
+
+def _read_plist(path, default):
+    try:
+        with open(path, "rb") as f:
+            return plistlib.load(f)
+    except FileNotFoundError:
+        return default
+
+
+def glif_unicodes(glif):
+    """The code points listed by the (bytes) contents of a .glif file, read
+    from its header without parsing the rest of it."""
+    end = len(glif)
+    for element in GLIF_BODY_ELEMENTS:
+        position = glif.find(element)
+        if position != -1:
+            end = min(end, position)
+    header = XML_COMMENT.sub(b"", glif[:end])
+    return [int(value, 16) for value in UNICODE_ELEMENT.findall(header)]
+
+
+class GlyphFacts(NamedTuple):
+    """What the source checks need to know about a glyph's outlines."""
+
+    unicodes: Tuple[int, ...]
+    contours: int
+    points: int
+    segment_types: FrozenSet[str]
+    open_corners: bool
+    components: Tuple[str, ...]
+
+
+class LayerFacts(NamedTuple):
+    name: str
+    is_default: bool
+    glyphs: Dict[str, GlyphFacts]
+
+
+class _GlyphFactsPen(AbstractPointPen):
+    def __init__(self):
+        from fontTools.pens.basePen import NullPen
+        from glyphsLib.filters.eraseOpenCorners import EraseOpenCornersPen
+
+        self.contours = 0
+        self.points = 0
+        self.segment_types = set()
+        self.components = []
+        self.corners_pen = EraseOpenCornersPen(NullPen())
+        self.segment_pen = PointToSegmentPen(self.corners_pen)
+        self.unicodes = []  # Set by glifLib.readGlyphFromString
+
+    def beginPath(self, identifier=None, **kwargs):
+        self.contours += 1
+        self.segment_pen.beginPath()
+
+    def endPath(self):
+        self.segment_pen.endPath()
+
+    def addPoint(self, pt, segmentType=None, smooth=False, name=None, **kwargs):
+        self.points += 1
+        if segmentType:
+            self.segment_types.add(segmentType)
+        self.segment_pen.addPoint(pt, segmentType, smooth, name)
+
+    def addComponent(self, baseGlyphName, transformation, identifier=None, **kwargs):
+        self.components.append(baseGlyphName)
+
+    def facts(self):
+        return GlyphFacts(
+            unicodes=tuple(self.unicodes),
+            contours=self.contours,
+            points=self.points,
+            segment_types=frozenset(self.segment_types),
+            open_corners=self.corners_pen.affected,
+            components=tuple(self.components),
+        )
+
+
+def glif_facts(glif):
+    """The GlyphFacts of the (bytes) contents of a .glif file."""
+    from fontTools.ufoLib.glifLib import readGlyphFromString
+
+    pen = _GlyphFactsPen()
+    readGlyphFromString(glif, glyphObject=pen, pointPen=pen, validate=False)
+    return pen.facts()
+
+
+def glyph_facts(glyph):
+    """The GlyphFacts of a defcon glyph, for fonts which only exist in memory."""
+    pen = _GlyphFactsPen()
+    pen.unicodes = glyph.unicodes
+    glyph.drawPoints(pen)
+    return pen.facts()
+
+
+def font_glyph_facts(font):
+    """The LayerFacts of every layer of a defcon font."""
+    default = font.layers.defaultLayer.name
+    return [
+        LayerFacts(
+            layer.name,
+            layer.name == default,
+            {glyph.name: glyph_facts(glyph) for glyph in layer},
+        )
+        for layer in font.layers
+    ]
+
+
+class UFOSource:
+    """A UFO on disk. The glyph-level metadata is read straight from the
+    files, while `font` gives the complete defcon object."""
+
+    def __init__(self, path):
+        self.path = path
+
+    @cached_property
+    def font(self):
+        import defcon
+
+        return defcon.Font(self.path)
+
+    @cached_property
+    def contents(self):
+        """Glyph name -> path of its .glif file, for the default layer
+        (which, by definition, is always in the "glyphs" directory)."""
+        directory = os.path.join(self.path, DEFAULT_GLYPHS_DIRECTORY)
+        contents = _read_plist(os.path.join(directory, "contents.plist"), {})
+        return {
+            name: os.path.join(directory, filename)
+            for name, filename in contents.items()
+        }
+
+    @property
+    def glyph_names(self):
+        return list(self.contents)
+
+    @cached_property
+    def unicodes(self):
+        """Glyph name -> list of code points, for the default layer."""
+        unicodes = {}
+        for name, path in self.contents.items():
+            with open(path, "rb") as f:
+                unicodes[name] = glif_unicodes(f.read())
+        return unicodes
+
+    @cached_property
+    def layers(self):
+        """(layer name, glyphs directory) of every layer, in order."""
+        return [
+            tuple(layer)
+            for layer in _read_plist(
+                os.path.join(self.path, "layercontents.plist"),
+                [(DEFAULT_LAYER_NAME, DEFAULT_GLYPHS_DIRECTORY)],
+            )
+        ]
+
+    @cached_property
+    def glyph_facts(self):
+        """The LayerFacts of every layer, going through the on-disk cache."""
+        return [
+            LayerFacts(
+                name,
+                directory == DEFAULT_GLYPHS_DIRECTORY,
+                _layer_glyph_facts(os.path.join(self.path, directory)),
+            )
+            for name, directory in self.layers
+        ]
+
+    @cached_property
+    def groups(self):
+        return _read_plist(os.path.join(self.path, "groups.plist"), {})
+
+    @cached_property
+    def kerning(self):
+        return _read_plist(os.path.join(self.path, "kerning.plist"), {})
+
+
+def _layer_glyph_facts(directory):
+    """Glyph name -> GlyphFacts for a glyphs directory. Facts of unchanged
+    .glif files are taken from the cache written by the previous run."""
+    key = hashlib.sha1(
+        f"{os.path.realpath(directory)}|{GLYPH_FACTS_VERSION}".encode()
+    ).hexdigest()
+    cache_path = os.path.join(cache_dir(), "glyph-facts", f"{key[:16]}.pickle")
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:  # pylint: disable=broad-except
+        cached = {}
+
+    facts = {}
+    by_hash = {}
+    contents = _read_plist(os.path.join(directory, "contents.plist"), {})
+    for name, filename in contents.items():
+        with open(os.path.join(directory, filename), "rb") as f:
+            glif = f.read()
+        digest = hashlib.sha1(glif).hexdigest()
+        if digest not in by_hash:
+            by_hash[digest] = cached.get(digest) or glif_facts(glif)
+        facts[name] = by_hash[digest]
+
+    if by_hash.keys() != cached.keys():
+        # Only keep the facts of the glyphs as they are now.
+        try:
+            write_atomically(cache_path, pickle.dumps(by_hash))
+        except OSError:
+            pass
+    return facts
+
+
+class SourcePool:
+    """UFOSource objects keyed by path, so that every UFO is loaded only once
+    per run. Sources are kept for as long as any testable is using them."""
+
+    def __init__(self):
+        self._sources = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, path):
+        key = os.path.realpath(path)
+        with self._lock:
+            source = self._sources.get(key)
+            if source is None:
+                source = self._sources[key] = UFOSource(path)
+            return source
+
+
+def directory_digest(path):
+    """A hash of the names and contents of all the files in a directory."""
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for filename in sorted(files):
+            file_path = os.path.join(root, filename)
+            digest.update(os.path.relpath(file_path, path).encode("utf-8") + b"\0")
+            with open(file_path, "rb") as f:
+                digest.update(hashlib.sha1(f.read()).digest())
+    return digest.hexdigest()
+
+
+def _ufolint_version():
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        return version("ufolint")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _ufolint(path, version):
+    """Lint one UFO, reusing the outcome of an earlier run on the very same
+    files. Returns (passed, output), or None if ufolint is not available."""
+    key = hashlib.sha1(f"{directory_digest(path)}|{version}".encode()).hexdigest()
+    cache_path = os.path.join(cache_dir(), "ufolint", f"{key[:16]}.json")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            passed, output = json.load(f)
+        # The same files may have been linted at another path.
+        return passed, path.join(output)
+    except (OSError, ValueError):
+        pass
+
+    try:
+        process = subprocess.run(
+            ["ufolint", path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            timeout=UFOLINT_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired:
+        return False, f"ufolint did not finish within {UFOLINT_TIMEOUT} seconds."
+    except OSError:
+        return None
+    passed, output = process.returncode == 0, process.stdout.decode()
+    try:
+        write_atomically(
+            cache_path, json.dumps([passed, output.split(path)]).encode("utf-8")
+        )
+    except OSError:
+        pass
+    return passed, output
+
+
+def lint_ufos(paths, jobs=None):
+    """Run ufolint on several UFOs at once, with at most `jobs` (by default,
+    one per CPU) processes at a time. Returns path -> outcome of _ufolint."""
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+    version = _ufolint_version()
+    jobs = min(len(paths), jobs or os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        outcomes = executor.map(lambda path: _ufolint(path, version), paths)
+        return dict(zip(paths, outcomes))
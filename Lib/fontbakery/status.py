@@ -30,6 +30,11 @@ class Status:
 
     __instances = {}
 
+    def __reduce__(self):
+        # Unpickle to the registered instance, e.g. for the results of
+        # checks run in worker processes.
+        return (Status, (self.__name, self.__weight))
+
     def __str__(self):
         return f"<Status {self.__name}>"
 
@@ -0,0 +1,211 @@
+"""
+Shaping sweeps: running the same test over many strings, e.g. every
+combination of a few sets of characters.
+
+Most of those strings are shaped exactly like some other string of the
+sweep. Characters which are mapped to glyphs that take part in the same
+GSUB coverages and classes (and in no glyph-specific rule), and that have
+the same Unicode properties, are interchangeable as far as the glyphs
+HarfBuzz produces are concerned. So only the first string of each class
+of equivalent strings is shaped, and its outcome is reused for all the
+others.
+"""
+import unicodedata
+from functools import cached_property
+
+from fontTools import unicodedata as ot_unicodedata
+from fontTools.ttLib.tables import otTables
+
+from fontbakery.layout import LayoutGraph
+from fontbakery.utils import font_shaper
+
+# Contextual lookups, whose formats 2 and 3 use their Coverage only to
+# decide where to apply, rather than to select glyph-specific data.
+CONTEXTUAL_LOOKUP_TYPES = (5, 6)
+# Tables which make HarfBuzz shape the font in ways we don't model here.
+AAT_TABLES = ("morx", "mort", "kerx")
+
+
+class _SubstitutionClasses:
+    """Works out which glyphs are treated identically by the GSUB table.
+
+    Glyphs that are mentioned on their own (as keys of a substitution,
+    in a glyph-based rule, as indexes into per-glyph records, etc.) are
+    only equivalent to themselves; the other ones are identified by the
+    set of coverages and classes they belong to."""
+
+    def __init__(self, ttFont, layout_graph):
+        self.glyph_names = set(ttFont.getGlyphOrder())
+        self.singletons = set()
+        self.memberships = {}
+
+        for lookup in layout_graph.gsub.lookups:
+            for index, subtable in enumerate(lookup.subtables):
+                self._walk(subtable, (lookup.index, index))
+
+        if "GDEF" in ttFont:
+            gdef = ttFont["GDEF"].table
+            for name in ("GlyphClassDef", "MarkAttachClassDef"):
+                class_def = getattr(gdef, name, None)
+                if class_def:
+                    for glyph, value in class_def.classDefs.items():
+                        self._add(glyph, (name, value))
+            mark_sets = getattr(gdef, "MarkGlyphSetsDef", None)
+            if mark_sets:
+                for index, coverage in enumerate(mark_sets.Coverage):
+                    for glyph in coverage.glyphs:
+                        self._add(glyph, ("MarkGlyphSetsDef", index))
+
+    def _add(self, glyph, membership):
+        self.memberships.setdefault(glyph, set()).add(membership)
+
+    def _walk(self, value, path, indexed=True):
+        if isinstance(value, str):
+            if value in self.glyph_names:
+                self.singletons.add(value)
+        elif isinstance(value, otTables.Coverage):
+            for glyph in value.glyphs:
+                if indexed:
+                    self.singletons.add(glyph)
+                else:
+                    self._add(glyph, path)
+        elif isinstance(value, otTables.ClassDef):
+            for glyph, class_value in value.classDefs.items():
+                self._add(glyph, (path, class_value))
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                self._walk(key, path)
+                self._walk(item, path + (key,))
+        elif isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                # The coverages of the positions of a contextual rule
+                # are not indexes into anything.
+                self._walk(item, path + (index,), indexed=False)
+        elif isinstance(value, otTables.BaseTable):
+            value.ensureDecompiled()
+            contextual = getattr(value, "LookupType", None) in (
+                CONTEXTUAL_LOOKUP_TYPES
+            ) and getattr(value, "Format", None) in (2, 3)
+            for name, item in vars(value).items():
+                self._walk(
+                    item,
+                    path + (name,),
+                    indexed=not (contextual and name == "Coverage"),
+                )
+
+    def key(self, glyph):
+        if glyph in self.singletons:
+            return ("glyph", glyph)
+        return ("class", frozenset(self.memberships.get(glyph, ())))
+
+
+class ShapingSweep:
+    """Shapes strings with a font, reusing the outcome of equivalent strings.
+
+    `verdict(text, buf)` is called with the first string of each class and
+    HarfBuzz's output buffer for it, and whatever it returns is the outcome
+    for every string of that class (so a sweep should only be used with a
+    single verdict function). By default, the strings of a class are
+    only guaranteed to produce the same sequence of glyphs (with equivalent
+    glyphs in the same places). With `by_glyph=True`, only strings which are
+    mapped to the very same glyphs are considered equivalent, so that their
+    glyph positions and outlines are also the same.
+
+    Checks should pass the font's `layout_graph` and `shaper` conditions
+    (as `vharfbuzz`) rather than have the sweep build its own.
+    """
+
+    def __init__(
+        self,
+        ttFont,
+        parameters=None,
+        by_glyph=False,
+        vharfbuzz=None,
+        layout_graph=None,
+    ):
+        self.ttFont = ttFont
+        self.parameters = parameters
+        self.by_glyph = by_glyph
+        if vharfbuzz is not None:
+            self.vharfbuzz = vharfbuzz
+        if layout_graph is not None:
+            self.layout_graph = layout_graph
+        self.cmap = ttFont.getBestCmap() or {}
+        self._outcomes = {}
+        self._char_keys = {}
+        self.shaped = 0  # The number of strings actually shaped
+
+    @cached_property
+    def vharfbuzz(self):
+        return font_shaper(self.ttFont)
+
+    @cached_property
+    def layout_graph(self):
+        return LayoutGraph(self.ttFont)
+
+    @cached_property
+    def uses_aat(self):
+        return any(tag in self.ttFont for tag in AAT_TABLES)
+
+    @cached_property
+    def substitution_classes(self):
+        return _SubstitutionClasses(self.ttFont, self.layout_graph)
+
+    @cached_property
+    def composing(self):
+        """The characters which HarfBuzz could compose into another
+        character of the font."""
+        composing = set()
+        for codepoint in self.cmap:
+            char = chr(codepoint)
+            decomposition = unicodedata.decomposition(char).split()
+            if not decomposition or decomposition[0].startswith("<"):
+                continue
+            parts = "".join(chr(int(part, 16)) for part in decomposition)
+            if unicodedata.normalize("NFC", parts) == char:
+                composing.update(parts)
+        return composing
+
+    def char_key(self, char):
+        key = self._char_keys.get(char)
+        if key is None:
+            glyph = self.cmap.get(ord(char))
+            if (
+                glyph is None
+                or unicodedata.decomposition(char)
+                or char in self.composing
+                or self.uses_aat
+            ):
+                # HarfBuzz may decompose, compose or otherwise deal with
+                # this one in ways that are specific to it.
+                key = ("char", char)
+            else:
+                key = (
+                    unicodedata.category(char),
+                    unicodedata.combining(char),
+                    unicodedata.mirrored(char),
+                    ot_unicodedata.script(char),
+                    # Cluster values count UTF-8 bytes
+                    ("glyph", glyph, len(char.encode("utf-8")))
+                    if self.by_glyph
+                    else self.substitution_classes.key(glyph),
+                )
+            self._char_keys[char] = key
+        return key
+
+    def key(self, text):
+        """Strings with the same key are shaped the same way."""
+        return tuple(self.char_key(char) for char in text)
+
+    def outcome(self, text, verdict):
+        key = self.key(text)
+        if key not in self._outcomes:
+            buf = self.vharfbuzz.shape(text, self.parameters)
+            self.shaped += 1
+            self._outcomes[key] = verdict(text, buf)
+        return self._outcomes[key]
+
+    def outcomes(self, texts, verdict):
+        """Yields (text, outcome) for each of the texts, lazily."""
+        for text in texts:
+            yield text, self.outcome(text, verdict)
@@ -1,14 +1,29 @@
 import os
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Optional, List
+from io import BytesIO
+from typing import ClassVar, Optional, List, Set
 
 from fontTools.ttLib import TTFont
 
 
+class ReleasableMixin:
+    """Cached properties listed in `heavy_properties` may be dropped once the
+    object is no longer needed by the checks being run. They will simply be
+    recomputed if anything asks for them again."""
+
+    heavy_properties: ClassVar[Set[str]] = set()
+
+    def release(self):
+        """Forget the cached values of all heavy properties."""
+        for name in self.heavy_properties:
+            self.__dict__.pop(name, None)
+
+
 @dataclass
-class Testable:
+class Testable(ReleasableMixin):
     file: str
     context: Optional["CheckRunContext"] = None
     singular = "testable"
@@ -73,6 +88,12 @@ class Font(Testable):
     singular = "font"
     description = "OpenType binary"
     extensions = ["otf", "ttf"]
+    heavy_properties: ClassVar[Set[str]] = {"ttFont"}
+
+    def release(self):
+        super().release()
+        if self.context is not None and "font_pool" in self.context.__dict__:
+            self.context.font_pool.release(self)
 
     @cached_property
     def ttFont(self):
@@ -263,17 +284,104 @@ class Font(Testable):
         )
 
 
+class FontCollection:
+    """A TrueType/OpenType Collection file, shared by the TTCFont testables
+    of all of its faces.
+
+    The file is read and its header parsed only once. Faces which point at
+    the same table data (as the faces of CJK collections do for most of
+    their tables) also share the decompiled table objects, just like they
+    share the table data on disk.
+
+    The faces are kept in memory until every one of them has been released.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self._fonts = None
+        self._released = set()  # Indices of the faces released so far
+        self._lock = threading.Lock()
+
+    @cached_property
+    def num_fonts(self):
+        from fontTools.ttLib.sfnt import readTTCHeader
+
+        with open(self.file, "rb") as ttcfile:
+            return readTTCHeader(ttcfile).numFonts
+
+    def _load(self, preload):
+        from fontTools.ttLib import TTCollection, newTable
+
+        with open(self.file, "rb") as ttcfile:
+            data = BytesIO(ttcfile.read())
+        data.name = self.file
+        # Lazy, so that the faces read from our one copy of the file
+        # instead of making their own.
+        fonts = TTCollection(data, shareTables=True, lazy=True).fonts
+        for font in fonts:
+            # TTFont only needs `lazy` to be true in its constructor, where
+            # it would otherwise copy the file. Afterwards it only decides
+            # how lazily tables (cmap, glyf, the subtables of GSUB and GPOS)
+            # are decompiled, so resetting it gives the faces the default
+            # loading of a standalone TTFont. tests/test_testable.py makes
+            # sure that this still holds.
+            font.lazy = None
+            # A shared 'post' table hands its glyph names over to the first
+            # face that asks for them, so each face gets its own.
+            if "post" in font.reader:
+                post = newTable("post")
+                post.decompile(font.reader["post"], font)
+                font["post"] = post
+            font.getGlyphOrder()
+            if preload:
+                # The faces share a file handle, so nothing should be
+                # left to read from it once other threads get to them.
+                font.ensureDecompiled()
+        return fonts
+
+    def ttFont(self, index, preload=False):
+        """One of the faces. With `preload`, all of their tables are read
+        and decompiled right away, so that they can be used from several
+        threads at once."""
+        with self._lock:
+            if self._fonts is None:
+                self._fonts = self._load(preload)
+            return self._fonts[index]
+
+    def table_data(self, index, tag):
+        """The raw data of a table of one of the faces."""
+        ttFont = self.ttFont(index)
+        with self._lock:
+            return ttFont.reader[tag]
+
+    def release(self, index):
+        """Let go of the faces once every one of them has been released.
+        Faces loaded again after that are let go of on their next release."""
+        with self._lock:
+            self._released.add(index)
+            if self._fonts is not None and len(self._released) >= len(self._fonts):
+                self._fonts = None
+
+
 @dataclass
 class TTCFont(Font):
     index: int = 0
+    collection: Optional[FontCollection] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        if self.collection is None:
+            self.collection = FontCollection(self.file)
 
     @cached_property
     def ttFont(self):
-        from fontTools.ttLib import TTCollection
+        preload = self.context is not None and self.context.is_multithreaded
+        return self.collection.ttFont(self.index, preload)
 
-        with open(self.file, "rb") as ttcfile:
-            ttc = TTCollection(ttcfile)
-            return ttc.fonts[self.index]
+    def release(self):
+        super().release()
+        self.collection.release(self.index)
 
     @property
     def file_displayname(self):
@@ -283,11 +391,104 @@ class TTCFont(Font):
 FILE_TYPES = [Readme, Ufo, Designspace, GlyphsFile, MetadataPB, Font]
 
 
+class FontPool:
+    """Shared, read-only TTFont handles for font files that checks need to
+    look at besides the ones being tested (e.g. the other members of a
+    superfamily), keyed by path so that each file is parsed only once
+    per run.
+
+    Each handle is held by the Font testables which asked for it, and is
+    dropped once all of them have been released. Files which are also being
+    tested are served from their Font testable while it has the font loaded,
+    instead of parsing a second copy.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self._fonts = {}
+        self._holders = defaultdict(set)  # ids of the Fonts holding each path
+        self._path_locks = defaultdict(threading.Lock)
+        self._listings = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path):
+        return os.path.realpath(path)
+
+    def get(self, path, holder):
+        """The TTFont of a file, kept for `holder` (a Font testable) until
+        it is released."""
+        key = self._key(path)
+        with self._lock:
+            for font in self.context.testables_by_type.get("font", []):
+                if (
+                    not isinstance(font, TTCFont)
+                    and "ttFont" in font.__dict__
+                    and self._key(font.file) == key
+                ):
+                    return font.ttFont
+            self._holders[key].add(id(holder))
+            path_lock = self._path_locks[key]
+
+        # Other files can be parsed at the same time.
+        with path_lock:
+            if key not in self._fonts:
+                ttFont = TTFont(path)
+                if self.context.is_multithreaded:
+                    # These handles are shared between threads.
+                    ttFont.ensureDecompiled()
+                with self._lock:
+                    self._fonts[key] = ttFont
+            return self._fonts[key]
+
+    def release(self, holder):
+        """Drop the fonts which nothing but `holder` was holding."""
+        with self._lock:
+            for key in list(self._holders):
+                self._holders[key].discard(id(holder))
+                if not self._holders[key]:
+                    del self._holders[key]
+                    self._path_locks.pop(key, None)
+                    self._fonts.pop(key, None)
+
+    def font_files(self, directory):
+        """The paths of all OpenType binaries found in a directory."""
+        key = self._key(directory)
+        with self._lock:
+            if key not in self._listings:
+                self._listings[key] = [
+                    os.path.join(directory, entry)
+                    for entry in os.listdir(directory)
+                    if entry[-4:] in [".otf", ".ttf"]
+                ]
+            return self._listings[key]
+
+
+class SharedResults:
+    """Values that are computed only once per run for each key, and then
+    handed out to everything else that asks for the same key (e.g. the
+    outcome of a check that really only depends on the family name)."""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+        self._key_locks = defaultdict(threading.Lock)
+
+    def get(self, key, compute):
+        with self._lock:
+            key_lock = self._key_locks[key]
+        with key_lock:
+            if key not in self._values:
+                self._values[key] = compute()
+            return self._values[key]
+
+
 @dataclass
-class CheckRunContext:
+class CheckRunContext(ReleasableMixin):
     testables: List[Testable] = field(default_factory=list)
     config: dict = field(default_factory=dict)
     is_multithreaded: bool = False
+    heavy_properties: ClassVar[Set[str]] = {"RIBBI_ttFonts", "VFs"}
 
     @cached_property
     def testables_by_type(self):
@@ -296,6 +497,20 @@ class CheckRunContext:
             by_type[testable.singular].append(testable)
         return by_type
 
+    @cached_property
+    def font_pool(self):
+        return FontPool(self)
+
+    @cached_property
+    def source_pool(self):
+        from fontbakery.sources import SourcePool
+
+        return SourcePool()
+
+    @cached_property
+    def shared_results(self):
+        return SharedResults()
+
     @property  # Can't cache a map
     def ttFonts(self):
         return map(
@@ -351,6 +351,57 @@ def download_file(url):
             )
 
 
+def cache_dir():
+    """The directory where FontBakery keeps data worth reusing between runs."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "fontbakery")
+
+
+def load_snapshot(name, key, build, encode=None, decode=None):
+    """Return the data built by `build()`, going through a pickled snapshot
+    on disk so that it only needs to be built once per `key` (usually the
+    version of the package the data comes from).
+
+    `encode` and `decode` convert the data to and from something picklable.
+    The snapshot is only an optimization: if it can't be read or written,
+    the data is simply built again.
+    """
+    import hashlib
+    import pickle
+
+    digest = hashlib.sha1(f"{key}|{sys.version_info[:2]}".encode()).hexdigest()
+    path = os.path.join(cache_dir(), f"{name}-{digest[:16]}.pickle")
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        return decode(data) if decode else data
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+    data = build()
+    try:
+        write_atomically(path, pickle.dumps(encode(data) if encode else data))
+    except Exception:  # pylint: disable=broad-except
+        pass  # e.g. the data can't be pickled, or the cache is read-only
+    return data
+
+
+def write_atomically(path, data: bytes):
+    """Write a file through a temporary one, so that concurrent processes
+    never see it partially written."""
+    import tempfile
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 def cff_glyph_has_ink(font: TTFont, glyph_name: str) -> bool:
     if "CFF2" in font:
         top_dict = font["CFF2"].cff.topDictIndex[0]
@@ -707,17 +758,77 @@ def image_dimensions(filename):
         return None  # some other file format
 
 
-def can_shape(ttFont, text, parameters=None):
+def font_shaper(ttFont, file=None, index=0):
+    """
+    Returns a Vharfbuzz shaper for a font.
+
+    It shapes face `index` of `file` if that is given. Otherwise the TTFont
+    is compiled in memory, so that fonts which don't match a file on disk
+    (because they were changed after loading) are shaped as they are. Either
+    way, the font is only read once something is shaped.
+    """
+    from io import BytesIO
+
+    import uharfbuzz as hb
+    from vharfbuzz import Vharfbuzz
+
+    class FaceShaper(Vharfbuzz):
+        @property
+        def hbfont(self):
+            if self._hbfont is None:
+                if file is not None:
+                    face = hb.Face(hb.Blob.from_file_path(file), index)
+                else:
+                    data = BytesIO()
+                    ttFont.save(data)
+                    face = hb.Face(data.getvalue())
+                self._hbfont = hb.Font(face)
+            return self._hbfont
+
+    return FaceShaper(file)
+
+
+def can_shape(ttFont, text, parameters=None, layout_graph=None, shaper=None):
     """
     Returns true if the font can render a text string without any
     .notdef characters.
     """
-    from vharfbuzz import Vharfbuzz
+    return not unshapeable_texts(ttFont, [text], parameters, layout_graph, shaper)
+
+
+def unshapeable_texts(ttFont, texts, parameters=None, layout_graph=None, shaper=None):
+    """
+    Returns the texts which the font can not render without any .notdef
+    characters, in their original order.
+
+    Texts whose characters are all in the cmap can't produce .notdef unless
+    a GSUB rule substitutes it in, so only the remaining texts are shaped,
+    all of them with the same HarfBuzz font.
+
+    Checks should pass the font's `layout_graph` and `shaper` conditions;
+    without them, both are built from the TTFont for this call only.
+    """
+    cmap = ttFont.getBestCmap() or {}
+    to_shape = [text for text in texts if not all(ord(c) in cmap for c in text)]
+    if len(to_shape) < len(texts):
+        if layout_graph is None:
+            from fontbakery.layout import LayoutGraph
+
+            layout_graph = LayoutGraph(ttFont)
+        notdef = ttFont.getGlyphOrder()[0]
+        if notdef in layout_graph.substitution_outputs:
+            to_shape = list(texts)
+    if not to_shape:
+        return []
 
-    filename = ttFont.reader.file.name
-    vharfbuzz = Vharfbuzz(filename)
-    buf = vharfbuzz.shape(text, parameters)
-    return all(g.codepoint != 0 for g in buf.glyph_infos)
+    if shaper is None:
+        shaper = font_shaper(ttFont)
+    failed = set()
+    for text in set(to_shape):
+        buf = shaper.shape(text, parameters)
+        if not all(g.codepoint != 0 for g in buf.glyph_infos):
+            failed.add(text)
+    return [text for text in texts if text in failed]
 
 
 def get_family_name(ttFont):
@@ -1,4 +1,5 @@
 import importlib
+import os
 import sys
 import pytest
 
@@ -29,6 +30,19 @@ def remove_import_raiser(module_name):
             sys.meta_path.remove(item)
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_dir(tmp_path_factory):
+    """Keep the on-disk caches (snapshots, timings, ufolint outcomes...)
+    of the test run away from the user's own."""
+    previous = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path_factory.mktemp("cache"))
+    yield
+    if previous is None:
+        del os.environ["XDG_CACHE_HOME"]
+    else:
+        os.environ["XDG_CACHE_HOME"] = previous
+
+
 # FIXME: FSanches: I suspect I've overcomplicated this just because I do not yet
 #                  fully understand how pytest.mark.parametrize handles the values.
 
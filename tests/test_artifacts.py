@@ -0,0 +1,78 @@
+import json
+import os
+
+import pytest
+
+from fontbakery.artifacts import ArtifactStore, references
+from fontbakery.callable import check
+from fontbakery.message import Message
+from fontbakery.reporters.html import HTMLReporter
+from fontbakery.reporters.serialize import JSONReporter
+from fontbakery.status import FAIL, PASS
+
+from test_checkrunner import make_runner
+
+SVG = "<svg>" + "<path d='M0 0L10 10'/>" * 1000 + "</svg>"
+
+
+@check(id="test/draws_something")
+def check_draws_something(font, artifact_store):
+    """A check attaching the same large SVG to its message on every font."""
+    yield FAIL, Message("drawn", f"Look: {artifact_store.add(SVG, 'svg')}")
+
+
+def test_artifact_store(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    reference = store.add(SVG, "svg")
+    assert store.add(SVG.encode("utf-8"), "svg") == reference
+    (name,) = references(f"See {reference}.")
+    assert os.listdir(tmp_path) == [name]
+    assert store.embed(f"See {reference}.") == f"See {SVG}."
+
+
+def run_with_reporters(config, tmp_path):
+    runner = make_runner([check_draws_something], config=config)
+    reporters = [
+        JSONReporter(
+            runner=runner, loglevels=[PASS], output_file=str(tmp_path / "report.json")
+        ),
+        HTMLReporter(
+            runner=runner, loglevels=[PASS], output_file=str(tmp_path / "report.html")
+        ),
+    ]
+    runner.run(reporters)
+    for reporter in reporters:
+        reporter.quiet = True
+        reporter.write()
+    return runner
+
+
+def test_reports_embed_temporary_artifacts(tmp_path):
+    runner = run_with_reporters({}, tmp_path)
+    doc = json.loads((tmp_path / "report.json").read_text())
+    messages = [
+        c["logs"][0]["message"]["message"] for c in doc["sections"][0]["checks"]
+    ]
+    assert messages == [f"Look: {SVG}"] * 2
+    assert SVG in (tmp_path / "report.html").read_text()
+
+    store = runner.context.artifact_store
+    assert store.is_temporary
+    path = store.path
+    assert os.listdir(path)
+    store.cleanup()
+    assert not os.path.exists(path)
+    with pytest.raises(ValueError):
+        store.file("whatever")
+
+
+def test_reports_link_to_kept_artifacts(tmp_path):
+    run_with_reporters({"artifacts_dir": str(tmp_path / "artifacts")}, tmp_path)
+    (name,) = os.listdir(tmp_path / "artifacts")
+
+    doc = json.loads((tmp_path / "report.json").read_text())
+    assert doc["artifacts"] == {name: os.path.join("artifacts", name)}
+    assert f"[[artifact:{name}]]" in json.dumps(doc["sections"])
+    html = (tmp_path / "report.html").read_text()
+    assert SVG not in html
+    assert f'src="artifacts/{name}"' in html
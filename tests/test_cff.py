@@ -0,0 +1,175 @@
+import copy
+import glob
+import os
+import struct
+
+import pytest
+from fontTools.cffLib import FDSelect
+from fontTools.misc.psCharStrings import T2CharString
+from fontTools.ttLib import TTFont
+
+from fontbakery.cff import (
+    CFFAnalysis,
+    FDSELECT,
+    analyze_cff,
+    analyze_cff_table,
+    parse_dict,
+    subr_bias,
+)
+from fontbakery.codetesting import TEST_FILE
+
+
+def reference_analysis(font_file):
+    """The analysis as FontBakery used to make it, by walking the call tree
+    of the charstrings decompiled by fontTools."""
+    analysis = CFFAnalysis()
+    ttFont = TTFont(font_file)
+    tag = "CFF " if "CFF " in ttFont else "CFF2"
+
+    def traverse(info, program, depth):
+        info["max_depth"] = max(info["max_depth"], depth)
+        if depth > 10:
+            return
+        if (
+            len(program) >= 5
+            and program[-1] == "endchar"
+            and all(isinstance(a, int) for a in program[-5:-1])
+        ):
+            info["seac"] = True
+        if "ignore" in program:  # decompiler expresses 'dotsection' as 'ignore'
+            info["dotsection"] = True
+        while program:
+            x = program.pop()
+            if x == "callgsubr":
+                subr = info["global_subrs"][int(program.pop()) + info["gsubr_bias"]]
+                traverse(info, subr.program.copy(), depth + 1)
+            elif x == "callsubr":
+                subr = info["subrs"][int(program.pop()) + info["subr_bias"]]
+                traverse(info, subr.program.copy(), depth + 1)
+
+    def analyze(top_dict, private, fd_index=0):
+        subrs = getattr(private, "Subrs", None) if private is not None else None
+        for glyph_name in top_dict.CharStrings.keys():
+            charstring, selector = top_dict.CharStrings.getItemAndSelector(glyph_name)
+            if selector is not None and selector != fd_index:
+                continue
+            try:
+                charstring.decompile()
+            except RecursionError:
+                analysis.glyphs_recursion_errors.append(glyph_name)
+                continue
+            info = {
+                "global_subrs": top_dict.GlobalSubrs,
+                "gsubr_bias": subr_bias(len(top_dict.GlobalSubrs)),
+                "subrs": subrs,
+                "subr_bias": subr_bias(len(subrs)) if subrs else None,
+                "max_depth": 0,
+            }
+            traverse(info, charstring.program.copy(), 0)
+            if info["max_depth"] > 10:
+                analysis.glyphs_exceed_max.append(glyph_name)
+            if info.get("seac"):
+                analysis.glyphs_endchar_seac.append(glyph_name)
+            if info.get("dotsection"):
+                analysis.glyphs_dotsection.append(glyph_name)
+
+    for top_dict in ttFont[tag].cff.topDictIndex:
+        if hasattr(top_dict, "FDArray"):
+            for fd_index, font_dict in enumerate(top_dict.FDArray):
+                analyze(top_dict, getattr(font_dict, "Private", None), fd_index)
+        else:
+            analyze(top_dict, getattr(top_dict, "Private", None))
+    return analysis
+
+
+def charstring_results(analysis):
+    return (
+        sorted(analysis.glyphs_exceed_max),
+        sorted(analysis.glyphs_recursion_errors),
+        sorted(analysis.glyphs_endchar_seac),
+        sorted(analysis.glyphs_dotsection),
+    )
+
+
+def split_font_dict(font_file, tmp_path, fd_format, glyphs):
+    """A copy of a CFF2 font whose `glyphs` use a second Font DICT, selected
+    with an FDSelect of the given format, in which no subroutine calls
+    another."""
+    ttFont = TTFont(font_file, recalcBBoxes=False)
+    top_dict = ttFont["CFF2"].cff.topDictIndex[0]
+    font_dict = copy.deepcopy(top_dict.FDArray[0])
+    subrs = font_dict.Private.Subrs
+    for i in range(len(subrs)):
+        subrs[i] = T2CharString(program=["return"])
+    top_dict.FDArray.append(font_dict)
+    top_dict.FDSelect = FDSelect()
+    top_dict.FDSelect.format = fd_format
+    top_dict.FDSelect.gidArray = [
+        1 if glyph_name in glyphs else 0 for glyph_name in ttFont.getGlyphOrder()
+    ]
+    path = tmp_path / f"fdselect{fd_format}.otf"
+    ttFont.save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "font_file",
+    [
+        path
+        for pattern in [
+            "source-sans-pro/OTF/SourceSansPro-Regular.otf",
+            "source-sans-pro/VAR/*.otf",
+            "subr_test_fonts/*.otf",
+            "deprecated_operators/*.otf",
+            "rokkitt/Rokkitt-Regular.otf",
+        ]
+        for path in sorted(glob.glob(TEST_FILE(pattern)))
+    ],
+    ids=os.path.basename,
+)
+def test_analyze_cff_matches_fonttools(font_file):
+    glyph_order = TTFont(font_file).getGlyphOrder()
+    analysis = analyze_cff(font_file, glyph_order)
+    assert charstring_results(analysis) == charstring_results(
+        reference_analysis(font_file)
+    )
+
+
+def test_analyze_cff_deprecated_operators_and_nesting():
+    # seac and dotsection
+    seac = analyze_cff(TEST_FILE("deprecated_operators/cff1_endchar_seac.otf"))
+    assert "Agrave" in seac.glyphs_endchar_seac
+    dotsection = analyze_cff(TEST_FILE("deprecated_operators/cff1_dotsection.otf"))
+    assert dotsection.glyphs_dotsection == ["i"]
+
+    # Subroutines nested deeper than 10, and a subroutine calling itself
+    for font_file in glob.glob(TEST_FILE("subr_test_fonts/*.otf")):
+        analysis = analyze_cff(font_file, TTFont(font_file).getGlyphOrder())
+        assert analysis.glyphs_exceed_max == ["D", "E"]
+        assert analysis.glyphs_recursion_errors == ["F"]
+
+
+@pytest.mark.parametrize("fd_format", [0, 3])
+def test_analyze_cff_fdselect(tmp_path, fd_format):
+    font_file = split_font_dict(
+        TEST_FILE("subr_test_fonts/var_subr_test_font_infinite_recursion.otf"),
+        tmp_path,
+        fd_format,
+        glyphs=["D"],
+    )
+    glyph_order = TTFont(font_file).getGlyphOrder()
+    analysis = analyze_cff(font_file, glyph_order)
+    # "D" now calls the flat subroutines of the second Font DICT.
+    assert analysis.glyphs_exceed_max == ["E"]
+    assert charstring_results(analysis) == charstring_results(
+        reference_analysis(font_file)
+    )
+
+    # Unknown FDSelect formats are reported rather than raised.
+    data = bytearray(TTFont(font_file).reader["CFF2"])
+    header_size = data[2]
+    top_dict_size = struct.unpack_from(">H", data, 3)[0]
+    top_dict = parse_dict(data, header_size, header_size + top_dict_size)
+    data[top_dict[FDSELECT][0]] = 7
+    analysis = analyze_cff_table(bytes(data), True, glyph_order)
+    assert analysis.malformed == "Unknown FDSelect format 7"
@@ -0,0 +1,301 @@
+import multiprocessing
+import os
+import queue
+import shutil
+import threading
+import time
+
+import pytest
+
+from fontbakery.callable import check
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.fonts_profile import checks_by_id, load_all_checks, setup_context
+from fontbakery.message import Message
+from fontbakery.profile import Profile, Section
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.status import ERROR, PASS
+from fontbakery.testable import FILE_TYPES
+
+MADA_FONTS = [
+    TEST_FILE("mada/Mada-Regular.ttf"),
+    TEST_FILE("mada/Mada-Bold.ttf"),
+]
+
+
+def make_runner(check_ids, files=MADA_FONTS, config=None, jobs=0):
+    load_all_checks()
+    profile = Profile(
+        name="TestProfile",
+        iterargs={val.singular: val.plural for val in FILE_TYPES},
+        sections=[
+            Section(
+                name="Test",
+                checks=[checks_by_id.get(c, c) for c in check_ids],
+            )
+        ],
+    )
+    context = setup_context(files)
+    return CheckRunner(profile, context, config or {}, jobs=jobs)
+
+
+class RecordingReporter(FontbakeryReporter):
+    def __post_init__(self):
+        super().__post_init__()
+        self.loaded_fonts = []
+
+    def receive_result(self, checkresult):
+        super().receive_result(checkresult)
+        self.loaded_fonts.append(
+            [
+                "ttFont" in font.__dict__
+                for font in self.runner.context.testables_by_type["font"]
+            ]
+        )
+
+
+def test_schedule_finishes_one_font_at_a_time():
+    runner = make_runner(
+        [
+            "opentype/family/equal_font_versions",
+            "opentype/unitsperem",
+            "opentype/kern_table",
+        ]
+    )
+    schedule = runner.schedule(runner.order)
+    assert [identity.iterargs for identity in schedule] == [
+        (),
+        (("font", 0),),
+        (("font", 0),),
+        (("font", 1),),
+        (("font", 1),),
+    ]
+
+
+def test_release_fonts_after_their_last_check():
+    runner = make_runner(
+        [
+            "opentype/family/equal_font_versions",
+            "opentype/unitsperem",
+            "opentype/kern_table",
+        ]
+    )
+    reporter = RecordingReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+
+    # Reporters receive each result right before the runner releases
+    # anything, so the first font is only gone when the second font's
+    # results come in.
+    assert reporter.loaded_fonts == [
+        [True, True],
+        [True, True],
+        [True, True],
+        [False, True],
+        [False, True],
+    ]
+    assert all("ttFont" not in font.__dict__ for font in runner.context.fonts)
+    # Released state is recomputed on demand.
+    assert runner.context.fonts[0].ttFont["head"].unitsPerEm == 1000
+
+
+def test_slow_reporters_get_results_in_batches(monkeypatch):
+    piled_up = threading.Event()
+
+    class WatchedQueue(queue.Queue):
+        def put(self, item, block=True, timeout=None):
+            super().put(item, block, timeout)
+            if self.qsize() >= 4:
+                piled_up.set()
+
+    monkeypatch.setattr(queue, "Queue", WatchedQueue)
+
+    class SlowReporter(FontbakeryReporter):
+        def __post_init__(self):
+            super().__post_init__()
+            self.batches = []
+            self.threads = set()
+
+        def receive_results(self, checkresults):
+            self.batches.append(len(checkresults))
+            self.threads.add(threading.current_thread().name)
+            # Hold up the reporter until the workers have queued up
+            # several more results.
+            assert piled_up.wait(timeout=30)
+            super().receive_results(checkresults)
+
+    fonts = [TEST_FILE("mada/Mada-Regular.ttf")] * 12
+    runner = make_runner(
+        ["opentype/unitsperem", "opentype/kern_table"], files=fonts, jobs=4
+    )
+    reporter = SlowReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+
+    assert sum(reporter.batches) == len(reporter._results) == 24
+    assert max(reporter.batches) >= 4
+    assert reporter.threads == {"fontbakery-reporter"}
+
+
+def test_online_checks_share_requests(requests_mock):
+    requests_mock.get(
+        "https://pypi.org/pypi/fontbakery/json", json={"info": {"version": "0.0.1"}}
+    )
+    runner = make_runner(["fontbakery_version"], config={"skip_network": False})
+    reporter = RecordingReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+
+    assert len(reporter.loaded_fonts) == 2
+    assert requests_mock.call_count == 1
+
+
+def test_checks_run_once_per_cache_key():
+    calls = []
+
+    @check(id="test/once_per_family", cache_key=["family_directory"])
+    def check_once_per_family(font, family_directory):
+        """A check which only depends on the family directory."""
+        calls.append(font.file)
+        return PASS, Message("ok", "Good family")
+
+    runner = make_runner([check_once_per_family])
+    runner.config["overrides"] = {"test/once_per_family": {"ok": "WARN"}}
+    results = [runner._run_check(identity) for identity in runner.order]
+
+    assert len(calls) == 1
+    assert [result.identity.iterargs for result in results] == [
+        (("font", 0),),
+        (("font", 1),),
+    ]
+    first, second = (result.results[0] for result in results)
+    # Every font gets its own copy of the result, so that status overrides
+    # are only applied once to each of them.
+    assert first.message is not second.message
+    assert first.status.name == second.status.name == "WARN"
+
+
+def test_directory_scoped_conditions_are_computed_once(monkeypatch):
+    import fontbakery.utils
+
+    git_calls = []
+
+    def git_rootdir(family_dir):
+        git_calls.append(family_dir)
+
+    monkeypatch.setattr(fontbakery.utils, "git_rootdir", git_rootdir)
+    runner = make_runner([])
+    first, second = runner.context.testables
+
+    assert first.family_directory == second.family_directory
+    assert first.licenses is second.licenses
+    assert git_calls == [first.family_directory]
+
+
+def test_plan_records_how_each_check_runs():
+    runner = make_runner(
+        ["opentype/family/equal_font_versions", "opentype/unitsperem"],
+        config={"exclude_checks": ["unitsperem"]},
+    )
+    versions, unitsperem = runner.plan
+    assert versions.scope == "collection"
+    assert len(versions.identities) == 1
+    assert unitsperem.scope == "not selected"
+    assert unitsperem.identities == ()
+    assert runner.order == versions.identities
+    # The plan is only worked out once.
+    assert runner.plan is runner.plan
+
+
+@check(id="test/slow")
+def check_slow(font):
+    """A check which takes far too long, and keeps saying so."""
+    with open(font.file + ".alive", "a", encoding="utf-8") as alive:
+        alive.write(f"{os.getpid()}\n")
+    while True:
+        time.sleep(0.05)
+        with open(font.file + ".alive", "a", encoding="utf-8") as alive:
+            alive.write(".")
+
+
+@pytest.fixture
+def font_copies(tmp_path):
+    copies = []
+    for font_file in MADA_FONTS:
+        copies.append(str(tmp_path / os.path.basename(font_file)))
+        shutil.copy(font_file, copies[-1])
+    return copies
+
+
+@pytest.mark.parametrize("jobs", [0, 2])
+def test_checks_are_stopped_when_over_budget(font_copies, jobs):
+    runner = make_runner(
+        [check_slow, "opentype/unitsperem"],
+        files=font_copies,
+        config={"timeouts": {"test/slow": 0.5}},
+        jobs=jobs,
+    )
+    reporter = RecordingReporter(runner=runner, loglevels=[PASS])
+    start = time.monotonic()
+    runner.run([reporter])
+    assert time.monotonic() - start < 10
+
+    results = {
+        (result.identity.check.id, result.identity.iterargs): result.results
+        for result in reporter._results
+    }
+    for font in range(2):
+        (timed_out,) = results[("test/slow", (("font", font),))]
+        assert timed_out.status == ERROR
+        assert timed_out.message.code == "timeout"
+        # The rest of the run goes on, as usual.
+        (passed,) = results[("opentype/unitsperem", (("font", font),))]
+        assert passed.status == PASS
+
+    # The checks were really stopped, rather than left running.
+    alive = [open(f + ".alive", encoding="utf-8").read() for f in font_copies]
+    time.sleep(0.5)
+    assert alive == [open(f + ".alive", encoding="utf-8").read() for f in font_copies]
+    for log in alive:
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(log.split()[0]), 0)
+
+
+def test_checks_over_budget_without_worker_processes(font_copies, monkeypatch):
+    def get_context(method=None):
+        raise ValueError(f"cannot find context for {method!r}")
+
+    monkeypatch.setattr(multiprocessing, "get_context", get_context)
+    runner = make_runner(
+        [check_slow], files=font_copies[:1], config={"check_timeout": 0.5}
+    )
+    reporter = RecordingReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    ((timed_out,),) = [result.results for result in reporter._results]
+    assert timed_out.status == ERROR
+    assert timed_out.message.code == "timeout-not-stopped"
+
+
+@check(id="test/sees_font")
+def check_sees_font(font):
+    """A check which tells which TTFont it was given."""
+    return PASS, f"{os.getpid()} {id(font.ttFont)}"
+
+
+def test_checks_with_a_budget_start_from_what_is_loaded():
+    runner = make_runner([check_sees_font], config={"check_timeout": 10})
+    ttFonts = [id(font.ttFont) for font in runner.context.fonts]
+    reporter = RecordingReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    seen = [result.results[0].message.message.split() for result in reporter._results]
+    # Each check ran in a worker process of its own, on the TTFont the run
+    # had already loaded.
+    assert len({pid for pid, _ in seen} | {str(os.getpid())}) == 3
+    assert [int(ttFont) for _, ttFont in seen] == ttFonts
+
+
+def test_checks_are_not_started_when_the_run_is_over_budget():
+    runner = make_runner(["opentype/unitsperem"], config={"run_timeout": 0})
+    reporter = RecordingReporter(runner=runner, loglevels=[PASS])
+    runner.run([reporter])
+    assert [result.results[0].message.code for result in reporter._results] == [
+        "run-timeout",
+        "run-timeout",
+    ]
@@ -1,10 +1,8 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL, SKIP
 
@@ -13,10 +11,10 @@ from fontbakery.status import FAIL, SKIP
 def test_check_inconsistencies_between_fvar_STAT(check):
     """Checking if STAT entries matches fvar and vice versa."""
 
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
     assert_PASS(check(ttFont), "with a good varfont...")
 
-    ttFont = TTFont(TEST_FILE("bad_fonts/fvar_STAT_differences/AxisLocationVAR.ttf"))
+    ttFont = TEST_FONT("bad_fonts/fvar_STAT_differences/AxisLocationVAR.ttf")
     ttFont["name"].removeNames(nameID=277)
     assert_results_contain(
         check(ttFont),
@@ -36,11 +34,11 @@ def test_check_inconsistencies_between_fvar_STAT(check):
 def test_check_STAT_in_statics(check):
     """Checking STAT table on static fonts."""
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: has_STAT_table" in msg
 
-    ttFont = TTFont(TEST_FILE("varfont/RobotoSerif[GRAD,opsz,wdth,wght].ttf"))
+    ttFont = TEST_FONT("varfont/RobotoSerif[GRAD,opsz,wdth,wght].ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: not is_variable_font" in msg
 
@@ -66,8 +64,8 @@ def test_check_STAT_in_statics(check):
 def test_check_STAT_strings(check):
     """Check correctness of STAT table strings"""
 
-    good = TTFont(TEST_FILE("ibmplexsans-vf/IBMPlexSansVar-Roman.ttf"))
+    good = TEST_FONT("ibmplexsans-vf/IBMPlexSansVar-Roman.ttf")
     assert_PASS(check(good))
 
-    bad = TTFont(TEST_FILE("ibmplexsans-vf/IBMPlexSansVar-Italic.ttf"))
+    bad = TEST_FONT("ibmplexsans-vf/IBMPlexSansVar-Italic.ttf")
     assert_results_contain(check(bad), FAIL, "bad-italic")
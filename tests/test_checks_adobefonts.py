@@ -8,7 +8,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     portable_path,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -49,7 +49,7 @@ def test_check_nameid_1_win_english(check):
     """Validate that font has a good nameID 1, Windows/Unicode/US-English
     `name` table record."""
 
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
     assert_PASS(check(ttFont))
 
     name_table = ttFont["name"]
@@ -80,10 +80,10 @@ def test_check_nameid_1_win_english(check):
 def test_check_unsupported_tables(check):
     """Check if font has any unsupported tables."""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("hinting/Roboto-VF.ttf"))
+    ttFont = TEST_FONT("hinting/Roboto-VF.ttf")
     msg = assert_results_contain(check(ttFont), FAIL, "unsupported-tables")
     assert "TSI0" in msg
 
@@ -94,7 +94,7 @@ def test_check_STAT_strings(check):
 
     # This should FAIL (like `STAT_strings`, that it is based on)
     # because it uses "Italic" in names for 'wght' and 'wdth' axes.
-    ttFont = TTFont(TEST_FILE("ibmplexsans-vf/IBMPlexSansVar-Italic.ttf"))
+    ttFont = TEST_FONT("ibmplexsans-vf/IBMPlexSansVar-Italic.ttf")
     msg = assert_results_contain(check(ttFont), FAIL, "bad-italic")
     assert (
         'The following AxisValue entries in the STAT table should not contain "Italic"'
@@ -102,7 +102,7 @@ def test_check_STAT_strings(check):
     )
 
     # Now set up a font using "Italic" for the 'slnt' axis
-    ttFont = TTFont(TEST_FILE("slant_direction/Cairo_correct_slnt_axis.ttf"))
+    ttFont = TEST_FONT("slant_direction/Cairo_correct_slnt_axis.ttf")
     ttFont["name"].setName("Italic", 286, 3, 1, 1033)
     # This should PASS with our check
     assert_PASS(check(ttFont))
@@ -1,6 +1,3 @@
-from unittest.mock import patch
-
-from fontTools.ttLib import TTFont
 import requests
 
 from conftest import check_id
@@ -9,6 +6,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
     MockContext,
 )
 from fontbakery.constants import (
@@ -24,7 +22,7 @@ from fontbakery.profiles import adobefonts as adobefonts_profile
 def test_check_override_whitespace_glyphs(check):
     """Check that overridden test for nbsp yields WARN rather than FAIL."""
 
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
     assert_PASS(check(ttFont))
 
     # remove U+00A0, status should be WARN (standard check would be FAIL)
@@ -37,7 +35,7 @@ def test_check_override_whitespace_glyphs(check):
 def test_check_override_valid_glyphnames(check):
     """Check that overridden test yields WARN rather than FAIL."""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     good_name = "b" * 63
@@ -61,7 +59,7 @@ def test_check_override_family_win_ascent_and_descent(check):
 
     # Our reference Mada Regular is know to FAIL the original check.
     # The overridden check should just WARN.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     msg = assert_results_contain(check(ttFont), WARN, "ascent")
     assert (
         "OS/2.usWinAscent value should be equal or greater than 880,"
@@ -117,7 +115,7 @@ def test_check_override_os2_metrics_match_hhea(check):
     """Check that overridden test yields WARN rather than FAIL."""
 
     # Our reference Mada Black is know to be good here.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Black.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Black.ttf")
     assert_PASS(check(ttFont))
 
     os2_table = ttFont["OS/2"]
@@ -157,7 +155,7 @@ def test_check_override_os2_metrics_match_hhea(check):
 def test_check_override_varfont_valid_default_instance_nameids(check):
     """Check that overriden tests yield WARN instead of FAIL"""
 
-    ttFont_1 = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont_1 = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
 
     # Change subfamilyNameID value of the default instance to another name ID whose
     # string doesn't match the font's Subfamily name, thus making the check fail.
@@ -192,7 +190,7 @@ def test_check_override_varfont_valid_default_instance_nameids(check):
 def test_check_override_inconsistencies_between_fvar_STAT(check):
     """Check that the overridden test yields WARN rather than FAIL"""
 
-    ttFont = TTFont(TEST_FILE("bad_fonts/fvar_STAT_differences/AxisLocationVAR.ttf"))
+    ttFont = TEST_FONT("bad_fonts/fvar_STAT_differences/AxisLocationVAR.ttf")
     # add name with wrong order of name parts
     ttFont["name"].setName("Medium Text", 277, 3, 1, 0x409)
     assert_results_contain(
@@ -202,20 +200,20 @@ def test_check_override_inconsistencies_between_fvar_STAT(check):
 
 @check_id("opentype/weight_class_fvar", profile=adobefonts_profile)
 def test_check_override_weight_class_fvar(check):
-    ttFont = TTFont(TEST_FILE("varfont/Oswald-VF.ttf"))
+    ttFont = TEST_FONT("varfont/Oswald-VF.ttf")
     ttFont["OS/2"].usWeightClass = 333
     assert_results_contain(
         check(ttFont), WARN, "bad-weight-class", "but should match fvar default value."
     )
 
 
-# FIXME: how can we use @check_id here alongside @patch?
-@patch("requests.get", side_effect=requests.exceptions.ConnectionError)
-def test_check_override_fontbakery_version(mock_get):
+@check_id("fontbakery_version", profile=adobefonts_profile)
+def test_check_override_fontbakery_version(check, requests_mock):
     """Check that overridden test yields SKIP rather than FAIL."""
-    from fontbakery.codetesting import CheckTester
-
-    check = CheckTester("fontbakery_version", profile=adobefonts_profile)
+    requests_mock.get(
+        "https://pypi.org/pypi/fontbakery/json",
+        exc=requests.exceptions.ConnectionError,
+    )
 
     font = TEST_FILE("cabin/Cabin-Regular.ttf")
     msg = assert_results_contain(check(font), SKIP, "connection-error")
@@ -226,7 +224,7 @@ def test_check_override_fontbakery_version(mock_get):
 def test_check_override_match_familyname_fullfont(check):
     """Check that overridden test yields WARN rather than FAIL."""
 
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Semibold.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Semibold.otf")
     assert_PASS(check(ttFont))
 
     # Change the Full Font Name string for Microsoft platform record
@@ -249,7 +247,7 @@ def test_check_override_match_familyname_fullfont(check):
 def test_check_override_trailing_spaces(check):
     """Check that overridden test yields WARN rather than FAIL."""
 
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Semibold.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Semibold.otf")
     assert_PASS(check(ttFont))
 
     # Add a trailing space to the License string for Microsoft platform record
@@ -277,7 +275,7 @@ def test_check_override_trailing_spaces(check):
 def test_check_override_bold_wght_coord(check):
     """Check that overriden tests yield WARN rather than FAIL."""
 
-    ttFont = TTFont(TEST_FILE("source-sans-pro/VAR/SourceSansVariable-Roman.otf"))
+    ttFont = TEST_FONT("source-sans-pro/VAR/SourceSansVariable-Roman.otf")
     fvar_table = ttFont["fvar"]
 
     # change the Bold instance 'wght' coord to something other than 700
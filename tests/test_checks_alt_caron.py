@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import FAIL, WARN
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -13,12 +11,12 @@ from fontbakery.codetesting import (
 def test_check_alt_caron(check):
     """Check accent of Lcaron, dcaron, lcaron, tcaron"""
 
-    ttFont = TTFont(TEST_FILE("annie/AnnieUseYourTelescope-Regular.ttf"))
+    ttFont = TEST_FONT("annie/AnnieUseYourTelescope-Regular.ttf")
     assert_results_contain(check(ttFont), WARN, "bad-mark")
     assert_results_contain(check(ttFont), FAIL, "wrong-mark")
 
-    ttFont = TTFont(TEST_FILE("cousine/Cousine-Bold.ttf"))
+    ttFont = TEST_FONT("cousine/Cousine-Bold.ttf")
     assert_results_contain(check(ttFont), WARN, "decomposed-outline")
 
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
     assert_PASS(check(ttFont))
@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.utils import remove_cmap_entry
 
@@ -14,7 +12,7 @@ from fontbakery.utils import remove_cmap_entry
 def test_check_case_mapping(check):
     """Ensure the font supports case swapping for all its glyphs."""
 
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
     # Glyph present in the font                  Missing case-swapping counterpart
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # U+01D3: LATIN CAPITAL LETTER U WITH CARON  U+01D4: LATIN SMALL LETTER U WITH CARON
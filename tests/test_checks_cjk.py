@@ -1,10 +1,8 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import WARN, SKIP
 
@@ -13,10 +11,10 @@ from fontbakery.status import WARN, SKIP
 def test_check_cjk_not_enough_glyphs(check):
     "Any CJK font should contain at least a minimal set of 150 CJK characters."
 
-    ttFont = TTFont(TEST_FILE("cjk/SourceHanSans-Regular.otf"))
+    ttFont = TEST_FONT("cjk/SourceHanSans-Regular.otf")
     assert_PASS(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("montserrat/Montserrat-Regular.ttf"))
+    ttFont = TEST_FONT("montserrat/Montserrat-Regular.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: is_claiming_to_be_cjk_font" in msg
 
@@ -1,10 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL, WARN
 
@@ -39,7 +38,7 @@ def test_check_empty_glyph_on_gid1_for_colrv0(check):
         gid1.draw(pen)
         return pen.value
 
-    ttFont = TTFont(TEST_FILE("color_fonts/AmiriQuranColored_gid1_notempty.ttf"))
+    ttFont = TEST_FONT("color_fonts/AmiriQuranColored_gid1_notempty.ttf")
     assert (
         "COLR" in ttFont.keys()
         and ttFont["COLR"].version == 0
@@ -52,7 +51,7 @@ def test_check_empty_glyph_on_gid1_for_colrv0(check):
         "with a font with COLR table but no empty glyph on GID 1.",
     )
 
-    ttFont = TTFont(TEST_FILE("color_fonts/AmiriQuranColored.ttf"))
+    ttFont = TEST_FONT("color_fonts/AmiriQuranColored.ttf")
     assert (
         "COLR" in ttFont.keys()
         and ttFont["COLR"].version == 0
@@ -7,6 +7,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -40,11 +41,11 @@ def test_check_contour_count(check, montserrat_ttFonts):
     """Check glyphs contain the recommended contour count"""
     from fontTools import subset
 
-    ttFont = TTFont(TEST_FILE("rokkitt/Rokkitt-Regular.otf"))
+    ttFont = TEST_FONT("rokkitt/Rokkitt-Regular.otf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: is_ttf" in msg
 
-    ttFont = TTFont(TEST_FILE("mutatorsans-vf/MutatorSans-VF.ttf"))
+    ttFont = TEST_FONT("mutatorsans-vf/MutatorSans-VF.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: not is_variable_font" in msg
 
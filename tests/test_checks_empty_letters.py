@@ -1,10 +1,8 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL, WARN
 
@@ -14,15 +12,15 @@ def test_check_empty_letters(check):
     """Validate that empty glyphs are found."""
 
     # this OT-CFF font has inked glyphs for all letters
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
     assert_PASS(check(ttFont))
 
     # this OT-CFF2 font has inked glyphs for all letters
-    ttFont = TTFont(TEST_FILE("source-sans-pro/VAR/SourceSansVariable-Italic.otf"))
+    ttFont = TEST_FONT("source-sans-pro/VAR/SourceSansVariable-Italic.otf")
     assert_PASS(check(ttFont))
 
     # this TrueType font has inked glyphs for all letters
-    ttFont = TTFont(TEST_FILE("source-sans-pro/TTF/SourceSansPro-Bold.ttf"))
+    ttFont = TEST_FONT("source-sans-pro/TTF/SourceSansPro-Bold.ttf")
     assert_PASS(check(ttFont))
 
     # Add 2 Korean hangul syllable characters to cmap table mapped to the 'space' glyph.
@@ -37,6 +35,6 @@ def test_check_empty_letters(check):
 
     # this font has empty glyphs for several letters,
     # the first of which is 'B' (U+0042)
-    ttFont = TTFont(TEST_FILE("familysans/FamilySans-Regular.ttf"))
+    ttFont = TEST_FONT("familysans/FamilySans-Regular.ttf")
     msg = assert_results_contain(check(ttFont), FAIL, "empty-letter")
     assert msg == "U+0042 should be visible, but its glyph ('B') is empty."
@@ -1,4 +1,4 @@
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 import requests
@@ -12,6 +12,8 @@ from fontbakery.codetesting import (
 )
 from fontbakery.checks.fontbakery_version import is_up_to_date
 
+PYPI_URL = "https://pypi.org/pypi/fontbakery/json"
+
 
 @pytest.mark.parametrize(
     "installed, latest, result",
@@ -60,8 +62,7 @@ class MockDistribution:
 # We don't want to make an actual GET request to PyPI.org, so we'll mock it.
 # We'll also mock pip-api's 'installed_distributions' method.
 @patch("pip_api.installed_distributions")
-@patch("requests.get")
-def test_check_fontbakery_version(mock_get, mock_installed):
+def test_check_fontbakery_version(mock_installed, requests_mock):
     """Check if FontBakery is up-to-date"""
     from fontbakery.codetesting import CheckTester
 
@@ -71,13 +72,9 @@ def test_check_fontbakery_version(mock_get, mock_installed):
     # The check requires a 'font' argument but it doesn't do anything with it.
     font = TEST_FILE("nunito/Nunito-Regular.ttf")
 
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-
     # Test the case of installed version being the same as PyPI's version.
     latest_ver = installed_ver = "0.1.0"
-    mock_response.json.return_value = {"info": {"version": latest_ver}}
-    mock_get.return_value = mock_response
+    requests_mock.get(PYPI_URL, json={"info": {"version": latest_ver}})
     mock_installed.return_value = {"fontbakery": MockDistribution(installed_ver)}
     assert_PASS(check(font))
 
@@ -96,13 +93,12 @@ def test_check_fontbakery_version(mock_get, mock_installed):
     ) in msg
 
     # Test the case of an unsuccessful response to the GET request.
-    mock_response.status_code = 500
-    mock_response.content = "500 Internal Server Error"
+    requests_mock.get(PYPI_URL, status_code=500, text="500 Internal Server Error")
     msg = assert_results_contain(check(font), FAIL, "unsuccessful-request-500")
     assert "Request to PyPI.org was not successful" in msg
 
     # Test the case of the GET request failing due to a connection error.
-    mock_get.side_effect = requests.exceptions.ConnectionError
+    requests_mock.get(PYPI_URL, exc=requests.exceptions.ConnectionError)
     msg = assert_results_contain(check(font), FAIL, "connection-error")
     assert "Request to PyPI.org failed with this message" in msg
 
@@ -6,6 +6,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -13,7 +14,7 @@ from fontbakery.codetesting import (
 def test_check_vendor_id(check):
     """Checking OS/2 achVendID."""
 
-    ttFont = TTFont(TEST_FILE("abeezee/ABeeZee-Italic.ttf"))
+    ttFont = TEST_FONT("abeezee/ABeeZee-Italic.ttf")
     assert_results_contain(
         check(ttFont), FAIL, "bad-vendor-id", ", but should be 'WERK'."
     )
@@ -1,10 +1,8 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL
 
@@ -13,7 +11,7 @@ from fontbakery.status import FAIL
 def test_check_nested_components(check):
     """Ensure glyphs do not have components which are themselves components."""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     # We need to create a nested component. "second" has components, so setting
@@ -6,6 +6,7 @@ from fontbakery.codetesting import (
     assert_results_contain,
     portable_path,
     TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL
 from fontbakery.utils import can_shape, remove_cmap_entry
@@ -47,7 +48,7 @@ def test_check_whitespace_glyphs(check):
     """Font contains glyphs for whitespace characters?"""
 
     # Our reference Mada Regular font is good here:
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     assert_PASS(check(ttFont), "with a good font...")
 
     # We remove the nbsp char (0x00A0)
@@ -62,7 +63,7 @@ def test_check_whitespace_glyphs(check):
     )
 
     # restore original Mada Regular font:
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # And finally do the same with the space character (0x0020):
     remove_cmap_entry(ttFont, 0x0020)
@@ -1,5 +1,6 @@
 import math
 import os
+import re
 import shutil
 
 import pytest
@@ -11,7 +12,9 @@ from fontbakery.checks.vendorspecific.googlefonts.conditions import (
     expected_font_names,
 )
 from fontbakery.codetesting import (
+    CheckTester,
     TEST_FILE,
+    TEST_FONT,
     MockFont,
     assert_PASS,
     assert_results_contain,
@@ -28,6 +31,7 @@ from fontbakery.constants import (
     WindowsEncodingID,
     WindowsLanguageID,
 )
+from fontbakery.fonts_profile import setup_context
 from fontbakery.status import DEBUG, ERROR, FAIL, FATAL, INFO, PASS, SKIP, WARN
 from fontbakery.testable import Font
 
@@ -338,14 +342,14 @@ def test_check_name_line_breaks(check):
     """Name table entries should not contain line-breaks."""
 
     # Our reference Mada Regular font is good here:
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
 
     num_entries = len(ttFont["name"].names)
     for i in range(num_entries):
-        ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+        ttFont = TEST_FONT("mada/Mada-Regular.ttf")
         encoding = ttFont["name"].names[i].getEncoding()
         ttFont["name"].names[i].string = "bad\nstring".encode(encoding)
         assert_results_contain(
@@ -360,7 +364,7 @@ def test_check_name_line_breaks(check):
 def test_check_name_rfn(check):
     """Name table strings must not contain 'Reserved Font Name'."""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     # The OFL text contains the term 'Reserved Font Name',
@@ -435,7 +439,7 @@ def test_check_family_name_compliance(check):
                     )
 
     # CAMEL CASE
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
     assert_PASS(check(ttFont), "with a good font...")
 
     # FAIL with a CamelCased name:
@@ -620,7 +624,7 @@ def test_check_fstype(check):
     """Checking OS/2 fsType"""
 
     # our reference Cabin family is know to be good here.
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
     assert_PASS(check(ttFont), "with a good font without DRM.")
 
     # modify the OS/2 fsType value to something different than zero:
@@ -699,7 +703,7 @@ def test_check_vendor_id(check):
     """Checking OS/2 achVendID"""
 
     # Let's start with our reference Merriweather Regular
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
 
     bad_vids = ["UKWN", "ukwn", "PfEd", "PYRS"]
     for bad_vid in bad_vids:
@@ -728,7 +732,7 @@ def test_check_glyph_coverage(check):
     """Check glyph coverage."""
 
     # Our reference Cabin Regular is known to be bad here.
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
 
     # Deactivating this for now as GF_TransLatin_Arabic isn't available under
     # the new glyphset setup yet.
@@ -749,7 +753,7 @@ def test_check_glyph_coverage(check):
     assert_PASS(check(ttFont), "with a good font.")
 
     # Moirai is Korean, so only needs kernel
-    ttFont = TTFont(TEST_FILE("moiraione/MoiraiOne-Regular.ttf"))
+    ttFont = TEST_FONT("moiraione/MoiraiOne-Regular.ttf")
     assert 0x02C7 not in ttFont.getBestCmap()  # This is in core but not kernel
     assert_PASS(check(ttFont))
 
@@ -950,7 +954,7 @@ def test_check_name_description_max_length(check):
     """Description strings in the name table must not exceed 200 characters."""
 
     # Our reference Mada Regular is know to be good here.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     assert_PASS(check(ttFont), "with a good font...")
 
     # Here we add strings to NameID.DESCRIPTION with exactly 100 chars,
@@ -975,7 +979,7 @@ def test_check_name_version_format(check):
     """Version format is correct in 'name' table ?"""
 
     # Our reference Mada Regular font is good here:
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
@@ -1043,7 +1047,7 @@ def test_check_name_familyname_first_char(check):
     """Make sure family name does not begin with a digit."""
 
     # Our reference Mada Regular is known to be good
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
@@ -1603,10 +1607,10 @@ def test_check_metadata_valid_nameid25(check):
     """Check name ID 25 to end with "Italic" for Italic VFs"""
 
     # PASS
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")
     assert_PASS(check(ttFont), f"with a good font ({ttFont})...")
 
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")
     assert_PASS(check(ttFont), f"with a good font ({ttFont})...")
 
     def set_name(font, nameID, string):
@@ -1770,7 +1774,7 @@ def test_check_metadata_nameid_family_and_full_names(check):
     match the values declared on the name table?"""
 
     # Our reference Merriweather Regular is known to be good here.
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
     assert_PASS(check(ttFont), "with a good font...")
 
     # There we go again!
@@ -1946,11 +1950,11 @@ def test_check_metadata_consistent_repo_urls(check):
     )
 
     # League Gothic got a bad repo in DESCRIPTION.en.html
-    ttFont = TTFont(TEST_FILE("leaguegothic-vf/LeagueGothic[wdth].ttf"))
+    ttFont = TEST_FONT("leaguegothic-vf/LeagueGothic[wdth].ttf")
     assert_results_contain(check(ttFont), FAIL, "mismatch", "with different URLs...")
 
     # CabinVF got a bad repo in OFL.txt
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
     assert_results_contain(check(ttFont), FAIL, "mismatch", "with different URLs...")
 
 
@@ -1975,7 +1979,7 @@ def test_check_metadata_primary_script(check):
         WARN,
         "wrong-primary-script",
     )
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
     assert_PASS(check(ttFont))
 
 
@@ -1983,7 +1987,7 @@ def test_check_metadata_primary_script(check):
 def test_check_unitsperem(check):
     """Stricter unitsPerEm criteria for Google Fonts."""
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
 
     PASS_VALUES = [
         16,
@@ -2270,7 +2274,7 @@ def test_check_name_mandatory_entries(check):
 
     # === First with a RIBBI font: ===
     # Our reference Cabin Regular is known to be good
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
     assert_PASS(check(ttFont), "with a good RIBBI font...")
 
     mandatory_entries = [
@@ -2282,7 +2286,7 @@ def test_check_name_mandatory_entries(check):
 
     # then we "remove" each mandatory entry one by one:
     for mandatory in mandatory_entries:
-        ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+        ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
         for i, name in enumerate(ttFont["name"].names):
             if name.nameID == mandatory:
                 ttFont["name"].names[
@@ -2299,7 +2303,7 @@ def test_check_name_mandatory_entries(check):
 
     # === And now a non-RIBBI font: ===
     # Our reference Merriweather Black is known to be good
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Black.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Black.ttf")
     assert_PASS(check(ttFont), "with a good non-RIBBI font...")
 
     mandatory_entries = [
@@ -2313,7 +2317,7 @@ def test_check_name_mandatory_entries(check):
 
     # then we (again) "remove" each mandatory entry one by one:
     for mandatory in mandatory_entries:
-        ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Black.ttf"))
+        ttFont = TEST_FONT("merriweather/Merriweather-Black.ttf")
         for i, name in enumerate(ttFont["name"].names):
             if name.nameID in mandatory_entries:
                 ttFont["name"].names[
@@ -2340,7 +2344,7 @@ def test_condition_familyname_with_spaces():
 def test_check_varfont_generate_static(check):
     """Check a static ttf can be generated from a variable font."""
 
-    ttFont = TTFont(TEST_FILE("cabinvfbeta/CabinVFBeta.ttf"))
+    ttFont = TEST_FONT("cabinvfbeta/CabinVFBeta.ttf")
     assert_PASS(check(ttFont))
 
     # Mangle the coordinates of the first named instance
@@ -2360,7 +2364,7 @@ def test_check_varfont_has_HVAR(check):
     """Check that variable fonts have an HVAR table."""
 
     # Our reference Cabin Variable Font contains an HVAR table.
-    ttFont = TTFont(TEST_FILE("cabinvfbeta/CabinVFBeta.ttf"))
+    ttFont = TEST_FONT("cabinvfbeta/CabinVFBeta.ttf")
 
     # So the check must PASS.
     assert_PASS(check(ttFont))
@@ -2374,7 +2378,7 @@ def test_check_varfont_has_HVAR(check):
 def test_check_fvar_instances__another_test(check):  # TODO: REVIEW THIS.
     """Check variable font instances."""
 
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
 
     # rename the first fvar instance so the font is broken
     ttFont["name"].setName("foo", 258, 3, 1, 0x409)
@@ -2397,7 +2401,7 @@ def test_check_fvar_instances__yet_another_test(check):  # TODO: REVIEW THIS.
     # ExpletusVF does have instances.
     # Note: The "broken" in the path name refers to something else.
     #       (See test_check_fvar_name_entries)
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
@@ -2417,7 +2421,7 @@ def test_check_fvar_instances__whats_going_on_here(check):  # TODO: REVIEW THIS.
 
     # This copy of Markazi Text has an instance with
     # a 491 'wght' coordinate instead of 500.
-    ttFont = TTFont(TEST_FILE("broken_markazitext/MarkaziText-VF.ttf"))
+    ttFont = TEST_FONT("broken_markazitext/MarkaziText-VF.ttf")
 
     # So it must FAIL the check:
     assert_results_contain(
@@ -3211,7 +3215,7 @@ def test_check_gf_axisregistry_fvar_axis_defaults(check):
 
     # The default value for the axes in this reference varfont
     # are properly registered in the registry:
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
     assert_PASS(check(ttFont))
 
     # And this value surely doen't map to a fallback name in the registry
@@ -3227,11 +3231,11 @@ def test_check_STAT_gf_axisregistry(check):
 
     # Our reference varfont, CabinVF,
     # has "Regular", instead of "Roman" in its 'ital' axis on the STAT table:
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
     assert_results_contain(check(ttFont), FAIL, "invalid-name")
 
     # LibreCaslonText is good though:
-    ttFont = TTFont(TEST_FILE("librecaslontext/LibreCaslonText[wght].ttf"))
+    ttFont = TEST_FONT("librecaslontext/LibreCaslonText[wght].ttf")
     assert_PASS(check(ttFont))
 
     # Let's break it by setting an invalid coordinate for "Bold":
@@ -3403,7 +3407,7 @@ def test_check_use_typo_metrics(check):
     """All non-CJK fonts checked with the googlefonts profile
     should have OS/2.fsSelection bit 7 (USE TYPO METRICS) set."""
 
-    ttFont = TTFont(TEST_FILE("abeezee/ABeeZee-Regular.ttf"))
+    ttFont = TEST_FONT("abeezee/ABeeZee-Regular.ttf")
     fsel = ttFont["OS/2"].fsSelection
 
     # set bit 7
@@ -3419,8 +3423,8 @@ def test_check_use_typo_metrics(check):
 def test_check_use_typo_metrics_with_cjk(check):
     """All CJK fonts checked with the googlefonts profile should skip this check"""
 
-    tt_pass_clear = TTFont(TEST_FILE("cjk/SourceHanSans-Regular.otf"))
-    tt_pass_set = TTFont(TEST_FILE("cjk/SourceHanSans-Regular.otf"))
+    tt_pass_clear = TEST_FONT("cjk/SourceHanSans-Regular.otf")
+    tt_pass_set = TEST_FONT("cjk/SourceHanSans-Regular.otf")
 
     fs_selection = 0
 
@@ -3445,7 +3449,7 @@ def test_check_meta_script_lang_tags(check):
 
     # This sample font from the Noto project declares
     # the script/lang tags in the meta table correctly:
-    ttFont = TTFont(TEST_FILE("meta_tag/NotoSansPhagsPa-Regular-with-meta.ttf"))
+    ttFont = TEST_FONT("meta_tag/NotoSansPhagsPa-Regular-with-meta.ttf")
     assert_results_contain(check(ttFont), INFO, "dlng-tag")
     assert_results_contain(check(ttFont), INFO, "slng-tag")
 
@@ -3845,16 +3849,112 @@ def test_check_shape_languages(check):
 
     #    FIXME: With the latest version of shaperglot (v0.6.3), our reference
     #    Cabin-Regular.ttf is not fully passing anymore:
-    #    test_font = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    #    test_font = TEST_FONT("cabin/Cabin-Regular.ttf")
     #    assert_PASS(check(test_font))
 
-    test_font = TTFont(TEST_FILE("BadGrades/BadGrades-VF.ttf"))
+    test_font = TEST_FONT("BadGrades/BadGrades-VF.ttf")
     assert_results_contain(check(test_font), FAIL, "no-glyphset-supported")
 
-    test_font = TTFont(TEST_FILE("annie/AnnieUseYourTelescope-Regular.ttf"))
+    test_font = TEST_FONT("annie/AnnieUseYourTelescope-Regular.ttf")
     assert_results_contain(check(test_font), FAIL, "failed-language-shaping")
 
 
+def normalized_glyphsets(fulfilled):
+    return {
+        glyphset: (sorted(info["has"]), sorted(info["missing"]), info["percentage"])
+        for glyphset, info in fulfilled.items()
+    }
+
+
+def normalized_results(results):
+    # Shaperglot lists missing characters in no particular order.
+    return [
+        (
+            result.status,
+            result.message.code,
+            re.sub(
+                r"(?<=missing from the font: )[^|\n]*",
+                lambda m: ", ".join(sorted(m.group(0).strip().split(", "))),
+                result.message.message,
+            ),
+        )
+        for result in results
+    ]
+
+
+@pytest.mark.parametrize(
+    "font_file",
+    [
+        "cabin/Cabin-Regular.ttf",
+        "moiraione/MoiraiOne-Regular.ttf",
+        "annie/AnnieUseYourTelescope-Regular.ttf",
+        "BadGrades/BadGrades-VF.ttf",
+    ],
+)
+def test_glyphsets_fulfilled_matches_glyphsets(font_file):
+    """The glyphsets_fulfilled condition gives what the checks used to
+    compute with glyphsets.get_glyphsets_fulfilled, and so do the checks
+    which use it."""
+    from glyphsets import get_glyphsets_fulfilled
+
+    font = Font(TEST_FILE(font_file))
+    expected = get_glyphsets_fulfilled(font.ttFont)
+    assert normalized_glyphsets(font.glyphsets_fulfilled) == normalized_glyphsets(
+        expected
+    )
+
+    mock = MockFont(file=font.file, ttFont=font.ttFont, glyphsets_fulfilled=expected)
+    for check_id in [
+        "googlefonts/glyph_coverage",
+        "googlefonts/glyphsets/shape_languages",
+    ]:
+        check = CheckTester(check_id)
+        assert normalized_results(check(mock)) == normalized_results(
+            check(TEST_FILE(font_file))
+        )
+
+
+def test_glyphsets_conditions_are_shared(monkeypatch):
+    """Glyphset coverage is computed once per font, and shaperglot's
+    language database once per run, however many checks use them."""
+    import shaperglot
+
+    import fontbakery.checks.vendorspecific.googlefonts.conditions as conditions
+
+    coverage_calls = []
+    gf_glyphsets = conditions.gf_glyphsets
+
+    def counting_gf_glyphsets():
+        coverage_calls.append(1)
+        return gf_glyphsets()
+
+    languages_calls = []
+    Languages = shaperglot.Languages
+
+    def counting_languages():
+        languages_calls.append(1)
+        return Languages()
+
+    monkeypatch.setattr(conditions, "gf_glyphsets", counting_gf_glyphsets)
+    monkeypatch.setattr(shaperglot, "Languages", counting_languages)
+
+    context = setup_context(
+        [
+            TEST_FILE("annie/AnnieUseYourTelescope-Regular.ttf"),
+            TEST_FILE("cabin/Cabin-Regular.ttf"),
+        ]
+    )
+    for check_id in [
+        "googlefonts/glyph_coverage",
+        "googlefonts/glyphsets/shape_languages",
+    ]:
+        runner = CheckTester(check_id).runner.with_context(context)
+        for identity in runner.order:
+            runner._run_check(identity)
+    assert len(coverage_calls) == 2
+    assert len(languages_calls) == 1
+
+
 @check_id("googlefonts/metadata/minisite_url")
 def test_check_metadata_minisite_url(check):
     """Validate minisite_url field"""
@@ -1,10 +1,10 @@
-from fontTools.ttLib import newTable, TTFont
+from fontTools.ttLib import newTable
 
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL
 
@@ -13,7 +13,7 @@ from fontbakery.status import FAIL
 def test_check_colorfont_tables(check):
     """Ensure font has the expected color font tables."""
 
-    ttFont = TTFont(TEST_FILE("color_fonts/noto-glyf_colr_1.ttf"))
+    ttFont = TEST_FONT("color_fonts/noto-glyf_colr_1.ttf")
     assert "SVG " not in ttFont.keys()
     assert "COLR" in ttFont.keys()
     assert ttFont["COLR"].version == 1
@@ -1,7 +1,6 @@
 import pytest
-from fontTools.ttLib import TTFont
 
-from fontbakery.codetesting import TEST_FILE, MockContext, MockFont
+from fontbakery.codetesting import TEST_FILE, TEST_FONT, MockContext, MockFont
 from fontbakery.fonts_profile import setup_context
 from fontbakery.testable import Font
 from fontbakery.utils import is_icon_font
@@ -77,9 +76,9 @@ def test_stylenames_are_canonical_condition():
 
 
 def test_is_icon_font_condition():
-    font = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    font = TEST_FONT("mada/Mada-Regular.ttf")
     assert is_icon_font(font, {}) is False
     assert is_icon_font(font, {"is_icon_font": True}) is True
 
-    font = TTFont(TEST_FILE("notoemoji/NotoEmoji-Regular.ttf"))
+    font = TEST_FONT("notoemoji/NotoEmoji-Regular.ttf")
     assert is_icon_font(font, {}) is True
@@ -3,6 +3,7 @@ from fontTools.ttLib import TTFont
 from conftest import check_id
 from fontbakery.codetesting import (
     TEST_FILE,
+    TEST_FONT,
     MockFont,
     assert_PASS,
     assert_results_contain,
@@ -48,14 +49,14 @@ def test_check_italic_angle(check):
             )
 
     # Cairo, check left and right-leaning explicitly
-    ttFont = TTFont(TEST_FILE("cairo/CairoPlay-Italic.rightslanted.ttf"))
+    ttFont = TEST_FONT("cairo/CairoPlay-Italic.rightslanted.ttf")
     assert_PASS(check(MockFont(file=font, ttFont=ttFont, style="Italic")))
     ttFont["post"].italicAngle *= -1
     assert_results_contain(
         check(MockFont(file=font, ttFont=ttFont, style="Italic")), FAIL, "positive"
     )
 
-    ttFont = TTFont(TEST_FILE("cairo/CairoPlay-Italic.leftslanted.ttf"))
+    ttFont = TEST_FONT("cairo/CairoPlay-Italic.leftslanted.ttf")
     assert_PASS(check(MockFont(file=font, ttFont=ttFont, style="Italic")))
     ttFont["post"].italicAngle *= -1
     assert_results_contain(
@@ -79,29 +80,29 @@ def test_check_STAT_ital_axis__axes_values_and_flags(check):
     assert_PASS(results)
 
     # FAIL
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")
     ttFont["STAT"].table.AxisValueArray.AxisValue[6].Value = 1
     assert_results_contain(check(ttFont), FAIL, "wrong-ital-axis-value")
 
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")
     ttFont["STAT"].table.AxisValueArray.AxisValue[6].Flags = 0
     assert_results_contain(check(ttFont), FAIL, "wrong-ital-axis-flag")
 
     ttFonts = [
-        TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")),
-        TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")),
+        TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"),
+        TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"),
     ]
     ttFonts[1]["STAT"].table.AxisValueArray.AxisValue[6].Value = 0
     assert_results_contain(check(ttFonts), FAIL, "wrong-ital-axis-value")
 
     ttFonts = [
-        TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")),
-        TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")),
+        TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"),
+        TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"),
     ]
     ttFonts[1]["STAT"].table.AxisValueArray.AxisValue[6].Flags = 2
     assert_results_contain(check(ttFonts), FAIL, "wrong-ital-axis-flag")
 
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")
     ttFont["STAT"].table.AxisValueArray.AxisValue[6].LinkedValue = None
     assert_results_contain(check(ttFont), FAIL, "wrong-ital-axis-linkedvalue")
 
@@ -111,8 +112,8 @@ def test_check_STAT_ital_axis(check):
     """Ensure VFs have 'ital' STAT axis."""
 
     ttFonts = [
-        TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")),
-        TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")),
+        TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"),
+        TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"),
     ]
     # Move last axis (ital) to the front
     ttFonts[1]["STAT"].table.DesignAxisRecord.Axis = [
@@ -131,17 +132,17 @@ def test_check_STAT_ital_axis(check):
 def test_check_alt_caron(check):
     """Check accent of Lcaron, dcaron, lcaron, tcaron"""
 
-    ttFont = TTFont(TEST_FILE("annie/AnnieUseYourTelescope-Regular.ttf"))
+    ttFont = TEST_FONT("annie/AnnieUseYourTelescope-Regular.ttf")
     assert_results_contain(
         check(ttFont), FAIL, "bad-mark"  # deviation from universal profile
     )
 
     assert_results_contain(check(ttFont), FAIL, "wrong-mark")
 
-    ttFont = TTFont(TEST_FILE("cousine/Cousine-Bold.ttf"))
+    ttFont = TEST_FONT("cousine/Cousine-Bold.ttf")
     assert_results_contain(check(ttFont), WARN, "decomposed-outline")
 
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
     assert_PASS(check(ttFont))
 
 
@@ -150,7 +151,7 @@ def test_check_linegaps(check):
     """Checking Vertical Metric Linegaps."""
 
     # Our reference Mada Regular is know to be bad here.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # But just to be sure, we first explicitely set
     # the values we're checking for:
@@ -1,8 +1,7 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     TEST_FILE,
+    TEST_FONT,
     assert_PASS,
     assert_results_contain,
 )
@@ -16,7 +15,7 @@ def test_check_gpos_kerning_info(check):
     # Our reference Mada Regular is known to have kerning-info
     # exclusively on an extension subtable
     # (lookup type = 9 / ext-type = 2):
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a font that has got kerning info...")
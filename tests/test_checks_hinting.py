@@ -1,10 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL, INFO
 
@@ -19,9 +18,15 @@ def test_check_hinting_impact(check):
     )
 
     font = TEST_FILE("rokkitt/Rokkitt-Bold.otf")
-    assert_results_contain(
+    msg = assert_results_contain(
         check(font), INFO, "size-impact", "this check always emits an INFO result..."
     )
+    assert "Dehinted Size (estimated)" in msg
+
+    # With PRECISE set, the font is actually dehinted and measured.
+    config = {"hinting_impact": {"PRECISE": True}}
+    msg = assert_results_contain(check(font, config=config), INFO, "size-impact")
+    assert "Dehinted Size" in msg and "(estimated)" not in msg
 
 
 @check_id("integer_ppem_if_hinted")
@@ -31,7 +36,7 @@ def test_check_integer_ppem_if_hinted(check):
     # Our reference Merriweather Regular is hinted, but does not set
     # the "rounded PPEM" flag (bit 3 on the head table flags) as
     # described at https://docs.microsoft.com/en-us/typography/opentype/spec/head
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
 
     # So it must FAIL the check:
     assert_results_contain(check(ttFont), FAIL, "bad-flags", "with a bad font...")
@@ -46,7 +51,7 @@ def test_check_integer_ppem_if_hinted(check):
 def test_check_smart_dropout(check):
     """Ensure smart dropout control is enabled in "prep" table instructions."""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
 
     # "Program at 'prep' table contains
     #  instructions enabling smart dropout control."
@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -13,10 +11,10 @@ from fontbakery.codetesting import (
 def test_check_legacy_accents(check):
     """Check that legacy accents aren't used in composite glyphs."""
 
-    test_font = TTFont(TEST_FILE("montserrat/Montserrat-Regular.ttf"))
+    test_font = TEST_FONT("montserrat/Montserrat-Regular.ttf")
     assert_PASS(check(test_font))
 
-    test_font = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    test_font = TEST_FONT("mada/Mada-Regular.ttf")
     assert_results_contain(
         check(test_font),
         FAIL,
@@ -24,7 +22,7 @@ def test_check_legacy_accents(check):
         "for legacy accents being defined in GDEF as marks.",
     )
 
-    test_font = TTFont(TEST_FILE("lugrasimo/Lugrasimo-Regular.ttf"))
+    test_font = TEST_FONT("lugrasimo/Lugrasimo-Regular.ttf")
     assert_results_contain(
         check(test_font),
         FAIL,
@@ -1,10 +1,8 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     # assert_PASS,  FIXME: We must also have PASS test-cases!
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import WARN, SKIP
 
@@ -15,11 +13,11 @@ def test_check_ligature_carets(check):
 
     # Our reference Mada Medium doesn't have a GSUB 'liga' feature, so it is skipped
     # because of an unfulfilled condition.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Medium.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "no-ligatures")
 
     # SourceSansPro Bold has ligatures and GDEF table, but lacks caret position data.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Bold.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Bold.otf")
     msg = assert_results_contain(check(ttFont), WARN, "lacks-caret-pos")
     assert msg == (
         "This font lacks caret position values"
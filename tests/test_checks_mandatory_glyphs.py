@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import WARN, FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -14,7 +12,7 @@ def test_check_mandatory_glyphs(check):
     """Font contains the first few mandatory glyphs (.null or NULL, CR and space)?"""
     from fontTools import subset
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     options = subset.Options()
@@ -35,7 +33,7 @@ def test_check_mandatory_glyphs(check):
 
     # Change the glyph name from 'n' to '.notdef'
     # (Must reload the font here since we already decompiled the glyf table)
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     ttFont.glyphOrder = ["m", ".notdef"]
     for subtable in ttFont["cmap"].tables:
         if subtable.isUnicode():
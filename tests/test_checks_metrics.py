@@ -8,6 +8,7 @@ from fontbakery.codetesting import (
     assert_SKIP,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -56,7 +57,7 @@ def test_check_family_win_ascent_and_descent(check, mada_ttFonts):
 
     # Mada Regular is know to be bad
     # single font input
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     message = assert_results_contain(check(ttFont), FAIL, "ascent")
     assert message == (
         "OS/2.usWinAscent value should be"
@@ -107,7 +108,7 @@ def test_check_os2_metrics_match_hhea(check):
     """Checking OS/2 Metrics match hhea Metrics."""
 
     # Our reference Mada Regular is know to be faulty here.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     assert_results_contain(
         check(ttFont),
         FAIL,
@@ -116,7 +117,7 @@ def test_check_os2_metrics_match_hhea(check):
     )
 
     # Our reference Mada Black is know to be good here.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Black.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Black.ttf")
 
     assert_PASS(check(ttFont), "with a good font...")
 
@@ -170,14 +171,14 @@ def test_check_family_vertical_metrics(check, montserrat_ttFonts):
 def test_check_caps_vertically_centered(check):
     """Check if uppercase glyphs are vertically centered."""
 
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")
     assert_PASS(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("cjk/SourceHanSans-Regular.otf"))
+    ttFont = TEST_FONT("cjk/SourceHanSans-Regular.otf")
     assert_SKIP(check(ttFont))
 
     # FIXME: review this test-case
-    # ttFont = TTFont(TEST_FILE("cairo/CairoPlay-Italic.leftslanted.ttf"))
+    # ttFont = TEST_FONT("cairo/CairoPlay-Italic.leftslanted.ttf")
     # assert_results_contain(check(ttFont), WARN, "vertical-metrics-not-centered")
 
 
@@ -186,7 +187,7 @@ def test_check_linegaps(check):
     """Checking Vertical Metric Linegaps."""
 
     # Our reference Mada Regular is know to be bad here.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # But just to be sure, we first explicitely set
     # the values we're checking for:
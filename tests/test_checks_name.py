@@ -8,6 +8,7 @@ from fontbakery.codetesting import (
     assert_results_contain,
     GLYPHSAPP_TEST_FILE,
     TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.constants import NameID
 from fontbakery.status import FAIL, WARN
@@ -62,7 +63,7 @@ def test_check_name_char_restrictions(check):
     """Are there disallowed characters in the restricted NAME table entries?"""
 
     # Our reference Merriweather Regular is known to be good
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
@@ -96,7 +97,7 @@ def test_check_name_char_restrictions(check):
     )
 
     # Then reload the good font
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
 
     # And check detection of a problem on nameId 20:
     ttFont["name"].names[index].nameID = NameID.POSTSCRIPT_CID_NAME
@@ -117,7 +118,7 @@ def test_check_name_char_restrictions(check):
     )
 
     # Then reload the good font again
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
 
     # And check detection of a problem on nameId 25.
     # In this case the exclamation mark alone should be sufficient to trigger the error:
@@ -140,7 +141,7 @@ def test_check_name_char_restrictions(check):
     )
 
     # Reload the good font once more:
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
 
     # Let's check a good case of a non-ascii on the name table then!
     ttFont["name"].names[index].nameID = 19
@@ -158,7 +159,7 @@ def test_check_name_family_and_style_max_length(check):
     """Name table entries should not be too long."""
 
     # Our reference Cabin Regular is known to be good
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
@@ -183,7 +184,7 @@ def test_check_name_family_and_style_max_length(check):
     assert_results_contain(results, WARN, "nameid6-too-long", "with a bad font...")
 
     # Restore the original VF
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
 
     # ...and break the check again with a bad fvar instance name:
     nameid_to_break = ttFont["fvar"].instances[0].subfamilyNameID
@@ -256,7 +257,7 @@ def test_check_name_no_copyright_on_description(check):
     """Description strings in the name table must not contain copyright info."""
 
     # Our reference Mada Regular is know to be good here.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     assert_PASS(check(ttFont), "with a good font...")
 
     # here we add a "Copyright" string to a NameID.DESCRIPTION
@@ -292,32 +293,32 @@ def test_check_italic_names(check):
     # Fonts without Name ID 16 & 17
 
     # PASS or SKIP
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
     assert_SKIP(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Italic.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Italic.ttf")
     assert_PASS(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Medium.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Medium.ttf")
     assert_SKIP(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Bold.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Bold.ttf")
     assert_SKIP(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-BoldItalic.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-BoldItalic.ttf")
     assert_PASS(check(ttFont))
 
     # FAIL
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Italic.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Italic.ttf")
     set_name(ttFont, 1, get_name(ttFont, 1) + " Italic")
     assert_results_contain(check(ttFont), FAIL, "bad-familyname")
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Italic.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Italic.ttf")
     set_name(ttFont, 2, "Regular")
     assert_results_contain(check(ttFont), FAIL, "bad-subfamilyname")
 
     # This file is faulty as-is
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-MediumItalic.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-MediumItalic.ttf")
     assert_results_contain(check(ttFont), FAIL, "bad-subfamilyname")
     # Fix it
     set_name(ttFont, 1, "Cabin Medium")
@@ -327,17 +328,17 @@ def test_check_italic_names(check):
     # Fonts with Name ID 16 & 17
 
     # PASS or SKIP
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")
     assert_SKIP(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")
     assert_PASS(check(ttFont))
 
     # FAIL
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")
     set_name(ttFont, 16, "Shantell Sans Italic")
     assert_results_contain(check(ttFont), FAIL, "bad-typographicfamilyname")
 
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")
     set_name(ttFont, 17, "Light")
     assert_results_contain(check(ttFont), FAIL, "bad-typographicsubfamilyname")
@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -14,7 +12,7 @@ def test_check_name_trailing_spaces(check):
     """Name table entries must not have trailing spaces."""
 
     # Our reference Cabin Regular is known to be good:
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
     assert_PASS(check(ttFont), "with a good font...")
 
     for i, entry in enumerate(ttFont["name"].names):
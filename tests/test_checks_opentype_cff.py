@@ -1,10 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import DEBUG, INFO, WARN, ERROR, SKIP, PASS, FAIL
 
@@ -101,7 +100,7 @@ def test_check_cff_deprecated_operators(check):
 
 @check_id("opentype/cff_ascii_strings")
 def test_check_cff_strings(check):
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
 
     # check that a healthy CFF font passes:
     assert_PASS(check(ttFont))
@@ -124,7 +123,7 @@ def test_check_cff_strings(check):
     # )
 
     # Out-of-ascii-range char in the FontName field will cause decode issues:
-    ttFont = TTFont(TEST_FILE("unicode-decode-err/unicode-decode-err-cff.otf"))
+    ttFont = TEST_FONT("unicode-decode-err/unicode-decode-err-cff.otf")
     assert_results_contain(
         check(ttFont),
         FAIL,
@@ -7,7 +7,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_SKIP,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
     MockFont,
 )
 
@@ -15,7 +15,7 @@ from fontbakery.codetesting import (
 @check_id("opentype/fvar/regular_coords_correct")
 def test_check_opentype_fvar_regular_coords_correct(check):
     # test with a static font.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/TTF/SourceSansPro-It.ttf"))
+    ttFont = TEST_FONT("source-sans-pro/TTF/SourceSansPro-It.ttf")
     assert_SKIP(check(ttFont))
 
     #### The variable font 'wght' (Weight) axis coordinate
@@ -39,7 +39,7 @@ def test_check_opentype_fvar_regular_coords_correct(check):
     assert_results_contain(check(ttFont), FAIL, "no-regular-instance")
 
     # Test with an italic variable font. The Italic instance must also be 400
-    ttFont = TTFont(TEST_FILE("varfont/OpenSans-Italic[wdth,wght].ttf"))
+    ttFont = TEST_FONT("varfont/OpenSans-Italic[wdth,wght].ttf")
     assert_PASS(check(ttFont))
 
     #### The variable font 'wdth' (Width) axis coordinate
@@ -63,7 +63,7 @@ def test_check_opentype_fvar_regular_coords_correct(check):
     assert_results_contain(check(ttFont), FAIL, "no-regular-instance")
 
     # Test with an italic variable font. The Italic instance must also be 100
-    ttFont = TTFont(TEST_FILE("varfont/OpenSans-Italic[wdth,wght].ttf"))
+    ttFont = TEST_FONT("varfont/OpenSans-Italic[wdth,wght].ttf")
     assert_PASS(check(ttFont))
 
     #### The variable font 'slnt' (Slant) axis coordinate
@@ -8,6 +8,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -43,10 +44,10 @@ def test_check_glyf_unused_data(check):
 def test_check_points_out_of_bounds(check):
     """Check for points out of bounds."""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_results_contain(check(ttFont), WARN, "points-out-of-bounds")
 
-    ttFont = TTFont(TEST_FILE("familysans/FamilySans-Regular.ttf"))
+    ttFont = TEST_FONT("familysans/FamilySans-Regular.ttf")
     assert_PASS(check(ttFont))
 
 
@@ -55,7 +56,7 @@ def test_check_glyf_non_transformed_duplicate_components(check):
     """Check glyphs do not have duplicate components
     which have the same x,y coordinates."""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     # Set qutodbl's components to have the same x,y values
@@ -8,6 +8,7 @@ from fontbakery.codetesting import (
     assert_SKIP,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
     MockFont,
 )
 
@@ -54,7 +55,7 @@ def test_check_unitsperem(check):
 
     # In this test we'll forge several known-good and known-bad values.
     # We'll use Mada Regular to start with:
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     for good_value in [
         16,
@@ -180,7 +181,7 @@ def test_check_mac_style(check):
     """Checking head.macStyle value."""
     from fontbakery.constants import MacStyle
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
 
     # macStyle-value, style, expected
     test_cases = [
@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import WARN, FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -13,7 +11,7 @@ from fontbakery.codetesting import (
 def test_check_maxadvancewidth(check):
     """MaxAdvanceWidth is consistent with values in the Hmtx and Hhea tables?"""
 
-    ttFont = TTFont(TEST_FILE("familysans/FamilySans-Regular.ttf"))
+    ttFont = TEST_FONT("familysans/FamilySans-Regular.ttf")
     assert_PASS(check(ttFont))
 
     ttFont["hmtx"].metrics["A"] = (1234567, 1234567)
@@ -29,14 +27,14 @@ def test_check_caretslope(check):
     """Check hhea.caretSlopeRise and hhea.caretSlopeRun"""
 
     # PASS
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")
     assert_PASS(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans[BNCE,INFM,SPAC,wght].ttf")
     assert_PASS(check(ttFont))
 
     # WARN for right-leaning
-    ttFont = TTFont(TEST_FILE("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf"))
+    ttFont = TEST_FONT("shantell/ShantellSans-Italic[BNCE,INFM,SPAC,wght].ttf")
     ttFont["post"].italicAngle = -12
     message = assert_results_contain(check(ttFont), WARN, "caretslope-mismatch")
     assert message == (
@@ -1,4 +1,4 @@
-from fontTools.ttLib import TTFont, newTable
+from fontTools.ttLib import newTable
 from fontTools.ttLib.tables._k_e_r_n import KernTable_format_0, KernTable_format_unkown
 
 from conftest import check_id
@@ -6,7 +6,7 @@ from fontbakery.status import INFO, FAIL, WARN
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -16,7 +16,7 @@ def test_check_kern_table(check):
 
     # Our reference Mada Regular is known to be good
     # (does not have a 'kern' table):
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), 'with a font without a "kern" table...')
@@ -7,7 +7,7 @@ from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -15,7 +15,7 @@ from fontbakery.codetesting import (
 def test_check_loca_maxp_num_glyphs(check):
     """Does the number of glyphs in the loca table match the maxp table?"""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     ttFont["loca"].locations.pop()
@@ -19,6 +19,7 @@ from fontbakery.codetesting import (
     assert_results_contain,
     portable_path,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -59,7 +60,7 @@ def test_check_monospace(check):
 
     # Our reference Mada Regular is a non-monospace font
     # know to have good metadata for this check.
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     assert_results_contain(
         check(ttFont), PASS, "good", "with a good non-monospace font..."
     )
@@ -108,7 +109,7 @@ def test_check_monospace(check):
     print("Test PASS with a good monospaced font...")
     # Our reference OverpassMono Regular is know to be
     # a monospaced font with good metadata here.
-    ttFont = TTFont(TEST_FILE("overpassmono/OverpassMono-Regular.ttf"))
+    ttFont = TEST_FONT("overpassmono/OverpassMono-Regular.ttf")
 
     subresult = check(ttFont)[-1]
     # WARN is emitted when there's at least one outlier.
@@ -138,7 +139,7 @@ def test_check_monospace(check):
     )
 
     # restore original testing font:
-    ttFont = TTFont(TEST_FILE("overpassmono/OverpassMono-Regular.ttf"))
+    ttFont = TEST_FONT("overpassmono/OverpassMono-Regular.ttf")
     ttFont["post"].isFixedPitch = IsFixedWidth.NOT_MONOSPACED
 
     # There are several bad panose proportion values for a monospaced font.
@@ -197,7 +198,7 @@ def test_check_name_match_familyname_fullfont(check):
     """Does full font name begin with the font family name?"""
 
     # Our reference Mada Regular is known to be good
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont))
@@ -268,7 +269,7 @@ def test_check_name_match_familyname_fullfont(check):
 
     # Run the check on a CJK font. The font's 'name' table contains
     # English-US (1033/0x0409) and Japanese (1041/0x0411) records. It should PASS.
-    ttFont = TTFont(TEST_FILE("cjk/SourceHanSans-Regular.otf"))
+    ttFont = TEST_FONT("cjk/SourceHanSans-Regular.otf")
     assert_PASS(check(ttFont))
 
     name_table = ttFont["name"]
@@ -331,7 +332,7 @@ def test_check_family_naming_recommendations(check):
     """Font follows the family naming recommendations ?"""
 
     # Our reference Mada Medium is known to be good
-    ttFont = TTFont(TEST_FILE("mada/Mada-Medium.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Medium.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
@@ -406,7 +407,7 @@ def test_check_family_naming_recommendations(check):
 @check_id("opentype/name/postscript_vs_cff")
 def test_check_name_postscript_vs_cff(check):
     # Test a font that has matching names. Check should PASS.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Bold.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Bold.otf")
     assert_PASS(check(ttFont))
 
     # Change the name-table string. Check should FAIL.
@@ -431,13 +432,13 @@ def test_check_name_postscript_vs_cff(check):
 
     # Now test with a TrueType font.
     # The test should be skipped due to an unfulfilled condition.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/TTF/SourceSansPro-Bold.ttf"))
+    ttFont = TEST_FONT("source-sans-pro/TTF/SourceSansPro-Bold.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: is_cff" in msg
 
     # Now test with a CFF2 font.
     # The test should be skipped due to an unfulfilled condition.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/VAR/SourceSansVariable-Italic.otf"))
+    ttFont = TEST_FONT("source-sans-pro/VAR/SourceSansVariable-Italic.otf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: is_cff" in msg
 
@@ -554,7 +555,7 @@ def test_check_consistent_font_family_name(check):
 @check_id("opentype/postscript_name")
 def test_check_name_postscript(check):
     # Test a font that has OK psname. Check should PASS.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Bold.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Bold.otf")
     assert_PASS(check(ttFont))
 
     # Now change it to a string with illegal characters. Should FAIL.
@@ -14,6 +14,7 @@ from fontbakery.codetesting import (
     assert_results_contain,
     portable_path,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -242,7 +243,7 @@ def test_check_family_bold_italic_unique_for_nameid1(check):
 def test_check_code_pages(check):
     """Check code page character ranges"""
 
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
     assert (
         ttFont["OS/2"].ulCodePageRange1 != 0 or ttFont["OS/2"].ulCodePageRange2 != 0
     )  # It has got at least 1 code page range declared
@@ -259,7 +260,7 @@ def test_check_code_pages(check):
 def test_check_vendor_id(check):
     """Check vendor id against the configured value"""
 
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
     assert ttFont["OS/2"].achVendID == "STC "
 
     # If there is no configured vendor_id value, SKIP the check
@@ -282,7 +283,7 @@ def test_check_fsselection(check):
     """Checking OS/2 fsSelection value."""
     from fontbakery.constants import FsSelection
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
 
     # fsSelection-value, style, expected, expected_message
     test_cases = [
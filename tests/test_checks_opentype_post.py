@@ -8,6 +8,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
     MockFont,
 )
 
@@ -63,7 +64,7 @@ def test_check_post_table_version(check):
 
     # create mock fonts for post format testing
 
-    base_tt_font = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    base_tt_font = TEST_FONT("mada/Mada-Regular.ttf")
 
     #
     # post format 2 mock font test
@@ -123,7 +124,7 @@ def test_check_post_table_version(check):
     #
     # post format 2/3 OTF CFF mock font test
     #
-    mock_cff_post_2 = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    mock_cff_post_2 = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
 
     mock_cff_post_2["post"].formatType = 2
     assert "CFF " in mock_cff_post_2
@@ -147,7 +148,7 @@ def test_check_post_table_version(check):
 def test_check_italic_angle(check):
     """Checking post.italicAngle value."""
 
-    ttFont = TTFont(TEST_FILE("cabin/Cabin-Regular.ttf"))
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
 
     # italic-angle, style, fail_message
     test_cases = [
@@ -178,21 +179,21 @@ def test_check_italic_angle(check):
             )
 
     # Cairo, check left and right-leaning explicitly
-    ttFont = TTFont(TEST_FILE("cairo/CairoPlay-Italic.rightslanted.ttf"))
+    ttFont = TEST_FONT("cairo/CairoPlay-Italic.rightslanted.ttf")
     assert_PASS(check(MockFont(ttFont=ttFont, style="Italic")))
     ttFont["post"].italicAngle *= -1
     assert_results_contain(
         check(MockFont(ttFont=ttFont, style="Italic")), WARN, "positive"
     )
 
-    ttFont = TTFont(TEST_FILE("cairo/CairoPlay-Italic.leftslanted.ttf"))
+    ttFont = TEST_FONT("cairo/CairoPlay-Italic.leftslanted.ttf")
     assert_PASS(check(MockFont(ttFont=ttFont, style="Italic")))
     ttFont["post"].italicAngle *= -1
     assert_results_contain(
         check(MockFont(ttFont=ttFont, style="Italic")), WARN, "negative"
     )
 
-    ttFont = TTFont(TEST_FILE("cairo/CairoPlay-Italic.rightslanted.ttf"))
+    ttFont = TEST_FONT("cairo/CairoPlay-Italic.rightslanted.ttf")
     assert_PASS(check(MockFont(ttFont=ttFont, style="Italic")))
     ttFont["glyf"]["I"].endPtsOfContours = []
     ttFont["glyf"]["I"].coordinates = []
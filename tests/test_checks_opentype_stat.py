@@ -6,6 +6,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -15,7 +16,7 @@ def test_check_varfont_STAT_axis_record_for_each_axis(check):
 
     # Our reference Cabin[wdth,wght].ttf variable font
     # has all necessary Axis Records
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
 
     # So the check must PASS
     assert_PASS(check(ttFont))
@@ -31,7 +32,7 @@ def test_check_varfont_STAT_axis_record_for_each_axis(check):
 
     # Now use a stactic font.
     # The check should be skipped due to an unfulfilled condition.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/TTF/SourceSansPro-Black.ttf"))
+    ttFont = TEST_FONT("source-sans-pro/TTF/SourceSansPro-Black.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: is_variable_font" in msg
 
@@ -139,7 +140,7 @@ def test_check_italic_axis_last(check):
 
 @check_id("opentype/weight_class_fvar")
 def test_check_weight_class_fvar(check):
-    ttFont = TTFont(TEST_FILE("varfont/Oswald-VF.ttf"))
+    ttFont = TEST_FONT("varfont/Oswald-VF.ttf")
     assert_PASS(check(ttFont), "matches fvar default value.")
 
     ttFont["OS/2"].usWeightClass = 333
@@ -149,6 +150,6 @@ def test_check_weight_class_fvar(check):
 
     # Test with a variable font that doesn't have a 'wght' (Weight) axis.
     # The check should yield SKIP.
-    ttFont = TTFont(TEST_FILE("BadGrades/BadGrades-VF.ttf"))
+    ttFont = TEST_FONT("BadGrades/BadGrades-VF.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: has_wght_axis" in msg
@@ -1,8 +1,6 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.codetesting import (
-    TEST_FILE,
+    TEST_FONT,
     assert_PASS,
     assert_results_contain,
 )
@@ -38,14 +36,14 @@ def test_check_unwanted_aat_tables(check):
         "xref",
     ]
     # Our reference Mada Regular font is good here:
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
 
     # We now add unwanted tables one-by-one to validate the FAIL code-path:
     for unwanted in unwanted_tables:
-        ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+        ttFont = TEST_FONT("mada/Mada-Regular.ttf")
         ttFont.reader.tables[unwanted] = "foo"
         assert_results_contain(
             check(ttFont),
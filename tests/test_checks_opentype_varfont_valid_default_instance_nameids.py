@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -17,12 +15,12 @@ def test_check_varfont_valid_default_instance_nameids(check):
 
     # The font's 'Regular' instance record has the same coordinates as the default
     # instance, and the record's string matches the string of nameID 2.
-    ttFont_1 = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont_1 = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
     assert_PASS(check(ttFont_1))
 
     # The font's 'LightCondensed' instance record has the same coordinates as the
     # default instance, and the record's string matches the string of nameID 17.
-    ttFont_2 = TTFont(TEST_FILE("mutatorsans-vf/MutatorSans-VF.ttf"))
+    ttFont_2 = TEST_FONT("mutatorsans-vf/MutatorSans-VF.ttf")
     assert_PASS(check(ttFont_2))
 
     # Change subfamilyNameID value of the default instance to another name ID whose
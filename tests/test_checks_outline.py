@@ -1,10 +1,14 @@
-from fontTools.ttLib import TTFont
+import re
+
+import pytest
 
 from conftest import check_id
-from fontbakery.status import WARN, SKIP
+from fontbakery.status import PASS, WARN, SKIP
 from fontbakery.codetesting import (
+    CheckTester,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
     assert_PASS,
 )
 
@@ -28,7 +32,7 @@ def test_check_outline_alignment_os2_old(check):
     the OS/2 table has a low version and does not have the
     xHeight and CapHeight fields that are normally used."""
 
-    ttFont = TTFont(TEST_FILE("merriweather/Merriweather-Regular.ttf"))
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
 
     assert ttFont["OS/2"].version == 3
 
@@ -137,6 +141,18 @@ def test_check_outline_semi_vertical(check):
     msg = assert_results_contain(check(font), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: not is_italic" in msg
 
+    # A quick scan looks at a sample of the glyphs of large fonts,
+    # and stops once it has found enough to report.
+    font = TEST_FILE("stixtwomath/STIXTwoMath-Regular.ttf")
+    msg = assert_results_contain(
+        check(font, config={"outline_checks": "quick"}), WARN, "found-semi-vertical"
+    )
+    scanned, total = re.search(r"looked at (\d+) of (\d+) glyphs", msg).groups()
+    assert int(scanned) < 1100 and int(total) == 6760
+    assert "Quick scan" not in assert_results_contain(
+        check(filename), WARN, "found-semi-vertical"
+    )
+
 
 @check_id("outline_direction")
 def test_check_outline_direction(check):
@@ -167,3 +183,47 @@ def test_check_overlapping_path_segments(check):
     filename = TEST_FILE("merriweather/Merriweather-Regular.ttf")
     results = check(filename)
     assert_PASS(results)
+
+
+def test_outline_sample():
+    from fontbakery.outlines import GlyphOutlines
+
+    outlines = GlyphOutlines(TEST_FONT("stixtwomath/STIXTwoMath-Regular.ttf"))
+    sample = outlines.sample(500)
+    assert 500 <= len(sample) < 550
+    assert sample == sorted(sample, key=list(outlines).index)
+    strata = {outlines.stratum(glyphname) for glyphname, _ in outlines}
+    assert {outlines.stratum(glyphname) for glyphname, _ in sample} == strata
+    assert outlines.sample(len(outlines)) == list(outlines)
+
+
+@pytest.mark.parametrize(
+    "check_id,cutoff,quick_status,full_status",
+    [
+        # 2 warnings in the 6 sampled glyphs, 4 in the whole font
+        ("outline_alignment_miss", 3, WARN, PASS),
+        # 4 warnings in the sample, 6 in the whole font
+        ("outline_colinear_vectors", 5, PASS, PASS),
+        # 3 warnings in the sample, 3 in the whole font
+        ("outline_short_segments", 3, PASS, WARN),
+    ],
+)
+def test_outline_quick_cutoff(monkeypatch, check_id, cutoff, quick_status, full_status):
+    """A quick scan estimates whether a font has more warnings than the
+    cutoff from the rate at which they turn up in its sample."""
+    monkeypatch.setattr("fontbakery.outlines.QUICK_SAMPLE_SIZE", 5)
+    monkeypatch.setattr(
+        "fontbakery.checks.outline_settings.FALSE_POSITIVE_CUTOFF", cutoff
+    )
+    check = CheckTester(check_id)
+    font = TEST_FILE("wonky_paths/WonkySourceSansPro-Regular.otf")
+
+    [result] = check(font, config={"outline_checks": "quick"})
+    assert result.status == quick_status
+    assert re.search(r"looked at [1-6] of 9 glyphs", result.message.message)
+    estimated = "estimated from them" in result.message.message
+    assert estimated == (quick_status == PASS)
+
+    [result] = check(font)
+    assert result.status == full_status
+    assert "Quick scan" not in result.message.message
@@ -1,13 +1,12 @@
 from unittest.mock import MagicMock
 
-from fontTools.ttLib import TTFont
 
 from conftest import check_id
 from fontbakery.status import FAIL, INFO
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -57,9 +56,9 @@ def test_check_required_tables(check):
     # TrueType: Mada Regular
     # OpenType-CFF: SourceSansPro-Black
     # OpenType-CFF2: SourceSansVariable-Italic
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
-    cff_font = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Black.otf"))
-    cff2_font = TTFont(TEST_FILE("source-sans-pro/VAR/SourceSansVariable-Italic.otf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
+    cff_font = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Black.otf")
+    cff2_font = TEST_FONT("source-sans-pro/VAR/SourceSansVariable-Italic.otf")
 
     # The TrueType font contains all required tables, so it must PASS the check.
     assert_PASS(check(ttFont), "with a good font...")
@@ -91,7 +90,7 @@ def test_check_required_tables(check):
     # Now we remove required tables one-by-one to validate the FAIL code-path:
     # The font must also contain the table that holds the outlines, "glyf" in this case.
     for required in REQUIRED_TABLES + ["glyf"]:
-        ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+        ttFont = TEST_FONT("mada/Mada-Regular.ttf")
         if required in ttFont.reader.tables:
             del ttFont.reader.tables[required]
         msg = assert_results_contain(
@@ -6,6 +6,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -13,7 +14,7 @@ from fontbakery.codetesting import (
 def test_check_rupee(check):
     """Ensure indic fonts have the Indian Rupee Sign glyph."""
 
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
     msg = assert_results_contain(check(ttFont), SKIP, "unfulfilled-conditions")
     assert "Unfulfilled Conditions: is_indic_font" in msg
 
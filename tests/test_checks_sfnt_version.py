@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -14,7 +12,7 @@ def test_check_sfnt_version(check):
     """Ensure that the font has the proper sfntVersion value."""
 
     # Valid TrueType font; the check must PASS.
-    ttFont = TTFont(TEST_FILE("cabinvf/Cabin[wdth,wght].ttf"))
+    ttFont = TEST_FONT("cabinvf/Cabin[wdth,wght].ttf")
     assert_PASS(check(ttFont))
 
     # Change the sfntVersion to an improper value for TrueType fonts.
@@ -24,7 +22,7 @@ def test_check_sfnt_version(check):
     assert msg == "Font with TrueType outlines has incorrect sfntVersion value: 'OTTO'"
 
     # Valid CFF font; the check must PASS.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Bold.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Bold.otf")
     assert_PASS(check(ttFont))
 
     # Change the sfntVersion to an improper value for CFF fonts. The check should FAIL.
@@ -35,7 +33,7 @@ def test_check_sfnt_version(check):
     )
 
     # Valid CFF2 font; the check must PASS.
-    ttFont = TTFont(TEST_FILE("source-sans-pro/VAR/SourceSansVariable-Roman.otf"))
+    ttFont = TEST_FONT("source-sans-pro/VAR/SourceSansVariable-Roman.otf")
     assert_PASS(check(ttFont))
 
     # Change the sfntVersion to an improper value for CFF fonts. The check should FAIL.
@@ -1,4 +1,3 @@
-from fontTools.ttLib import TTFont
 from fontTools.ttLib.tables.otTables import Feature, FeatureRecord
 
 from conftest import check_id
@@ -6,7 +5,7 @@ from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -14,7 +13,7 @@ from fontbakery.codetesting import (
 def test_check_smallcaps_before_ligatures(check):
     """Ensure 'smcp' lookups are defined before 'liga' lookups in the 'GSUB' table."""
 
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     smcp_feature = Feature()
     smcp_feature.LookupListIndex = [0]
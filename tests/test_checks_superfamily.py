@@ -12,6 +12,7 @@ from fontbakery.codetesting import (
     MockFont,
     TEST_FILE,
 )
+from fontbakery.fonts_profile import setup_context
 
 
 @pytest.fixture
@@ -93,3 +94,26 @@ def test_check_superfamily_vertical_metrics(
         "superfamily-vertical-metrics",
         "with families that diverge on vertical metric values...",
     )
+
+
+def test_superfamily_ttFonts_are_shared():
+    context = setup_context(cabin_fonts[:2])
+    first, second = context.fonts
+    for font in context.fonts:
+        font.context = context
+    # The first font is already loaded when the superfamily is inspected.
+    first_ttFont = first.ttFont
+
+    assert first.sibling_directories == [
+        os.path.join("data", "test", "cabin"),
+        os.path.join("data", "test", "cabincondensed"),
+    ]
+    first_handles = [f for family in first.superfamily_ttFonts for f in family]
+    second_handles = [f for family in second.superfamily_ttFonts for f in family]
+    assert len(first_handles) == 16
+
+    # Every file is parsed once and shared by all fonts in the superfamily.
+    assert all(a is b for a, b in zip(first_handles, second_handles))
+
+    # A file which was already loaded for testing is not parsed again.
+    assert any(handle is first_ttFont for handle in first_handles)
@@ -1,5 +1,4 @@
 import pytest
-from fontTools.ttLib import TTFont
 
 from conftest import check_id
 from fontbakery.codetesting import (
@@ -7,6 +6,7 @@ from fontbakery.codetesting import (
     assert_SKIP,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL
 
@@ -21,7 +21,7 @@ from fontbakery.status import FAIL
 @check_id("tnum_glyphs_equal_widths")
 def test_tnum_glyphs_equal_widths(check, font_path):
     # Pass condition
-    font = TTFont(TEST_FILE(font_path))
+    font = TEST_FONT(font_path)
     assert_PASS(check(font))
 
     # TODO: This should also have a FAIL test-case!
@@ -23,7 +23,8 @@ def empty_ufo_font(tmpdir):
 
 
 @check_id("ufolint")
-def test_check_ufolint(check, empty_ufo_font):
+def test_check_ufolint(check, empty_ufo_font, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))  # Lint for real
     _, ufo_path = empty_ufo_font
 
     assert_PASS(check(ufo_path))
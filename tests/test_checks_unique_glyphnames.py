@@ -8,7 +8,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_SKIP,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -16,7 +16,7 @@ from fontbakery.codetesting import (
 def test_check_unique_glyphnames(check):
     """Font contains unique glyph names?"""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     # Fonttools renames duplicate glyphs with #1, #2, ... on load.
@@ -25,7 +25,7 @@ def test_check_unique_glyphnames(check):
     glyph_names[2] = glyph_names[3]
 
     # Load again, we changed the font directly.
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     ttFont.setGlyphOrder(glyph_names)
     # Just access the data to make fonttools generate it.
     ttFont["post"]  # pylint:disable=pointless-statement
@@ -38,7 +38,7 @@ def test_check_unique_glyphnames(check):
 
     # Upgrade to post format 3 and roundtrip data to update TTF object.
     ttf_skip_msg = "TrueType fonts with a format 3 post table"
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     ttFont.setGlyphOrder(glyph_names)
     ttFont["post"].formatType = 3
     _file = io.BytesIO()
@@ -49,11 +49,11 @@ def test_check_unique_glyphnames(check):
     assert ttf_skip_msg in message
 
     # Also test with CFF...
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
     assert_PASS(check(ttFont))
 
     # ... and CFF2 fonts
     cff2_skip_msg = "OpenType-CFF2 fonts with a format 3 post table"
-    ttFont = TTFont(TEST_FILE("source-sans-pro/VAR/SourceSansVariable-Roman.otf"))
+    ttFont = TEST_FONT("source-sans-pro/VAR/SourceSansVariable-Roman.otf")
     message = assert_SKIP(check(ttFont))
     assert cff2_skip_msg in message
@@ -1,11 +1,10 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import WARN
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
     TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -60,7 +59,7 @@ def test_check_unreachable_glyphs(check):
     ]:
         assert glyph not in message
 
-    ttFont = TTFont(TEST_FILE("notosansmath/NotoSansMath-Regular.ttf"))
+    ttFont = TEST_FONT("notosansmath/NotoSansMath-Regular.ttf")
     ttFont.ensureDecompiled()  # (required for mock glyph removal below)
     glyph_order = ttFont.getGlyphOrder()
 
@@ -1,13 +1,12 @@
 from unittest.mock import MagicMock
 
-from fontTools.ttLib import TTFont
 
 from conftest import check_id
 from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -43,14 +42,14 @@ def test_check_unwanted_tables(check):
         #          and should be removed before release.
     ]
     # Our reference Mada Regular font is good here:
-    ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
 
     # So it must PASS the check:
     assert_PASS(check(ttFont), "with a good font...")
 
     # We now add unwanted tables one-by-one to validate the FAIL code-path:
     for unwanted in unwanted_tables:
-        ttFont = TTFont(TEST_FILE("mada/Mada-Regular.ttf"))
+        ttFont = TEST_FONT("mada/Mada-Regular.ttf")
         ttFont.reader.tables[unwanted] = newTable(unwanted)
         assert_results_contain(
             check(ttFont),
@@ -8,7 +8,7 @@ from fontbakery.codetesting import (
     assert_PASS,
     assert_SKIP,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -17,7 +17,7 @@ def test_check_valid_glyphnames(check):
     """Glyph names are all valid?"""
 
     # We start with a good font file:
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     # There used to be a 31 char max-length limit.
@@ -56,7 +56,7 @@ def test_check_valid_glyphnames(check):
     #
     # Upgrade to post format 3 and roundtrip data to update TTF object.
     ttf_skip_msg = "TrueType fonts with a format 3 post table"
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     ttFont["post"].formatType = 3
     _file = io.BytesIO()
     _file.name = ttFont.reader.file.name
@@ -66,11 +66,11 @@ def test_check_valid_glyphnames(check):
     assert ttf_skip_msg in message
 
     # Also test with CFF...
-    ttFont = TTFont(TEST_FILE("source-sans-pro/OTF/SourceSansPro-Regular.otf"))
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
     assert_PASS(check(ttFont))
 
     # ... and CFF2 fonts
     cff2_skip_msg = "OpenType-CFF2 fonts with a format 3 post table"
-    ttFont = TTFont(TEST_FILE("source-sans-pro/VAR/SourceSansVariable-Roman.otf"))
+    ttFont = TEST_FONT("source-sans-pro/VAR/SourceSansVariable-Roman.otf")
     message = assert_SKIP(check(ttFont))
     assert cff2_skip_msg in message
@@ -4,7 +4,7 @@ from conftest import check_id
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 from fontbakery.status import FAIL, WARN
 
@@ -13,7 +13,7 @@ from fontbakery.status import FAIL, WARN
 def test_check_varfont_duplexed_axis_reflow(check):
     """Ensure VFs with the GRAD axis do not vary horizontal advance."""
 
-    ttFont = TTFont(TEST_FILE("BadGrades/BadGrades-VF.ttf"))
+    ttFont = TEST_FONT("BadGrades/BadGrades-VF.ttf")
     assert_results_contain(check(ttFont), FAIL, "grad-causes-reflow")
 
     # Zero out the horizontal advances
@@ -31,7 +31,7 @@ def test_check_varfont_duplexed_axis_reflow(check):
     ttFont["GPOS"].table.LookupList.Lookup = []
     assert_PASS(check(ttFont))
 
-    ttFont = TTFont(TEST_FILE("bad_fonts/reflowing_ROND/BadRoundness-VF.ttf"))
+    ttFont = TEST_FONT("bad_fonts/reflowing_ROND/BadRoundness-VF.ttf")
     assert_results_contain(check(ttFont), FAIL, "rond-causes-reflow")
 
 
@@ -41,7 +41,7 @@ def test_check_varfont_unsupported_axes(check):
 
     # Our reference varfont, CabinVFBeta.ttf, lacks 'ital' and 'slnt' variation axes.
     # So, should pass the check:
-    ttFont = TTFont(TEST_FILE("cabinvfbeta/CabinVFBeta.ttf"))
+    ttFont = TEST_FONT("cabinvfbeta/CabinVFBeta.ttf")
     assert_PASS(check(ttFont))
 
     # If we add 'ital' it must FAIL:
@@ -57,7 +57,7 @@ def test_check_varfont_unsupported_axes(check):
 def test_check_mandatory_avar_table(check):
     """Ensure variable fonts include an avar table."""
 
-    ttFont = TTFont(TEST_FILE("ibmplexsans-vf/IBMPlexSansVar-Roman.ttf"))
+    ttFont = TEST_FONT("ibmplexsans-vf/IBMPlexSansVar-Roman.ttf")
     assert_PASS(check(ttFont))
 
     del ttFont["avar"]
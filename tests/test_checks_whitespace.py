@@ -1,11 +1,9 @@
-from fontTools.ttLib import TTFont
-
 from conftest import check_id
 from fontbakery.status import FAIL
 from fontbakery.codetesting import (
     assert_PASS,
     assert_results_contain,
-    TEST_FILE,
+    TEST_FONT,
 )
 
 
@@ -13,7 +11,7 @@ from fontbakery.codetesting import (
 def test_check_whitespace_widths(check):
     """Whitespace glyphs have coherent widths?"""
 
-    ttFont = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    ttFont = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(ttFont))
 
     ttFont["hmtx"].metrics["space"] = (0, 1)
@@ -24,7 +22,7 @@ def test_check_whitespace_widths(check):
 def test_check_whitespace_ink(check):
     """Whitespace glyphs have ink?"""
 
-    test_font = TTFont(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    test_font = TEST_FONT("nunito/Nunito-Regular.ttf")
     assert_PASS(check(test_font))
 
     test_font["cmap"].tables[0].cmap[0x1680] = "a"
@@ -11,6 +11,8 @@ from fontbakery.codetesting import (
     PATH_TEST_DATA,
     portable_path,
     TEST_FILE,
+    TEST_FONT,
+    test_fonts,
 )
 from fontbakery.message import Message
 from fontbakery.result import Subresult
@@ -27,6 +29,19 @@ def test_TEST_FILE():
     assert TEST_FILE(file_path) == (f"{PATH_TEST_DATA}{file_path}".replace("/", os.sep))
 
 
+def test_TEST_FONT():
+    path = TEST_FILE("mada/Mada-Regular.ttf")
+    font = TEST_FONT("mada/Mada-Regular.ttf")
+    assert font.reader.file.name == path
+
+    # Each test gets a copy of its own to modify...
+    font["head"].unitsPerEm = 1
+    assert TEST_FONT("mada/Mada-Regular.ttf")["head"].unitsPerEm == 1000
+    # ...while the font shared by the checks is parsed only once.
+    assert test_fonts.get(path) is test_fonts.get(path)
+    assert test_fonts.get(path)["head"].unitsPerEm == 1000
+
+
 def test_GLYPHSAPP_TEST_FILE():
     glyphs_filename = "Comfortaa.glyphs"
     gfile = GLYPHSAPP_TEST_FILE(glyphs_filename)
@@ -0,0 +1,101 @@
+import threading
+
+import pytest
+import requests
+
+from fontbakery.http_client import MAX_CACHED_SIZE, HTTPClient
+
+URL = "https://example.com/data.json"
+
+
+def test_requests_are_made_once_per_run(requests_mock):
+    requests_mock.get(URL, json={"a": 1})
+    client = HTTPClient()
+    assert client.get(URL).json() == {"a": 1}
+    assert client.get(URL).json() == {"a": 1}
+    assert requests_mock.call_count == 1
+
+    # HEAD requests are separate
+    requests_mock.head(URL)
+    assert client.head(URL).status_code == 200
+    assert requests_mock.call_count == 2
+
+    # So are failures, but each caller gets an exception of its own
+    requests_mock.get("https://example.com/broken", exc=requests.ConnectTimeout)
+    errors = []
+    for _ in range(2):
+        with pytest.raises(requests.ConnectTimeout) as err:
+            client.get("https://example.com/broken")
+        errors.append(err.value)
+    assert requests_mock.call_count == 3
+    assert errors[0] is not errors[1]
+    assert errors[0].__cause__ is errors[1].__cause__
+
+
+def test_large_responses_are_not_kept(requests_mock):
+    font_url = "https://example.com/font.ttf"
+    requests_mock.get(font_url, content=b"\0" * (MAX_CACHED_SIZE + 1))
+    requests_mock.get(
+        URL,
+        content=b"[" + b" " * MAX_CACHED_SIZE + b"]",
+        headers={"Content-Type": "application/json"},
+    )
+    client = HTTPClient()
+    client.get(font_url)
+    client.get(font_url)
+    assert requests_mock.call_count == 2
+    # JSON is kept whatever its size
+    client.get(URL)
+    client.get(URL)
+    assert requests_mock.call_count == 3
+
+
+def test_requests_in_flight_are_shared(requests_mock):
+    font_url = "https://example.com/font.ttf"
+    started, release = threading.Event(), threading.Event()
+
+    def slow_font(request, context):
+        started.set()
+        release.wait(5)
+        return b"\0" * (MAX_CACHED_SIZE + 1)
+
+    requests_mock.get(font_url, content=slow_font)
+    client = HTTPClient()
+    responses = []
+    threads = [
+        threading.Thread(target=lambda: responses.append(client.get(font_url)))
+        for _ in range(3)
+    ]
+    threads[0].start()
+    started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while client._waiting.get(("GET", font_url, True), 0) < 3:
+        release.wait(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert len(responses) == 3 and len({id(r) for r in responses}) == 1
+    assert requests_mock.call_count == 1
+
+
+def test_record_and_replay(requests_mock, tmp_path):
+    requests_mock.get(
+        URL,
+        content="café".encode("utf-8"),
+        headers={"Content-Type": "text/plain; charset=utf-8"},
+    )
+    requests_mock.get("https://example.com/missing", status_code=404)
+    recorder = HTTPClient(record_dir=tmp_path)
+    recorder.get(URL)
+    recorder.get("https://example.com/missing")
+    assert requests_mock.call_count == 2
+
+    replayer = HTTPClient(replay_dir=tmp_path)
+    response = replayer.get(URL)
+    assert response.text == "café"
+    assert response.headers["content-type"] == "text/plain; charset=utf-8"
+    assert replayer.get("https://example.com/missing").status_code == 404
+    with pytest.raises(requests.ConnectionError):
+        replayer.get("https://example.com/never-recorded")
+    assert requests_mock.call_count == 2
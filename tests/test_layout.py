@@ -0,0 +1,41 @@
+import fontbakery.checks.conditions  # noqa:F401 pylint:disable=unused-import
+from fontbakery.codetesting import TEST_FILE, TEST_FONT
+from fontbakery.layout import LayoutGraph
+from fontbakery.utils import all_kerning
+from fontbakery.testable import Font
+
+
+def test_layout_graph_resolves_extensions_without_changing_font():
+    ttFont = TEST_FONT("abeezee_ext_lookup/ABeeZee-Regular_GPOS_ext_lookup.ttf")
+    all_kerning_before = all_kerning(ttFont)
+
+    graph = LayoutGraph(ttFont)
+    (lookup,) = graph.gpos.lookups
+    assert lookup.lookup.LookupType == 9  # Extension
+    assert lookup.type == 2  # Pair adjustment
+    assert lookup.features == {"kern"}
+    assert graph.feature_tags == {"kern"}
+    assert graph.script_tags == {"DFLT", "latn"}
+
+    assert ttFont["GPOS"].table.LookupList.Lookup[0].LookupType == 9
+    assert all_kerning(ttFont) == all_kerning_before
+
+
+def test_layout_graph_substitutions():
+    graph = LayoutGraph(TEST_FONT("nunito/Nunito-Regular.ttf"))
+
+    assert graph.closure(["f"]) == {"f", "fi", "fl"}
+    assert {"fi", "fl"} <= graph.substitution_outputs
+    assert "f" not in graph.substitution_outputs
+    liga = graph.gsub.feature_lookups("liga")
+    assert liga and all("liga" in lookup.features for lookup in liga)
+    assert graph.single_substitutions("tnum") == {}
+
+
+def test_layout_graph_is_released_with_its_font():
+    font = Font(TEST_FILE("nunito/Nunito-Regular.ttf"))
+    graph = font.layout_graph
+    assert graph is font.layout_graph
+    font.release()
+    assert "layout_graph" not in font.__dict__ and "ttFont" not in font.__dict__
+    assert font.layout_graph is not graph
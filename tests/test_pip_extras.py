@@ -2,10 +2,9 @@ import sys
 from unittest.mock import patch
 
 import pytest
-from fontTools.ttLib import TTFont
 
 from conftest import ImportRaiser, remove_import_raiser
-from fontbakery.codetesting import CheckTester, TEST_FILE
+from fontbakery.codetesting import CheckTester, TEST_FILE, TEST_FONT
 
 
 def test_lxml_etree_extra_needed_exit(monkeypatch):
@@ -40,7 +39,7 @@ def test_axisregistry_extra_needed_exit(monkeypatch):
     monkeypatch.delitem(sys.modules, module_name, raising=False)
 
     with pytest.raises(SystemExit):
-        ttFont = TTFont(TEST_FILE("cabinvfbeta/Cabin-VF.ttf"))
+        ttFont = TEST_FONT("cabinvfbeta/Cabin-VF.ttf")
         check(ttFont)
 
     remove_import_raiser(module_name)
@@ -0,0 +1,80 @@
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.checkrunner import CheckRunner
+from fontbakery.fonts_profile import checks_by_id, load_all_checks, setup_context
+from fontbakery.planner import Planner, TimingHistory
+from fontbakery.profile import Profile, Section
+from fontbakery.reporters import FontbakeryReporter
+from fontbakery.status import PASS
+from fontbakery.testable import FILE_TYPES
+
+MADA_FONTS = [
+    TEST_FILE("mada/Mada-Regular.ttf"),
+    TEST_FILE("mada/Mada-Bold.ttf"),
+]
+
+
+def make_runner(check_ids, config=None):
+    load_all_checks()
+    profile = Profile(
+        name="TestProfile",
+        iterargs={val.singular: val.plural for val in FILE_TYPES},
+        sections=[Section(name="Test", checks=[checks_by_id[c] for c in check_ids])],
+    )
+    return CheckRunner(profile, setup_context(MADA_FONTS), config or {})
+
+
+def test_timing_history(tmp_path):
+    path = tmp_path / "timings.json"
+    history = TimingHistory(path)
+    assert history.estimate("a") is None
+
+    history.update({"a": [1.0, 3.0]})
+    history.save()
+
+    history = TimingHistory(path)
+    assert history.estimate("a") == 2.0
+    history.update({"a": [5.0]})
+    assert history.estimate("a") == 3.0
+
+
+def test_plan_report(tmp_path):
+    history = TimingHistory(tmp_path / "timings.json")
+    history.update({"opentype/unitsperem": [0.5]})
+    runner = make_runner(
+        [
+            "opentype/unitsperem",
+            "opentype/family/equal_font_versions",
+            "fontbakery_version",
+            "ttx_roundtrip",
+            "ufolint",
+        ]
+    )
+    report = Planner(runner, history).report()
+    checks = {check["id"]: check for check in report["checks"]}
+
+    assert report["identities"] == 7
+    assert report["files"] == {"Mada-Regular.ttf": 3, "Mada-Bold.ttf": 3}
+    assert report["estimated_seconds"] == 1.0
+    assert "opentype/unitsperem" not in report["checks_without_history"]
+
+    assert checks["opentype/unitsperem"]["scope"] == "font"
+    assert checks["opentype/unitsperem"]["conditions"] == ["ttFont"]
+    assert checks["opentype/family/equal_font_versions"]["scope"] == "collection"
+    assert checks["ufolint"]["identities"] == 0
+    assert checks["ufolint"]["scope"] == "nothing to check"
+
+    assert checks["fontbakery_version"]["network"]
+    assert not checks["fontbakery_version"]["subprocess"]
+    assert checks["ttx_roundtrip"]["subprocess"]
+    assert not checks["opentype/unitsperem"]["network"]
+    assert report["conditions"]["http_client"] == {
+        "identities": 2,
+        "network": True,
+        "subprocess": False,
+    }
+
+
+def test_runner_records_timings():
+    runner = make_runner(["opentype/unitsperem"])
+    runner.run([FontbakeryReporter(runner=runner, loglevels=[PASS])])
+    assert len(runner.timings["opentype/unitsperem"]) == 2
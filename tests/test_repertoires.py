@@ -0,0 +1,31 @@
+from fontbakery.codetesting import TEST_FONT
+from fontbakery.repertoires import (
+    CodepointSet,
+    RepertoireCoverage,
+    register_repertoire,
+    repertoire,
+)
+
+
+def test_codepoint_set():
+    latin = CodepointSet(range(0x20, 0x7F))
+    digits = CodepointSet.from_ranges([(0x30, 0x39)])
+    assert len(latin) == 95
+    assert list(digits) == list(range(0x30, 0x3A))
+    assert digits < latin and not latin <= digits
+    assert list(latin - digits)[15:17] == [0x2F, 0x3A]
+    assert 0x41 in latin and 0x41 not in digits
+    assert list(digits & {0x31, 0x10FFFF}) == [0x31]
+    assert not CodepointSet() and CodepointSet() == CodepointSet([])
+
+
+def test_repertoire_coverage():
+    register_repertoire("test/digits", lambda: range(0x30, 0x3A))
+    register_repertoire("test/plane1", [0x1F600, 0x30])
+    cmap = TEST_FONT("mada/Mada-Regular.ttf").getBestCmap()
+    coverage = RepertoireCoverage(cmap)
+
+    assert coverage.present_by_name["test/digits"] == repertoire("test/digits")
+    assert not coverage.missing("test/digits")
+    assert list(coverage.missing("test/plane1")) == [0x1F600]
+    assert set(coverage.extra("test/digits")) == set(cmap) - set(range(0x30, 0x3A))
@@ -0,0 +1,175 @@
+import json
+import os
+import stat
+import threading
+
+import pytest
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.errors import FontBakeryRunnerError, ValueValidationError
+from fontbakery.server import (
+    JOB_PATH,
+    CheckService,
+    UnixHTTPConnection,
+    default_socket_path,
+    make_server,
+    server_address,
+    server_status,
+    submit_job,
+)
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    path = str(tmp_path / "fontbakery.sock")
+    server = make_server(CheckService(), socket_path=path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_runs_jobs(socket_path):
+    job = {
+        "profile": "universal",
+        "files": [TEST_FILE("mada/Mada-Regular.ttf")],
+        "config": {"explicit_checks": ["file_size", "fsselection"]},
+    }
+    for _ in range(2):  # The profile is only loaded by the first job.
+        items = list(submit_job(job, socket_path=socket_path))
+        checks = [item["check"] for item in items[:-1]]
+        assert sorted(item["check_id"] for item in items[:-1]) == [
+            "file_size",
+            "opentype/fsselection",
+        ]
+        report = items[-1]["report"]
+        assert report["result"]["PASS"] == 2
+        assert [c["key"] for s in report["sections"] for c in s["checks"]] == [
+            check["key"] for check in checks
+        ]
+    assert server_status(socket_path=socket_path)["profiles"] == ["universal"]
+
+
+def test_server_rejects_bad_jobs(socket_path):
+    with pytest.raises(ValueValidationError, match="No applicable files"):
+        list(submit_job({"files": ["nothing.here"]}, socket_path=socket_path))
+    with pytest.raises(ValueValidationError, match="Unknown profile"):
+        list(
+            submit_job(
+                {"profile": "no.such.profile", "files": ["x.ttf"]},
+                socket_path=socket_path,
+            )
+        )
+
+
+def test_server_reports_jobs_failing_to_start(socket_path, monkeypatch):
+    def prepare(self, job):
+        raise RuntimeError("Out of luck")
+
+    monkeypatch.setattr(CheckService, "prepare", prepare)
+    with pytest.raises(FontBakeryRunnerError, match="Out of luck") as excinfo:
+        list(submit_job({"files": ["x.ttf"]}, socket_path=socket_path))
+    assert not isinstance(excinfo.value, ValueValidationError)
+    # The server carries on with the next job.
+    assert server_status(socket_path=socket_path)["profiles"] == []
+
+
+@pytest.mark.parametrize("record_timings", [False, True])
+def test_server_records_timings_on_request(tmp_path, monkeypatch, record_timings):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    service = CheckService(record_timings=record_timings)
+    job = {
+        "files": [TEST_FILE("mada/Mada-Regular.ttf")],
+        "config": {"explicit_checks": ["file_size"]},
+    }
+    list(service.run(job))
+    assert (tmp_path / "fontbakery" / "timings.json").exists() == record_timings
+
+
+def post(socket_path, body, headers):
+    connection = UnixHTTPConnection(socket_path)
+    try:
+        connection.request("POST", JOB_PATH, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+
+def test_server_only_takes_local_json_requests(socket_path):
+    job = json.dumps(
+        {
+            "files": [TEST_FILE("mada/Mada-Regular.ttf")],
+            "config": {"explicit_checks": ["file_size"]},
+        }
+    )
+    # What a web page can send to another site without asking it first.
+    status, reply = post(socket_path, job, {"Content-Type": "text/plain"})
+    assert status == 415 and "application/json" in json.loads(reply)["error"]
+    status, _ = post(socket_path, job, {})
+    assert status == 415
+    # Pages on other hosts which resolve to the local one (DNS rebinding).
+    for host in ["evil.example", "evil.example:8732", "localhost.evil.example"]:
+        status, _ = post(
+            socket_path, job, {"Content-Type": "application/json", "Host": host}
+        )
+        assert status == 403
+    status, reply = post(
+        socket_path,
+        job,
+        {"Content-Type": "application/json; charset=utf-8", "Host": "127.0.0.1:8732"},
+    )
+    assert status == 200
+    assert "report" in json.loads(reply.splitlines()[-1])
+
+
+def test_server_only_runs_allowed_profiles(socket_path, tmp_path):
+    imported = tmp_path / "imported"
+    profile_file = tmp_path / "my_profile.py"
+    profile_file.write_text(f"open({str(imported)!r}, 'w').close()\n")
+    for profile in [str(profile_file), "fontbakery.profiles.universal"]:
+        with pytest.raises(ValueValidationError, match="--allow-profile"):
+            list(
+                submit_job(
+                    {"profile": profile, "files": ["x.ttf"]}, socket_path=socket_path
+                )
+            )
+    assert not imported.exists()
+
+    service = CheckService(profiles=["fontbakery.profiles.universal"])
+    assert service.profile("fontbakery.profiles.universal") is not None
+
+
+def test_server_only_takes_job_config_keys(socket_path, tmp_path):
+    tmp_path = tmp_path / "elsewhere"
+    tmp_path.mkdir()
+    job = {
+        "files": [TEST_FILE("mada/Mada-Regular.ttf")],
+        "config": {
+            "explicit_checks": ["hinting_impact"],
+            "hinting_impact": {"PRECISE": True},
+        },
+    }
+    assert "report" in list(submit_job(job, socket_path=socket_path))[-1]
+    for key in ["artifacts_dir", "http_record", "http_replay"]:
+        job["config"][key] = str(tmp_path)
+        with pytest.raises(ValueValidationError, match=key):
+            list(submit_job(job, socket_path=socket_path))
+        del job["config"][key]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(default_socket_path() is None, reason="No Unix sockets")
+def test_server_listens_on_a_private_socket_by_default(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert server_address() == (None, default_socket_path())
+    assert os.path.dirname(default_socket_path()) == str(tmp_path)
+    assert server_address(port=8732) == (8732, None)
+
+    server = make_server(CheckService())
+    try:
+        mode = os.stat(default_socket_path()).st_mode
+        assert stat.S_IMODE(mode) == 0o600
+    finally:
+        server.server_close()
@@ -0,0 +1,44 @@
+from io import BytesIO
+
+from fontTools.ttLib import TTFont
+
+from fontbakery.codetesting import TEST_FONT
+from fontbakery.sizes import glyf_instruction_sizes, hinting_sizes, table_sizes
+
+
+def test_table_sizes():
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
+    sizes = table_sizes(ttFont)
+    assert set(sizes) == set(ttFont.keys()) - {"GlyphOrder"}
+    assert sizes["head"] == 54
+
+
+def test_glyf_instruction_sizes():
+    ttFont = TEST_FONT("merriweather/Merriweather-Regular.ttf")
+    sizes = glyf_instruction_sizes(ttFont)
+    glyf = ttFont["glyf"]
+    for glyph_name in ttFont.getGlyphOrder():
+        glyph = glyf[glyph_name]
+        length = len(glyph.program.getBytecode()) if hasattr(glyph, "program") else 0
+        if glyph.isComposite() and length:
+            length += 2  # The length field goes away along with the flag
+        assert sizes.get(glyph_name, 0) == length
+
+
+def test_cff_hinting_sizes():
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
+    estimate = sum(hinting_sizes(ttFont).values())
+
+    ttFont = TEST_FONT("source-sans-pro/OTF/SourceSansPro-Regular.otf")
+    hinted_size = table_sizes(ttFont)["CFF "]
+    ttFont["CFF "].cff.remove_hints()
+    dehinted = BytesIO()
+    ttFont.save(dehinted)
+    saved = hinted_size - table_sizes(TTFont(dehinted))["CFF "]
+
+    # Renumbered subroutines and smaller INDEX offsets also save a few bytes.
+    assert 0.75 * saved < estimate <= saved
+
+    # Unhinted fonts have (next to) nothing to save
+    ttFont = TEST_FONT("mada/Mada-Regular.ttf")
+    assert sum(hinting_sizes(ttFont).values()) < 100
@@ -0,0 +1,159 @@
+import os
+import shutil
+import subprocess
+from unittest import mock
+
+import defcon
+from fontTools.ufoLib import UFOReader
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.fonts_profile import load_all_checks, setup_context
+from fontbakery.sources import (
+    SourcePool,
+    UFOSource,
+    glif_unicodes,
+    glyph_facts,
+    lint_ufos,
+)
+
+
+def test_glif_unicodes():
+    glif = b"""<?xml version="1.0" encoding="UTF-8"?>
+<glyph name="A" format="2">
+  <!-- <unicode hex="0042"/> -->
+  <advance width="500"/>
+  <unicode hex="0041"/>
+  <unicode hex='00C0' />
+  <note>&lt;unicode hex="0043"/&gt;</note>
+  <lib><dict><key>x</key><string>&lt;unicode hex="0044"/&gt;</string></dict></lib>
+</glyph>
+"""
+    assert glif_unicodes(glif) == [0x41, 0xC0]
+
+
+def test_ufo_source_metadata(tmp_path):
+    ufo = defcon.Font()
+    ufo.newGlyph("a").unicodes = [0x61, 0x41]
+    ufo.newGlyph("b")
+    ufo.groups["public.kern1.a"] = ["a"]
+    ufo.kerning[("public.kern1.a", "b")] = -10
+    path = str(tmp_path / "Test.ufo")
+    ufo.save(path)
+
+    source = SourcePool()[path]
+    assert source.glyph_names == ["a", "b"]
+    assert source.unicodes == UFOReader(path).getGlyphSet().getUnicodes()
+    assert source.groups == {"public.kern1.a": ["a"]}
+    assert source.kerning == {"public.kern1.a": {"b": -10}}
+    # Nothing needed the full font so far.
+    assert "font" not in source.__dict__
+    assert source.font["a"].unicodes == [0x61, 0x41]
+
+
+def test_sources_are_shared_by_ufos_and_designspaces():
+    load_all_checks()
+    designspace = TEST_FILE("stupidfont/Stupid Font.designspace")
+    regular = TEST_FILE("stupidfont/Stupid Font Regular.ufo")
+    context = setup_context([designspace, regular])
+    for testable in context.testables:
+        testable.context = context
+    (designspace,) = context.designspaces
+    (ufo,) = context.ufos
+
+    assert ufo.ufo_source in designspace.designspace_ufos.values()
+    sources = {source.filename: source for source in designspace.designSpace.sources}
+    assert sources["Stupid Font Regular.ufo"].font is ufo.ufo_font
+    # Each master is only loaded once, however many conditions use it.
+    assert all(
+        a is b
+        for a, b in zip(
+            designspace.designspace_sources,
+            [source.font for source in designspace.designSpace.sources],
+        )
+    )
+
+
+def test_glyph_facts_are_cached_by_glif_hash(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    ufo = defcon.Font()
+    pen = ufo.newGlyph("a").getPen()
+    pen.moveTo((0, 0))
+    pen.curveTo((10, 10), (20, 10), (30, 0))
+    pen.closePath()
+    ufo.newGlyph("b").appendComponent(defcon.Component())
+    ufo["b"].components[0].baseGlyph = "a"
+    path = str(tmp_path / "Test.ufo")
+    ufo.save(path)
+
+    (layer,) = UFOSource(path).glyph_facts
+    assert layer.is_default
+    assert layer.glyphs == {
+        glyph.name: facts for glyph, facts in zip(ufo, map(glyph_facts, ufo))
+    }
+    assert layer.glyphs["a"].segment_types == {"line", "curve"}
+    assert layer.glyphs["b"].components == ("a",)
+
+    parsed = []
+    monkeypatch.setattr(
+        "fontbakery.sources.glif_facts", lambda glif: parsed.append(glif) or None
+    )
+    UFOSource(path).glyph_facts
+    assert parsed == []  # Nothing changed, everything came from the cache.
+
+    ufo["a"].unicode = 0x61
+    ufo.save(path)
+    UFOSource(path).glyph_facts
+    assert len(parsed) == 1
+
+
+def test_ufolint_runs_once_per_ufo_contents(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    paths = []
+    for name in ["A", "B"]:
+        ufo = defcon.Font()
+        ufo.newGlyph(name)
+        paths.append(str(tmp_path / f"{name}.ufo"))
+        ufo.save(paths[-1])
+
+    calls = []
+    run = subprocess.run
+
+    def recording_run(command, **kwargs):
+        calls.append(command[-1])
+        return run(command, **kwargs)
+
+    monkeypatch.setattr("fontbakery.sources.subprocess.run", recording_run)
+    assert lint_ufos(paths) == {path: (True, mock.ANY) for path in paths}
+    assert sorted(calls) == paths
+
+    calls.clear()
+    os.remove(os.path.join(paths[0], "metainfo.plist"))
+    outcomes = lint_ufos(paths)
+    assert calls == [paths[0]]
+    assert outcomes[paths[0]][0] is False
+    assert outcomes[paths[1]][0] is True
+
+    # The same files at another path reuse the outcome, but name that path.
+    moved = str(tmp_path / "moved" / "A.ufo")
+    shutil.copytree(paths[0], moved)
+    calls.clear()
+    assert lint_ufos([moved]) == {
+        moved: (False, outcomes[paths[0]][1].replace(paths[0], moved))
+    }
+    assert calls == []
+    assert paths[0] in outcomes[paths[0]][1]
+
+
+def test_ufolint_timeout(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    path = str(tmp_path / "A.ufo")
+    defcon.Font().save(path)
+
+    def hanging_run(command, timeout=None, **kwargs):
+        raise subprocess.TimeoutExpired(command, timeout)
+
+    monkeypatch.setattr("fontbakery.sources.subprocess.run", hanging_run)
+    passed, output = lint_ufos([path])[path]
+    assert not passed and "did not finish" in output
+    # Timeouts are not cached.
+    assert not os.path.exists(tmp_path / "cache" / "fontbakery" / "ufolint")
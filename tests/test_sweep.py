@@ -0,0 +1,33 @@
+import itertools
+
+
+from fontbakery.codetesting import TEST_FONT
+from fontbakery.sweep import ShapingSweep
+
+
+def test_sweep_shapes_equivalent_strings_once():
+    ttFont = TEST_FONT("source-sans-pro/TTF/SourceSansPro-Regular.ttf")
+    cmap = ttFont.getBestCmap()
+    marks = [chr(c) for c in range(0x0300, 0x0370) if c in cmap]
+    texts = ["".join(chars) for chars in itertools.product("ijx", marks, marks)]
+
+    def unchanged(sweep, text, buf):
+        output = sweep.vharfbuzz.serialize_buf(buf, glyphsonly=True)
+        return output == "|".join(cmap[ord(char)] for char in text)
+
+    sweep = ShapingSweep(ttFont)
+    outcomes = dict(
+        sweep.outcomes(texts, lambda text, buf: unchanged(sweep, text, buf))
+    )
+    assert sweep.shaped < len(texts) / 2
+
+    # Shaping every string on its own gives the same outcomes.
+    direct = ShapingSweep(ttFont, by_glyph=True)
+    for text in texts:
+        assert outcomes[text] == unchanged(direct, text, direct.vharfbuzz.shape(text))
+
+    # Marks mapped to glyphs the font doesn't treat in any special way are
+    # interchangeable; the ones it substitutes or composes are not.
+    assert sweep.char_key("\u0318") == sweep.char_key("\u0319")
+    assert sweep.char_key("i") == ("char", "i")
+    assert sweep.char_key("\u0301") == ("char", "\u0301")
@@ -0,0 +1,62 @@
+from fontTools.ttLib import TTFont
+
+from fontbakery.codetesting import TEST_FILE
+from fontbakery.fonts_profile import setup_context
+from fontbakery.testable import TTCFont
+
+
+def test_collection_faces_share_tables():
+    ttc_file = TEST_FILE("ttc/NotoSerifToto.ttc")
+    context = setup_context([ttc_file])
+    faces = context.fonts
+    assert [face.index for face in faces] == [0, 1]
+    assert all(isinstance(face, TTCFont) for face in faces)
+    assert faces[0].collection is faces[1].collection
+
+    first, second = faces[0].ttFont, faces[1].ttFont
+    assert first["cmap"] is second["cmap"]
+    # The faces read from the same copy of the file, but load their tables
+    # like standalone fonts (see FontCollection._load).
+    assert first.reader.file is second.reader.file
+    assert first.lazy is None and second.lazy is None
+    lookup_list = vars(first["GPOS"].table)["LookupList"]
+    assert "reader" not in vars(lookup_list)  # Decompiled, not left for later
+    for index, face in enumerate(faces):
+        standalone = TTFont(ttc_file, fontNumber=index)
+        assert face.ttFont.getGlyphOrder() == standalone.getGlyphOrder()
+        assert face.ttFont["name"].getDebugName(4) == standalone["name"].getDebugName(4)
+
+    # The faces stay loaded until all of them are released.
+    faces[0].release()
+    assert faces[1].ttFont is second
+    faces[1].release()
+    reloaded = faces[0].ttFont
+    assert reloaded is not first
+
+    # Once all faces were released, a reloaded collection is let go of
+    # as soon as one of its faces is released again.
+    faces[0].release()
+    assert faces[0].collection._fonts is None
+    assert faces[0].ttFont is not reloaded
+
+
+def test_font_pool_drops_fonts_once_their_holders_are_released():
+    tested = TEST_FILE("cabin/Cabin-Regular.ttf")
+    sibling = TEST_FILE("cabin/Cabin-Bold.ttf")
+    context = setup_context([tested, TEST_FILE("cabin/Cabin-Italic.ttf")])
+    first, second = context.fonts
+    first.context = second.context = context  # As the check runner does
+    pool = context.font_pool
+
+    shared = pool.get(sibling, first)
+    assert pool.get(sibling, second) is shared
+    first.release()
+    assert pool.get(sibling, second) is shared
+    second.release()
+    assert pool.get(sibling, first) is not shared
+
+    # Fonts which are being tested are served from their testable.
+    loaded = first.ttFont
+    assert pool.get(tested, second) is loaded
+    first.release()
+    assert pool.get(tested, second) is not loaded
@@ -22,7 +22,7 @@ from fontbakery.utils import (
     all_kerning,
     iterate_lookup_list_with_extensions,
 )
-from fontbakery.codetesting import TEST_FILE
+from fontbakery.codetesting import TEST_FILE, TEST_FONT
 
 
 def test_exit_with_install_instructions():
@@ -337,9 +337,7 @@ def test_iterate_lookup_list_with_extensions_doesnt_change_font():
     This bug only occurs on fonts with an Extension lookup in GPOS, hence the
     new test file.
     """
-    from fontTools.ttLib import TTFont
-
-    ttFont = TTFont(TEST_FILE("abeezee_ext_lookup/ABeeZee-Regular_GPOS_ext_lookup.ttf"))
+    ttFont = TEST_FONT("abeezee_ext_lookup/ABeeZee-Regular_GPOS_ext_lookup.ttf")
 
     all_kerning_before = all_kerning(ttFont)
     iterate_lookup_list_with_extensions(ttFont, "GPOS", lambda _: ...)
@@ -359,3 +357,77 @@ def test_iterate_lookup_list_with_extensions_doesnt_change_font():
     all_kerning_after = all_kerning(ttFont)
 
     assert all_kerning_before == all_kerning_after
+
+
+def test_load_snapshot(tmp_path, monkeypatch):
+    from fontbakery.utils import load_snapshot
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"a": 1}
+
+    assert load_snapshot("test", "v1", build) == {"a": 1}
+    assert load_snapshot("test", "v1", build) == {"a": 1}
+    assert len(calls) == 1
+    assert len(list((tmp_path / "fontbakery").iterdir())) == 1
+
+    # A new key means a new snapshot
+    assert load_snapshot("test", "v2", build) == {"a": 1}
+    assert len(calls) == 2
+
+    # Data is converted to and from its picklable form
+    value = load_snapshot("test", "v3", lambda: {1, 2}, encode=sorted, decode=frozenset)
+    assert value == {1, 2}
+    value = load_snapshot("test", "v3", build, encode=sorted, decode=frozenset)
+    assert value == frozenset({1, 2})
+
+    # Data which can't be pickled is simply built every time
+    assert load_snapshot("test", "v4", lambda: lambda: 42)() == 42
+    assert load_snapshot("test", "v4", lambda: lambda: 43)() == 43
+
+
+def test_unshapeable_texts():
+    from fontbakery.utils import can_shape, unshapeable_texts
+
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
+    runic = "ᚠᚢᚦ"
+    # "e" followed by a combining acute accent is not in the cmap
+    # as such, but HarfBuzz composes it into "é".
+    decomposed = "é"
+    texts = ["Hello", runic, decomposed, "Hello", runic + "!"]
+
+    assert unshapeable_texts(ttFont, texts) == [runic, runic + "!"]
+    assert unshapeable_texts(ttFont, []) == []
+    assert can_shape(ttFont, "Hello")
+    assert can_shape(ttFont, decomposed)
+    assert not can_shape(ttFont, runic)
+
+
+def test_font_shaper():
+    import fontbakery.checks.conditions  # noqa:F401 pylint:disable=unused-import
+    from fontbakery.testable import FontCollection, TTCFont
+    from fontbakery.utils import font_shaper, remove_cmap_entry, unshapeable_texts
+
+    # The faces of a collection are shaped with their own metrics.
+    ttc = TEST_FILE("ttc/NotoSerifToto.ttc")
+    collection = FontCollection(ttc)
+    for index in range(collection.num_fonts):
+        face = TTCFont(ttc, index=index, collection=collection)
+        char = chr(0x1E290)
+        glyphname = face.ttFont.getBestCmap()[ord(char)]
+        (position,) = face.shaper.shape(char).glyph_positions
+        assert position.x_advance == face.ttFont["hmtx"][glyphname][0]
+
+    # Fonts changed in memory are shaped as they are, not as they were loaded.
+    ttFont = TEST_FONT("cabin/Cabin-Regular.ttf")
+    remove_cmap_entry(ttFont, ord("H"))
+    assert unshapeable_texts(ttFont, ["Hello", "ello"]) == ["Hello"]
+    assert (
+        unshapeable_texts(
+            ttFont, ["Hello"], shaper=font_shaper(ttFont, ttFont.reader.file.name)
+        )
+        == []
+    )